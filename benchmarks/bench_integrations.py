@@ -0,0 +1,65 @@
+"""
+Benchmarks for the model field, template and DRF integrations.
+
+Run with: pytest benchmarks/bench_integrations.py
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.template import Context, Template
+
+from benchmarks.conftest import group_values
+from dbchoices.fields import DynamicChoiceField
+from dbchoices.rest_framework.fields import DynamicChoiceField as DRFDynamicChoiceField
+from dbchoices.rest_framework.fields import DynamicMultipleChoiceField as DRFDynamicMultipleChoiceField
+from tests.models import Ticket
+
+LIST_PAGE_ROWS = 1_000
+
+
+@pytest.fixture
+def rows(group_size):
+    values = group_values(group_size)
+    return [values[i % group_size] for i in range(LIST_PAGE_ROWS)]
+
+
+def test_field_flatchoices(measure, group_name):
+    field = DynamicChoiceField(group_name)
+    measure(lambda: field.flatchoices)
+
+
+def test_field_get_display_list_page(measure, group_name, rows):
+    """Call `get_FOO_display` on 1,000 rows, as a list page would."""
+    tickets = [Ticket(title="Ticket", status=value) for value in rows]
+    with patch.object(Ticket._meta.get_field("status"), "group_name", group_name):
+        measure(lambda: [ticket.get_status_display() for ticket in tickets], rounds=3)
+
+
+def test_choice_label_filter_list_page(measure, group_name, rows):
+    """Render the `choice_label` filter for 1,000 rows, as a list page would."""
+    template = Template("{% load dbchoices %}{% for value in rows %}{{ value|choice_label:group_name }}{% endfor %}")
+    context = Context({"rows": rows, "group_name": group_name})
+    measure(template.render, context, rounds=5)
+
+
+@pytest.mark.parametrize("prop", ["choices", "grouped_choices", "choice_strings_to_values"])
+def test_drf_field_properties(measure, group_name, prop):
+    field = DRFDynamicChoiceField(group_name=group_name)
+    measure(getattr, field, prop)
+
+
+def test_drf_field_list_page(measure, group_name, rows):
+    """Serialize and deserialize 1,000 rows, as a list endpoint would."""
+    field = DRFDynamicChoiceField(group_name=group_name)
+
+    def serialize_rows():
+        for value in rows:
+            field.to_internal_value(field.to_representation(value))
+
+    measure(serialize_rows, rounds=3)
+
+
+def test_drf_multiple_choice_field(measure, group_name, rows):
+    field = DRFDynamicMultipleChoiceField(group_name=group_name)
+    measure(field.to_internal_value, rows[:100], rounds=3)
@@ -0,0 +1,43 @@
+"""
+Benchmarks for the encoding of choice groups in the shared cache.
+
+Payloads are pickled and unpickled around the serializer, as cache backends do. Besides
+timings, every benchmark records the size of the pickled payload in its `extra_info`.
+
+Run with: pytest benchmarks/bench_payloads.py
+"""
+
+import pickle
+
+import pytest
+
+from benchmarks.conftest import GROUP_SIZES, group_values
+from dbchoices.payloads import CompactSerializer, PickleSerializer
+
+SERIALIZERS = {
+    "pickle": PickleSerializer(),
+    "compact": CompactSerializer(compress_threshold=None),
+    "compact-zlib": CompactSerializer(compress_threshold=0),
+    "compact-interned": CompactSerializer(compress_threshold=None, intern=True),
+}
+
+
+@pytest.fixture(params=GROUP_SIZES, ids=lambda size: f"size={size}")
+def choices(request):
+    return [(value, f"Label {i}") for i, value in enumerate(group_values(request.param))]
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS.values(), ids=SERIALIZERS.keys())
+def test_dumps(benchmark, choices, serializer):
+    def dumps():
+        return pickle.dumps(serializer.dumps(choices), pickle.HIGHEST_PROTOCOL)
+
+    benchmark.extra_info["bytes"] = len(dumps())
+    benchmark.pedantic(dumps, rounds=20, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("serializer", SERIALIZERS.values(), ids=SERIALIZERS.keys())
+def test_loads(benchmark, choices, serializer):
+    data = pickle.dumps(serializer.dumps(choices), pickle.HIGHEST_PROTOCOL)
+    benchmark.extra_info["bytes"] = len(data)
+    benchmark.pedantic(lambda: serializer.loads(pickle.loads(data)), rounds=20, warmup_rounds=1)  # noqa: S301
@@ -0,0 +1,82 @@
+"""
+Benchmarks for the queries loading choice groups, on a table of 1M choices.
+
+Every benchmark records the query plan of its query in its `extra_info`, with and without
+the composite lookup index. They run against the test settings (sqlite) by default; pass a
+settings module using PostgreSQL with `--ds` to compare plans on PostgreSQL.
+
+Run with: pytest benchmarks/bench_query_plan.py
+"""
+
+import os
+
+import pytest
+from django.db import connection
+
+from dbchoices.utils import get_choice_model
+
+DynamicChoice = get_choice_model()
+TABLE_ROWS = int(os.environ.get("DBCHOICES_BENCH_TABLE_ROWS", 1_000_000))
+GROUP_SIZE = 1_000
+GROUP_NAMES = [f"plan_{i}" for i in range(TABLE_ROWS // GROUP_SIZE)]
+
+QUERIES = {
+    "single": lambda: DynamicChoice.get_choices(GROUP_NAMES[-1]).values_list("value", "label"),
+    "many": lambda: DynamicChoice.get_many_choices(GROUP_NAMES[-10:]).values_list("group_name", "value", "label"),
+    "filtered": lambda: DynamicChoice.get_many_choices(GROUP_NAMES[-10:], is_system_default=True).values_list(
+        "group_name", "value", "label"
+    ),
+}
+
+
+def query_plan(queryset, variant: str) -> str:
+    """Return the query plan of `queryset` as reported by the database."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        # sqlite computes EXPLAIN output when the statement is prepared and caches prepared statements
+        # by SQL, so the variant is added as a comment to keep a plan from outliving a dropped index
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql} -- {variant}", params)
+        return "\n".join(" ".join(str(column) for column in row) for row in cursor.fetchall())
+
+
+@pytest.fixture(scope="module")
+def large_table(django_db_setup, django_db_blocker):
+    """Fill the choice table with `TABLE_ROWS` choices, split in groups of `GROUP_SIZE`."""
+    with django_db_blocker.unblock():
+        DynamicChoice.objects.bulk_create(
+            (
+                DynamicChoice(
+                    group_name=GROUP_NAMES[i // GROUP_SIZE],
+                    name=f"VALUE_{i}",
+                    value=f"value_{i % GROUP_SIZE}",
+                    label=f"Label {i}",
+                    ordering=i % GROUP_SIZE,
+                    is_system_default=i % 2 == 0,
+                )
+                for i in range(TABLE_ROWS)
+            ),
+            batch_size=10_000,
+        )
+        with connection.cursor() as cursor:
+            # Let the planner see the table as it would be in production
+            cursor.execute("ANALYZE")
+        yield
+        DynamicChoice.objects.filter(group_name__in=GROUP_NAMES).delete()
+
+
+@pytest.fixture(params=[True, False], ids=["indexed", "unindexed"])
+def lookup_index(request, large_table, db):
+    """Drop the composite lookup index for the `unindexed` variant, within the test transaction."""
+    if not request.param:
+        # The schema editor can't be used within a transaction on sqlite, so the index is dropped directly
+        with connection.cursor() as cursor:
+            for index in DynamicChoice._meta.indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(index.name)}")
+    return "indexed" if request.param else "unindexed"
+
+
+@pytest.mark.parametrize("query", QUERIES.values(), ids=QUERIES.keys())
+def test_lookup_query(benchmark, lookup_index, query):
+    queryset = query()
+    benchmark.extra_info["plan"] = query_plan(queryset, lookup_index)
+    benchmark(lambda: list(queryset.all()))
@@ -0,0 +1,75 @@
+"""
+Benchmarks for the `ChoiceRegistry` hot paths.
+
+Run with: pytest benchmarks/bench_registry.py
+"""
+
+import contextlib
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from benchmarks.conftest import group_values
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.validators import DynamicChoiceValidator
+
+FILTERS = {"unfiltered": {}, "filtered": {"is_system_default": True}}
+
+
+@pytest.mark.parametrize("cold", [False, True], ids=["warm", "cold"])
+@pytest.mark.parametrize("filters", FILTERS.values(), ids=FILTERS.keys())
+def test_get_choices(measure, group_name, cold, filters):
+    measure(ChoiceRegistry.get_choices, group_name, cold=cold, **filters)
+
+
+@pytest.mark.parametrize("cold", [False, True], ids=["warm", "cold"])
+def test_get_label(measure, group_name, group_size, cold):
+    last_value = group_values(group_size)[-1]
+    measure(ChoiceRegistry.get_label, group_name, last_value, cold=cold)
+
+
+def test_get_label_list_page(measure, group_name, group_size):
+    """Resolve the labels of 1,000 rows, as a list page would."""
+    values = group_values(group_size)
+    rows = [values[i % group_size] for i in range(1_000)]
+
+    def render_rows():
+        for value in rows:
+            ChoiceRegistry.get_label(group_name, value)
+
+    measure(render_rows, rounds=5)
+
+
+@pytest.mark.parametrize("cold", [False, True], ids=["warm", "cold"])
+def test_get_enum(measure, group_name, group_size, cold):
+    if cold and group_size > 10_000:
+        pytest.skip("Building enums of this size is only benchmarked warm")
+    measure(ChoiceRegistry.get_enum, group_name, cold=cold, rounds=3 if cold else 20)
+
+
+@pytest.mark.parametrize("cold", [False, True], ids=["warm", "cold"])
+def test_get_many_choices(measure, choice_groups, db, cold):
+    measure(ChoiceRegistry.get_many_choices, list(choice_groups.values()), cold=cold, rounds=5)
+
+
+@pytest.mark.parametrize("contains", [False, True], ids=["prefix", "contains"])
+def test_search_choices(measure, group_name, contains):
+    """Search a group as an autocomplete widget would, for a rare label."""
+    measure(ChoiceRegistry.search_choices, group_name, "Label 9999", contains=contains)
+
+
+def test_get_choices_page(measure, group_name, group_size):
+    """Fetch the page following the middle of a group."""
+    measure(ChoiceRegistry.get_choices_page, group_name, group_values(group_size)[group_size // 2])
+
+
+@pytest.mark.parametrize("valid", [True, False], ids=["valid", "invalid"])
+def test_validator(measure, group_name, group_size, valid):
+    validator = DynamicChoiceValidator(group_name)
+    value = group_values(group_size)[-1] if valid else "invalid"
+
+    def validate():
+        with contextlib.suppress(ValidationError):
+            validator(value)
+
+    measure(validate)
@@ -0,0 +1,51 @@
+"""
+Benchmarks for the startup cost of the package, measured in fresh interpreters.
+
+Every benchmark records the cumulative import time of the `dbchoices` modules, as reported
+by `python -X importtime`, in its `extra_info`. Importing the registry must not read the
+settings, the cache backend or the choice model, so it runs without any settings.
+
+Run with: pytest benchmarks/bench_startup.py
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS = {
+    # name: (script, settings module)
+    "import-registry": ("import dbchoices.registry", None),
+    "import-fields": ("import dbchoices.fields", None),
+    "setup": ("import django; django.setup()", "tests.settings"),
+}
+
+
+def run(script: str, settings_module: str | None) -> str:
+    env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+    if settings_module is not None:
+        env["DJANGO_SETTINGS_MODULE"] = settings_module
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", script], env=env, capture_output=True, text=True, check=True
+    )
+    return result.stderr
+
+
+def import_times(stderr: str) -> dict[str, int]:
+    """Return the cumulative import time of every `dbchoices` module, in microseconds."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, _, cumulative, name = (part.strip() for part in line.replace("|", ":").split(":", 3))
+        if name.startswith("dbchoices"):
+            times[name] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("name", SCRIPTS)
+def test_startup(benchmark, name):
+    script, settings_module = SCRIPTS[name]
+    benchmark.extra_info["import_us"] = import_times(run(script, settings_module))
+    benchmark.pedantic(run, args=(script, settings_module), rounds=5, warmup_rounds=1)
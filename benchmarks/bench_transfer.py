@@ -0,0 +1,74 @@
+"""
+Benchmarks for the streaming export and import of a large choice group.
+
+Besides timings, every benchmark records the peak memory allocated by a single run in its
+`extra_info`, which should stay bounded by the chunk size rather than grow with the group.
+
+Run with: pytest benchmarks/bench_transfer.py
+"""
+
+import os
+import tracemalloc
+from io import StringIO
+
+import pytest
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.transfer import TRANSFER_FIELDS, write_choices
+from dbchoices.utils import get_choice_model
+
+DynamicChoice = get_choice_model()
+GROUP_ROWS = int(os.environ.get("DBCHOICES_BENCH_TRANSFER_ROWS", 100_000))
+GROUP_NAME = "transfer"
+CHUNK_SIZES = (1_000, 10_000)
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def group_file(file_format: str) -> str:
+    file = StringIO()
+    rows = ((GROUP_NAME, f"VALUE_{i}", f"value_{i}", f"Label {i}", i, True, False) for i in range(GROUP_ROWS))
+    write_choices(file, TRANSFER_FIELDS, rows, file_format=file_format)
+    return file.getvalue()
+
+
+@pytest.fixture
+def transfer_group(db):
+    DynamicChoice.objects.bulk_create(
+        (
+            DynamicChoice(group_name=GROUP_NAME, name=f"VALUE_{i}", value=f"value_{i}", label=f"Label {i}", ordering=i)
+            for i in range(GROUP_ROWS)
+        ),
+        batch_size=10_000,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+def test_export(benchmark, transfer_group, file_format, chunk_size):
+    def export():
+        ChoiceRegistry.export_choices(StringIO(), [GROUP_NAME], file_format, chunk_size=chunk_size)
+
+    benchmark.extra_info["peak_bytes"] = peak_memory(export)
+    benchmark.pedantic(export, rounds=3, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+def test_import(benchmark, db, file_format, chunk_size):
+    data = group_file(file_format)
+
+    def setup():
+        DynamicChoice.objects.filter(group_name=GROUP_NAME).delete()
+        return (StringIO(data), file_format), {"chunk_size": chunk_size}
+
+    args, kwargs = setup()
+    benchmark.extra_info["peak_bytes"] = peak_memory(lambda: ChoiceRegistry.import_choices(*args, **kwargs))
+    benchmark.pedantic(ChoiceRegistry.import_choices, setup=setup, rounds=3)
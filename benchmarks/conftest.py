@@ -0,0 +1,118 @@
+"""
+Shared fixtures for the benchmark suite.
+
+Benchmarks run against the test settings (sqlite + locmem), on groups ranging from 10 to
+100k choices. Besides timings, every benchmark records the number of queries and shared
+cache calls of a single operation in its `extra_info`.
+"""
+
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+
+DynamicChoice = get_choice_model()
+GROUP_SIZES = (10, 1_000, 10_000, 100_000)
+
+
+def group_name_for(size: int) -> str:
+    return f"bench_{size}"
+
+
+def group_values(size: int) -> list[str]:
+    return [f"value_{i}" for i in range(size)]
+
+
+@pytest.fixture(scope="session")
+def choice_groups(django_db_setup, django_db_blocker):
+    """Create one choice group per benchmarked size, half of them being system defaults."""
+    with django_db_blocker.unblock():
+        for size in GROUP_SIZES:
+            DynamicChoice.objects.bulk_create(
+                (
+                    DynamicChoice(
+                        group_name=group_name_for(size),
+                        name=f"VALUE_{i}",
+                        value=value,
+                        label=f"Label {i}",
+                        ordering=i,
+                        is_system_default=i % 2 == 0,
+                    )
+                    for i, value in enumerate(group_values(size))
+                ),
+                batch_size=10_000,
+            )
+    return {size: group_name_for(size) for size in GROUP_SIZES}
+
+
+@pytest.fixture(params=GROUP_SIZES, ids=lambda size: f"size={size}")
+def group_size(request, choice_groups, db):
+    return request.param
+
+
+@pytest.fixture
+def group_name(group_size):
+    return group_name_for(group_size)
+
+
+def clear_caches():
+    """Reset every cache tier, to benchmark cold lookups."""
+    cache.clear()
+    ChoiceRegistry._local_cache.clear()
+    ChoiceRegistry._enum_cache.clear()
+
+
+class CountingCache:
+    """A proxy counting the calls made to each method of a cache backend."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._backend, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            return attr(*args, **kwargs)
+
+        return wrapper
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark `func`, recording the queries and cache calls made by a single call.
+
+    If `cold` is True, every cache tier is cleared before each round.
+    """
+
+    def _measure(func, *args, cold: bool = False, rounds: int = 20, **kwargs):
+        if cold:
+            clear_caches()
+        else:
+            func(*args, **kwargs)  # Warm every cache tier up
+
+        counting_cache = CountingCache(cache)
+        with (
+            patch("dbchoices.registry.cache", counting_cache),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            func(*args, **kwargs)
+
+        benchmark.extra_info["queries"] = len(queries.captured_queries)
+        benchmark.extra_info["cache_calls"] = dict(counting_cache.calls)
+
+        setup = (lambda: (clear_caches(), (args, kwargs))[1]) if cold else None
+        if cold:
+            return benchmark.pedantic(func, setup=setup, rounds=rounds)
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds, warmup_rounds=1)
+
+    return _measure
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from dbchoices.fields import get_dynamic_choice_fields
+from dbchoices.registry import ChoiceRegistry
 from dbchoices.utils import get_choice_model
 
 
@@ -16,6 +18,24 @@ class DynamicChoiceAdmin(admin.ModelAdmin):
         return ("is_system_default",)
 
 
+class DynamicChoiceFieldsAdminMixin:
+    """
+    A `ModelAdmin` mixin that prefetches the choice groups of every dynamic choice field
+    on the model before rendering the changelist and change form.
+    """
+
+    def prefetch_choices(self):
+        ChoiceRegistry.prefetch_fields(get_dynamic_choice_fields(self.model))
+
+    def changelist_view(self, request, extra_context=None):
+        self.prefetch_choices()
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def changeform_view(self, request, object_id=None, form_url="", extra_context=None):
+        self.prefetch_choices()
+        return super().changeform_view(request, object_id=object_id, form_url=form_url, extra_context=extra_context)
+
+
 # Auto-register DynamicChoice model if using the default implementation
 DynamicChoice = get_choice_model()
 if DynamicChoice._meta.app_label == "dbchoices":
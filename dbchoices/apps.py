@@ -1,14 +1,22 @@
+import logging
+
 from django.apps import AppConfig
-from django.conf import settings
+from django.core.signals import request_started
 from django.db.models.signals import post_delete, post_save
 
+logger = logging.getLogger(__name__)
+
 
 class DbchoicesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "dbchoices"
 
     def ready(self):
-        if getattr(settings, "DBCHOICES_AUTO_INVALIDATE_CACHE", True):
+        # Register the label transform and lookups of `DynamicChoiceField`
+        from dbchoices import lookups  # noqa: F401
+        from dbchoices.conf import choice_settings
+
+        if choice_settings.AUTO_INVALIDATE_CACHE:
             # Register signal handlers to invalidate choice cache on model changes
             from dbchoices.signals import invalidate_choice_cache
             from dbchoices.utils import get_choice_model
@@ -16,3 +24,18 @@ class DbchoicesConfig(AppConfig):
             ChoiceModel = get_choice_model()
             post_save.connect(invalidate_choice_cache, sender=ChoiceModel, dispatch_uid="dbchoices_invalidate_save")
             post_delete.connect(invalidate_choice_cache, sender=ChoiceModel, dispatch_uid="dbchoices_invalidate_delete")
+
+        if choice_settings.WARM_CACHE_ON_STARTUP:
+            # Django discourages queries in ready(), so warm the cache before the first request instead
+            from dbchoices.signals import warm_choice_cache
+
+            request_started.connect(warm_choice_cache, dispatch_uid="dbchoices_warm_cache")
+
+        if choice_settings.SNAPSHOT_PATH:
+            # Reading the snapshot file needs neither the database nor the cache
+            from dbchoices.registry import ChoiceRegistry
+
+            try:
+                ChoiceRegistry.load_snapshot()
+            except (OSError, ValueError):
+                logger.warning("Could not load the choice snapshot file.", exc_info=True)
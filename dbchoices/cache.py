@@ -0,0 +1,114 @@
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+DEFAULT_TIMEOUT = object()
+
+
+class CacheEntry(NamedTuple):
+    """A choice group payload as stored in the shared cache."""
+
+    generation: int
+    """The generation of the group the choices were loaded at."""
+    payload: Any
+    """The ordered (value, label) pairs of the group, as encoded by the payload serializer."""
+    expires_at: float
+    """The wall-clock time at which the entry expires from the cache."""
+    delta: float
+    """The number of seconds it took to load the choices from the database."""
+
+    def should_refresh(self, beta: float = 1.0) -> bool:
+        """Probabilistically decide whether to recompute the entry ahead of its expiry.
+
+        This implements the "XFetch" algorithm: the closer the entry is to expiring, and
+        the more expensive it was to compute, the more likely an early refresh becomes.
+        This spreads recomputation over time instead of having every process miss at once.
+        """
+        if beta <= 0:
+            return False
+        # 1 - random() lies in (0, 1], which keeps the logarithm finite
+        gap = -self.delta * beta * math.log(1.0 - random.random())  # noqa: S311
+        return time.time() + gap >= self.expires_at
+
+
+def jitter_timeout(timeout: float | None, jitter: float) -> float | None:
+    """Shorten a cache timeout by a random fraction of up to `jitter`, so that keys
+    written at the same time do not all expire at once."""
+    if timeout is None or jitter <= 0:
+        return timeout
+    return timeout * (1 - jitter * random.random())  # noqa: S311
+
+
+class LocalCache:
+    """A bounded, thread-safe, process-local LRU cache with per-entry expiry.
+
+    This is used as an in-process tier in front of the shared Django cache, so
+    repeated lookups can be answered without a network round-trip.
+
+    Args:
+        max_size (int):
+            The maximum number of entries to keep. The least recently used entry is
+            evicted once this limit is reached. A value of 0 disables the cache.
+        timeout (float | None):
+            The number of seconds an entry stays valid. If None, entries only expire
+            through eviction or explicit deletion.
+    """
+
+    def __init__(self, max_size: int, timeout: float | None = None):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value stored for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Any = DEFAULT_TIMEOUT) -> None:
+        """Store `value` under `key`, evicting the least recently used entries if needed.
+
+        If `timeout` is not provided, the cache-wide timeout is used.
+        """
+        if not self.enabled:
+            return
+
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        expires_at = time.monotonic() + timeout if timeout is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,154 @@
+import threading
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from dbchoices.utils import get_choice_model
+
+try:
+    from django.core.signals import setting_changed
+except ImportError:  # Django < 4.2
+    from django.test.signals import setting_changed
+
+DEFAULTS: dict[str, Any] = {
+    "CACHE_ALIAS": "default",
+    "CACHE_TIMEOUT": 1 * 60 * 60,  # 1 hour
+    "LOCAL_CACHE_SIZE": 1024,
+    "LOCAL_CACHE_TIMEOUT": 0,  # Always revalidate
+    "CACHE_TIMEOUT_JITTER": 0.1,  # Up to 10% shorter
+    "CACHE_LOCK_TIMEOUT": 10,
+    "CACHE_LOCK_WAIT": 2,
+    "EARLY_REFRESH_BETA": 1.0,
+    "ENUM_CACHE_SIZE": 256,
+    "SNAPSHOT_PATH": None,
+    "TRANSFER_CHUNK_SIZE": 1000,
+    "PAYLOAD_SERIALIZER": "dbchoices.payloads.CompactSerializer",
+    "METRICS_HOOK": None,
+    "METRICS_FLUSH_INTERVAL": 60,  # 1 minute
+    "AUTOCOMPLETE_GROUPS": None,
+    "AUTOCOMPLETE_PERMISSION": None,
+    "AUTO_INVALIDATE_CACHE": True,  # Read once, when the app is ready
+    "INVALIDATE_ON_COMMIT": False,
+    "WARM_CACHE_ON_STARTUP": False,  # Read once, when the app is ready
+}
+"""The defaults of the `DBCHOICES_*` settings read by the registry, without their prefix."""
+
+
+class ChoiceSettings:
+    """The `DBCHOICES_*` settings of the registry, read from the Django settings on first access.
+
+    Values are cached until a setting changes, e.g. with `override_settings`, so reading
+    them on hot paths is an attribute lookup. `PAYLOAD_SERIALIZER` is returned as an
+    instance, and a dotted path given as `METRICS_HOOK` as the callable it points to.
+
+    Usage:
+        choice_settings.CACHE_TIMEOUT  # The value of `DBCHOICES_CACHE_TIMEOUT`, or its default
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in DEFAULTS:
+            raise AttributeError(f"Invalid dbchoices setting: '{name}'")
+
+        value = getattr(settings, f"DBCHOICES_{name}", DEFAULTS[name])
+        if name == "PAYLOAD_SERIALIZER":
+            value = import_string(value)()
+        elif name == "METRICS_HOOK" and isinstance(value, str):
+            value = import_string(value)
+
+        # Cached on the instance, so later reads no longer go through `__getattr__`
+        setattr(self, name, value)
+        return value
+
+    def reload(self) -> None:
+        self.__dict__.clear()
+
+
+choice_settings = ChoiceSettings()
+
+
+@cache
+def _resolve_choice_model() -> type:
+    return get_choice_model()
+
+
+class SharedCacheProxy:
+    """A proxy to the cache backend of `DBCHOICES_CACHE_ALIAS`, resolved on every access.
+
+    Like `django.core.cache.cache`, this does not touch the settings or the cache backend
+    until it is used, and always returns the backend of the current thread.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(caches[choice_settings.CACHE_ALIAS], name)
+
+    def __repr__(self):
+        return f"<SharedCacheProxy: {choice_settings.CACHE_ALIAS}>"
+
+
+class ChoiceModelProxy:
+    """A proxy to the choice model of `DBCHOICE_MODEL`, resolved on first use.
+
+    Resolving the model when the registry is imported would require the app registry to be
+    populated, so importing `DynamicChoiceField` in a models module could fail depending on
+    the order of `INSTALLED_APPS`.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_resolve_choice_model(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return _resolve_choice_model()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<ChoiceModelProxy: {_resolve_choice_model().__name__}>"
+
+
+class lazy_class_attribute:
+    """A class attribute built by `factory` on first access, e.g. once the settings can be read.
+
+    The built value then replaces the descriptor on the class, so it can be patched and
+    cleared like a plain class attribute. It is built again on the next access after any of
+    the `DBCHOICES_*` settings named in `settings` changes.
+    """
+
+    instances: list["lazy_class_attribute"] = []
+
+    def __init__(self, factory: Callable[[], Any], settings: tuple[str, ...] = ()):
+        self.factory = factory
+        self.settings = settings
+        self._lock = threading.Lock()
+        self.instances.append(self)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        with self._lock:
+            value = self.owner.__dict__[self.name]
+            if value is self:
+                value = self.factory()
+                setattr(self.owner, self.name, value)
+        return value
+
+    def reset(self) -> None:
+        """Discard the built value, if any, so the next access builds it again."""
+        with self._lock:
+            setattr(self.owner, self.name, self)
+
+
+def _reload_settings(*, setting: str, **kwargs) -> None:
+    if setting.startswith("DBCHOICES_"):
+        choice_settings.reload()
+        name = setting.removeprefix("DBCHOICES_")
+        for attribute in lazy_class_attribute.instances:
+            if name in attribute.settings:
+                attribute.reset()
+    elif setting == "DBCHOICE_MODEL":
+        _resolve_choice_model.cache_clear()
+
+
+setting_changed.connect(_reload_settings, dispatch_uid="dbchoices_reload_settings")
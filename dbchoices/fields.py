@@ -10,12 +10,24 @@ from dbchoices.validators import DynamicChoiceValidator
 BLANK_CHOICE_DASH = (("", "---------"),)
 
 
+def _get_choice_display(instance: models.Model, field: "DynamicChoiceField") -> Any:
+    # Unlike `Model._get_FIELD_display`, look the value up in the cached group rather than
+    # building a dict of every choice on each call
+    value = getattr(instance, field.attname)
+    return ChoiceRegistry.get_label(field.group_name, value, default=value, **field.group_filters)
+
+
 class DynamicChoiceField(models.CharField):
-    """Extended `CharField` that integrates with ChoiceRegistry for dynamic choices."""
+    """Extended `CharField` that integrates with ChoiceRegistry for dynamic choices.
+
+    Pass `autocomplete=True` for large groups, so forms and the admin search choices as the
+    user types instead of rendering all of them, see `DynamicAutocompleteField`.
+    """
 
     def __init__(self, group_name: str, group_filters: dict | None = None, *args, **kwargs):
         self.group_name = group_name
         self.group_filters = group_filters or {}
+        self.autocomplete = kwargs.pop("autocomplete", False)
         # Remove choices to ensure dynamic choices are used
         kwargs.pop("choices", None)
         super().__init__(*args, **kwargs)
@@ -35,9 +47,19 @@ class DynamicChoiceField(models.CharField):
         # Extend get_%s_display method to the model with dynamic choices
         method_name = f"get_{self.name}_display"
         if method_name not in cls.__dict__:
-            setattr(cls, method_name, partialmethod(cls._get_FIELD_display, field=self))
+            setattr(cls, method_name, partialmethod(_get_choice_display, field=self))
 
     def formfield(self, **kwargs: Any) -> Any:
+        if self.autocomplete:
+            from dbchoices.forms import DynamicAutocompleteField
+
+            return super().formfield(
+                form_class=DynamicAutocompleteField,
+                group_name=self.group_name,
+                group_filters=self.group_filters,
+                **kwargs,
+            )
+
         self.choices = ChoiceRegistry.get_choices(self.group_name, **self.group_filters)
         return super().formfield(**kwargs)
 
@@ -50,4 +72,9 @@ class DynamicChoiceField(models.CharField):
         return name, path, args, kwargs
 
 
-__all__ = ["DynamicChoiceField"]
+def get_dynamic_choice_fields(model: type[models.Model]) -> list[DynamicChoiceField]:
+    """Return all `DynamicChoiceField` instances defined on a given model."""
+    return [field for field in model._meta.get_fields() if isinstance(field, DynamicChoiceField)]
+
+
+__all__ = ["DynamicChoiceField", "get_dynamic_choice_fields"]
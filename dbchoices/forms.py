@@ -0,0 +1,64 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from dbchoices.fields import get_dynamic_choice_fields
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.widgets import ChoiceAutocompleteWidget
+
+
+class DynamicChoiceFormMixin:
+    """
+    A `ModelForm` mixin that prefetches the choice groups of every dynamic choice field
+    on the form with a single cache round-trip, instead of one per field.
+
+    The choices of the form fields are refreshed from the prefetched groups on every
+    instantiation, rather than being frozen when the form class is created.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        choice_fields = [field for field in get_dynamic_choice_fields(self._meta.model) if field.name in self.fields]
+        ChoiceRegistry.prefetch_fields(choice_fields)
+
+        for model_field in choice_fields:
+            form_field = self.fields[model_field.name]
+            if isinstance(form_field, forms.ChoiceField):
+                include_blank = model_field.blank or not model_field.has_default()
+                form_field.choices = model_field.get_choices(include_blank=include_blank)
+
+
+class DynamicAutocompleteField(forms.CharField):
+    """A form field for a choice of a large group, searched with a `ChoiceAutocompleteWidget`.
+
+    Unlike a `ChoiceField`, it never builds the list of choices of the group: submitted values
+    are validated against the cached group directly.
+
+    Args:
+        group_name (str):
+            The name of the choice group.
+        group_filters (dict | None):
+            Query filters narrowing down the choices.
+    """
+
+    default_error_messages = {
+        "invalid_choice": _("Select a valid choice. %(value)s is not one of the available choices."),
+    }
+
+    def __init__(self, group_name: str, group_filters: dict | None = None, **kwargs):
+        self.group_name = group_name
+        self.group_filters = group_filters or {}
+        # Other widgets, e.g. the ones of the admin, cannot search choices and are replaced
+        if not isinstance(kwargs.get("widget"), ChoiceAutocompleteWidget):
+            kwargs["widget"] = ChoiceAutocompleteWidget(group_name, group_filters=self.group_filters)
+        super().__init__(**kwargs)
+
+    def validate(self, value):
+        super().validate(value)
+        if value not in self.empty_values and value not in ChoiceRegistry.get_group(
+            self.group_name, **self.group_filters
+        ):
+            raise ValidationError(self.error_messages["invalid_choice"], code="invalid_choice", params={"value": value})
+
+
+__all__ = ["DynamicAutocompleteField", "DynamicChoiceFormMixin"]
@@ -0,0 +1,207 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+
+class ChoicePage(NamedTuple):
+    """A page of choices, along with the cursor of the next page if there is one."""
+
+    choices: list[tuple[str, str]]
+    next_cursor: str | None
+
+
+def _positions(group: "ChoiceGroup") -> dict[str, int]:
+    positions: dict[str, int] = {}
+    for position, (value, _) in enumerate(group.choices):
+        positions.setdefault(str(value), position)
+    return positions
+
+
+def _folded_labels(group: "ChoiceGroup") -> list[str]:
+    return [str(label).casefold() for _, label in group.choices]
+
+
+def _search_index(group: "ChoiceGroup") -> list[tuple[str, int]]:
+    # Labels sorted case-insensitively, so prefix matches are a contiguous range found by bisection
+    return sorted((str(label).casefold(), position) for position, (_, label) in enumerate(group.choices))
+
+
+class ChoiceGroup:
+    """A compiled, read-only view of the choices of a group.
+
+    Alongside the ordered (value, label) pairs, this precomputes the maps used by
+    lookups and validation, so they are hash hits instead of list scans. Instances are
+    cached by the registry and shared by every caller, so their choices and maps are
+    immutable. They are rebuilt only when the group changes.
+
+    Args:
+        choices (Iterable[tuple[str, str]]):
+            The ordered (value, label) pairs of the group.
+        generation (int | None):
+            The generation of the group these choices were loaded at.
+    """
+
+    __slots__ = ("_derived", "choices", "generation", "labels", "values", "values_by_label")
+
+    def __init__(self, choices: Iterable[tuple[str, str]], generation: int | None = None):
+        self.choices: tuple[tuple[str, str], ...] = tuple(choices)
+        self.generation = generation
+        labels: dict[str, str] = {}
+        values_by_label: dict[str, str] = {}
+        for value, label in self.choices:
+            labels.setdefault(str(value), label)
+            values_by_label.setdefault(str(label), value)
+        self.labels: Mapping[str, str] = MappingProxyType(labels)
+        self.values_by_label: Mapping[str, str] = MappingProxyType(values_by_label)
+        self.values: frozenset[str] = frozenset(labels)
+        self._derived: dict[str, Any] = {}
+
+    def get_label(self, value: str, default=None):
+        return self.labels.get(str(value), default)
+
+    def get_value(self, label: str, default=None):
+        return self.values_by_label.get(str(label), default)
+
+    def derive(self, key: str, factory: Callable[["ChoiceGroup"], Any]) -> Any:
+        """Return the structure built by `factory` from this group, building it only once per `key`.
+
+        Integrations use this to memoize their own lookup maps alongside the group, so the
+        maps are shared by every caller and only rebuilt when the group itself changes.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            return self._derived.setdefault(key, factory(self))
+
+    def page(self, after: str | None = None, limit: int = 50) -> ChoicePage:
+        """Return up to `limit` choices following the choice with the value `after`, in order.
+
+        Cursors are choice values, so pages stay consistent when choices are added or removed
+        elsewhere in the group. A ValueError is raised for a cursor that is not in the group.
+        """
+        start = self._position(after) + 1 if after is not None else 0
+        return self._page(self.choices[start : start + limit + 1], limit)
+
+    def search(self, query: str, after: str | None = None, limit: int = 20, contains: bool = False) -> ChoicePage:
+        """Return up to `limit` choices whose label starts with, or contains, `query`.
+
+        Matches are case-insensitive. Prefix matches are found by bisecting an index of the
+        sorted labels, built once per group, and are returned alphabetically. Substring
+        matches scan the group and are returned in order. Cursors work as in `page`.
+        """
+        query = query.casefold()
+        if not query:
+            return self.page(after, limit)
+
+        if contains:
+            start = self._position(after) + 1 if after is not None else 0
+            labels = self.derive("folded_labels", _folded_labels)
+            matches = []
+            for position in range(start, len(labels)):
+                if query in labels[position]:
+                    matches.append(self.choices[position])
+                    if len(matches) > limit:
+                        break
+            return self._page(matches, limit)
+
+        index = self.derive("search_index", _search_index)
+        if after is not None:
+            position = self._position(after)
+            start = bisect_right(index, (str(self.choices[position][1]).casefold(), position))
+        else:
+            start = bisect_left(index, (query,))
+        matches = []
+        for label, position in index[start : start + limit + 1]:
+            if not label.startswith(query):
+                break
+            matches.append(self.choices[position])
+        return self._page(matches, limit)
+
+    def _position(self, value: str) -> int:
+        try:
+            return self.derive("positions", _positions)[str(value)]
+        except KeyError:
+            raise ValueError(f"Unknown cursor '{value}'.") from None
+
+    @staticmethod
+    def _page(choices: Iterable[tuple[str, str]], limit: int) -> ChoicePage:
+        # One extra choice is fetched to tell whether there is a next page
+        choices = list(choices)
+        if len(choices) > limit:
+            choices = choices[:limit]
+            return ChoicePage(choices, str(choices[-1][0]) if choices else None)
+        return ChoicePage(choices, None)
+
+    def __contains__(self, value) -> bool:
+        return str(value) in self.values
+
+    def __iter__(self):
+        return iter(self.choices)
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def __repr__(self):
+        return f"<ChoiceGroup: {len(self.choices)} choices>"
+
+
+class ChoiceLayer:
+    """The choices of a group stored for a single partition of a partitioned choice model.
+
+    The shared layer holds the choices with no partition, and is cached once for every
+    partition. The layer of a partition only holds its overrides, which add, relabel,
+    reorder or hide choices of the shared layer, and is merged over it with `merge`.
+
+    Args:
+        rows (Iterable[tuple[str, str, str, str]]):
+            The (value, label, ordering, is_hidden) rows of the layer, as strings, in order.
+            Hidden rows have a non-empty `is_hidden`.
+        generation (int | None):
+            The generation of the layer these rows were loaded at.
+    """
+
+    __slots__ = ("_group", "generation", "rows")
+
+    def __init__(self, rows: Iterable[tuple[str, str, str, str]], generation: int | None = None):
+        self.rows: list[tuple[str, str, str, str]] = list(rows)
+        self.generation = generation
+        self._group: ChoiceGroup | None = None
+
+    @property
+    def group(self) -> ChoiceGroup:
+        """The visible choices of this layer alone, built once."""
+        if self._group is None:
+            self._group = ChoiceGroup(
+                ((value, label) for value, label, _, is_hidden in self.rows if not is_hidden),
+                generation=self.generation,
+            )
+        return self._group
+
+    def merge(self, overrides: "ChoiceLayer", generation: int | None = None) -> ChoiceGroup:
+        """Return the choices of this layer with the rows of `overrides` applied over it.
+
+        Override rows replace the rows with the same value, and hidden rows remove them.
+        Choices keep the order of this layer, unless overrides add or reorder some of them,
+        in which case they are sorted by ordering and value.
+        """
+        if not overrides.rows:
+            return ChoiceGroup(self.group.choices, generation=generation)
+
+        merged = {row[0]: row for row in self.rows}
+        reordered = False
+        for row in overrides.rows:
+            base = merged.get(row[0])
+            reordered = reordered or base is None or base[2] != row[2]
+            merged[row[0]] = row
+
+        rows = [row for row in merged.values() if not row[3]]
+        if reordered:
+            rows.sort(key=lambda row: (int(row[2]), row[0]))
+        return ChoiceGroup(((value, label) for value, label, _, _ in rows), generation=generation)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self):
+        return f"<ChoiceLayer: {len(self.rows)} rows>"
@@ -0,0 +1,140 @@
+from django.db import models
+from django.db.models.lookups import In
+
+from dbchoices.fields import DynamicChoiceField
+from dbchoices.query import AUTO, CASE_MAX_CHOICES, choice_label, visible_choices
+from dbchoices.registry import ChoiceRegistry
+
+
+@DynamicChoiceField.register_lookup
+class ChoiceLabel(models.Transform):
+    """
+    Resolve the values of a `DynamicChoiceField` to their labels, on the database side.
+
+    The transform compiles to the expression built by `choice_label`, so results can be
+    ordered or annotated by label: a `CASE` expression built from the cached choice group,
+    or a subquery on the choice table for groups larger than `CASE_MAX_CHOICES`. Values
+    that are not part of the group are returned as-is.
+
+    Usage:
+        Ticket.objects.order_by("status__label")
+        Ticket.objects.filter(status__label__icontains="progress")
+    """
+
+    lookup_name = "label"
+    output_field = models.CharField()
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        label = choice_label(self.lhs, field.group_name, field.group_filters, strategy=AUTO)
+        return compiler.compile(label.resolve_expression(compiler.query))
+
+
+class LabelLookup(models.Lookup):
+    """
+    Base class for lookups on choice labels.
+
+    Labels are matched against the cached choice group in Python, and the lookup compiles
+    to an `IN` clause on the matching values, which can use the index of the column.
+    Subclasses implement `match`.
+
+    For groups larger than `CASE_MAX_CHOICES`, the values are selected by a subquery on the
+    choice table instead, so the query does not grow with the group. Labels are then matched
+    by the database, with the lookup of the same name on the `label` column.
+    """
+
+    prepare_rhs = False
+
+    def match(self, label: str) -> bool:
+        raise NotImplementedError("Subclasses must implement `match`.")
+
+    def as_sql(self, compiler, connection):
+        if hasattr(self.rhs, "resolve_expression"):
+            raise ValueError(f"The '{self.lookup_name}' lookup on choice labels only supports literal values.")
+
+        column = self.lhs.lhs
+        field = column.output_field
+        group = ChoiceRegistry.get_group(field.group_name, **field.group_filters)
+        if len(group) > CASE_MAX_CHOICES:
+            choices = visible_choices(field.group_name, field.group_filters)
+            values = choices.filter(**{f"label__{self.lookup_name}": self.rhs}).values("value")
+            return compiler.compile(In(column, values).resolve_expression(compiler.query))
+
+        values = [value for value, label in group.labels.items() if self.match(label)]
+        # An empty `IN` raises `EmptyResultSet`, which Django resolves to no (or, negated, all) rows
+        return compiler.compile(In(column, values))
+
+
+@ChoiceLabel.register_lookup
+class LabelExact(LabelLookup):
+    lookup_name = "exact"
+
+    def match(self, label: str) -> bool:
+        return label == str(self.rhs)
+
+
+@ChoiceLabel.register_lookup
+class LabelIExact(LabelLookup):
+    lookup_name = "iexact"
+
+    def match(self, label: str) -> bool:
+        return label.casefold() == str(self.rhs).casefold()
+
+
+@ChoiceLabel.register_lookup
+class LabelContains(LabelLookup):
+    lookup_name = "contains"
+
+    def match(self, label: str) -> bool:
+        return str(self.rhs) in label
+
+
+@ChoiceLabel.register_lookup
+class LabelIContains(LabelLookup):
+    lookup_name = "icontains"
+
+    def match(self, label: str) -> bool:
+        return str(self.rhs).casefold() in label.casefold()
+
+
+@ChoiceLabel.register_lookup
+class LabelStartsWith(LabelLookup):
+    lookup_name = "startswith"
+
+    def match(self, label: str) -> bool:
+        return label.startswith(str(self.rhs))
+
+
+@ChoiceLabel.register_lookup
+class LabelIStartsWith(LabelLookup):
+    lookup_name = "istartswith"
+
+    def match(self, label: str) -> bool:
+        return label.casefold().startswith(str(self.rhs).casefold())
+
+
+@ChoiceLabel.register_lookup
+class LabelEndsWith(LabelLookup):
+    lookup_name = "endswith"
+
+    def match(self, label: str) -> bool:
+        return label.endswith(str(self.rhs))
+
+
+@ChoiceLabel.register_lookup
+class LabelIEndsWith(LabelLookup):
+    lookup_name = "iendswith"
+
+    def match(self, label: str) -> bool:
+        return label.casefold().endswith(str(self.rhs).casefold())
+
+
+@ChoiceLabel.register_lookup
+class LabelIn(LabelLookup):
+    lookup_name = "in"
+
+    def get_prep_lookup(self):
+        return {str(label) for label in self.rhs}
+
+    def match(self, label: str) -> bool:
+        return label in self.rhs
@@ -1,6 +1,12 @@
-from django.core.management.base import BaseCommand
+import json
+import sys
+from contextlib import nullcontext
 
+from django.core.management.base import BaseCommand, CommandError
+
+from dbchoices.metrics import summarize_counters
 from dbchoices.registry import ChoiceRegistry
+from dbchoices.transfer import TRANSFER_FORMATS, infer_format
 
 
 class Command(BaseCommand):
@@ -13,6 +19,11 @@ class Command(BaseCommand):
             nargs="*",
             help="Synchronize default choices from code definitions to the database.",
         )
+        action_group.add_argument(
+            "--plan",
+            nargs="*",
+            help="Print the changes a sync would apply as JSON, without writing to the database.",
+        )
         action_group.add_argument(
             "-l",
             "--list",
@@ -23,6 +34,34 @@ class Command(BaseCommand):
             "--invalidate",
             help="Specify a group name to invalidate its cache.",
         )
+        action_group.add_argument(
+            "--warm",
+            nargs="*",
+            help="Load choice groups into the cache. If no groups are given, all known groups are loaded.",
+        )
+        action_group.add_argument(
+            "--export-snapshot",
+            nargs="?",
+            const="",
+            metavar="PATH",
+            help="Write all choice groups to a snapshot file. Defaults to the DBCHOICES_SNAPSHOT_PATH setting.",
+        )
+        action_group.add_argument(
+            "--export",
+            metavar="PATH",
+            help="Stream the choices stored in the database to a NDJSON or CSV file, or to stdout with '-'.",
+        )
+        action_group.add_argument(
+            "--import",
+            dest="import_path",
+            metavar="PATH",
+            help="Stream choices from a NDJSON or CSV file, or from stdin with '-', into the database.",
+        )
+        action_group.add_argument(
+            "--stats",
+            action="store_true",
+            help="Print the cache metrics of all processes as JSON, with the heaviest groups by size and traffic.",
+        )
 
         # Sync optional arguments
         parser.add_argument(
@@ -36,6 +75,32 @@ class Command(BaseCommand):
             help="Recreate all choices, including non-defaults, from code definitions.",
         )
 
+        # Export/import optional arguments
+        parser.add_argument(
+            "--group",
+            action="append",
+            dest="groups",
+            help="Only export this group. Can be given several times.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=TRANSFER_FORMATS,
+            help="The format of the file to export or import. Defaults to CSV for .csv paths, and NDJSON otherwise.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="The number of rows read or written at a time. Defaults to DBCHOICES_TRANSFER_CHUNK_SIZE.",
+        )
+
+        # Stats optional arguments
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="The number of groups to list in each ranking of --stats.",
+        )
+
     def handle(self, *args, **options):
         if options["list"]:
             self._list_choices()
@@ -47,6 +112,22 @@ class Command(BaseCommand):
                 recreate_defaults=options["recreate_defaults"],
                 recreate_all=options["recreate_all"],
             )
+        elif options["warm"] is not None:
+            self._warm_cache(options["warm"] or None)
+        elif options["export_snapshot"] is not None:
+            self._export_snapshot(options["export_snapshot"] or None)
+        elif options["export"] is not None:
+            self._export_choices(options["export"], options["groups"], options["format"], options["chunk_size"])
+        elif options["import_path"] is not None:
+            self._import_choices(options["import_path"], options["format"], options["chunk_size"])
+        elif options["stats"]:
+            self._print_stats(options["top"])
+        elif options["plan"] is not None:
+            self._plan_defaults(
+                group_names=options["plan"] or None,
+                recreate_defaults=options["recreate_defaults"],
+                recreate_all=options["recreate_all"],
+            )
 
     def _list_choices(self):
         """List all choices currently registered in the Python code."""
@@ -64,16 +145,88 @@ class Command(BaseCommand):
         ChoiceRegistry.invalidate_cache(group_name)
         self.stdout.write(self.style.SUCCESS(f"  Invalidated cache for group '{group_name}'."))
 
+    def _warm_cache(self, group_names: list[str] | None):
+        """Load choice groups into the cache."""
+        group_names = ChoiceRegistry.warm_cache(group_names)
+        self.stdout.write(self.style.SUCCESS(f"  Warmed the cache of {len(group_names)} groups."))
+
+    def _export_snapshot(self, path: str | None):
+        """Write all choice groups to a snapshot file."""
+        try:
+            group_names = ChoiceRegistry.export_snapshot(path)
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(f"  Exported {len(group_names)} groups to the snapshot file."))
+
+    def _export_choices(
+        self, path: str, group_names: list[str] | None, file_format: str | None, chunk_size: int | None
+    ):
+        """Stream the choices stored in the database to a file."""
+        with self._open(path, "w") as file:
+            count = ChoiceRegistry.export_choices(
+                file,
+                group_names,
+                file_format=file_format or infer_format(path),
+                chunk_size=chunk_size,
+                progress=lambda count: self._progress(f"Exported {count} choices"),
+            )
+        self.stderr.write(f"  Exported {count} choices.", style_func=self.style.SUCCESS)
+
+    def _import_choices(self, path: str, file_format: str | None, chunk_size: int | None):
+        """Stream choices from a file into the database."""
+        try:
+            with self._open(path, "r") as file:
+                counts = ChoiceRegistry.import_choices(
+                    file,
+                    file_format=file_format or infer_format(path),
+                    chunk_size=chunk_size,
+                    progress=lambda count: self._progress(f"Imported {count} choices"),
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+        self.stderr.write(
+            f"  Imported {counts['created']} new and {counts['updated']} updated choices.",
+            style_func=self.style.SUCCESS,
+        )
+
+    def _open(self, path: str, mode: str):
+        if path == "-":
+            return nullcontext(sys.stdin if mode == "r" else self.stdout)
+        return open(path, mode, newline="", encoding="utf-8")
+
+    def _progress(self, message: str):
+        # Progress goes to stderr, so exports to stdout stay clean
+        self.stderr.write(f"  {message}...", style_func=self.style.NOTICE)
+
+    def _print_stats(self, top: int):
+        """Print the cache metrics of all processes as JSON."""
+        stats = summarize_counters(ChoiceRegistry.get_stats(), limit=top)
+        self.stdout.write(json.dumps(stats, indent=2))
+
     def _sync_defaults(self, group_names: list[str] | None, recreate_defaults: bool, recreate_all: bool):
         """Synchronize default choices from code definitions to the database."""
         try:
-            ChoiceRegistry.sync_defaults(group_names, recreate_defaults=recreate_defaults, recreate_all=recreate_all)
-            for group_name, group_members in ChoiceRegistry._defaults.items():
-                if group_names and group_name not in group_names:
-                    continue
+            diffs = ChoiceRegistry.sync_defaults(
+                group_names, recreate_defaults=recreate_defaults, recreate_all=recreate_all
+            )
+            for group_name, diff in diffs.items():
                 group_name_str = f"  Synchronized '{group_name}' "
+                counts = ", ".join(f"{count} {action}" for action, count in diff.counts().items())
                 self.stdout.write(group_name_str.ljust(30), ending="")
-                self.stdout.write(self.style.SUCCESS(f"... ({len(group_members)} choices)"))
+                self.stdout.write(self.style.SUCCESS(f"... ({counts})"))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f"Error syncing choices: {e}"))
             raise e
+
+    def _plan_defaults(self, group_names: list[str] | None, recreate_defaults: bool, recreate_all: bool):
+        """Print the changes a sync would apply as JSON."""
+        diffs = ChoiceRegistry.plan_defaults(
+            group_names, recreate_defaults=recreate_defaults, recreate_all=recreate_all
+        )
+        totals = {"created": 0, "updated": 0, "deleted": 0}
+        for diff in diffs.values():
+            for action, count in diff.counts().items():
+                totals[action] += count
+
+        plan = {"totals": totals, "groups": {group_name: diff.as_dict() for group_name, diff in diffs.items()}}
+        self.stdout.write(json.dumps(plan, indent=2))
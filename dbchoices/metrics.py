@@ -0,0 +1,167 @@
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "dbchoice:stats"
+STATS_TIMEOUT = 24 * 60 * 60
+"""The counters of processes that stopped flushing for this long are dropped from the shared cache."""
+
+EVENTS = (
+    "local_hit",
+    "revalidated",
+    "shared_hit",
+    "shared_miss",
+    "db_load",
+    "payload_size",
+    "stale_served",
+    "lock_wait",
+    "snapshot_fallback",
+    "enum_hit",
+    "enum_rebuild",
+    "invalidation",
+)
+"""The events recorded by the registry.
+
+- `local_hit`: A group was served by the process-local cache without any cache round-trip.
+- `revalidated`: A group was served by the process-local cache after checking its generation.
+- `shared_hit`: A group was served from the shared cache.
+- `shared_miss`: A group was missing from the shared cache, or outdated.
+- `db_load`: A group was loaded from the database. The value is the query latency in seconds.
+- `payload_size`: The number of choices of a group loaded from the database.
+- `stale_served`: An outdated group was served while another process was recomputing it.
+- `lock_wait`: A group was waited on while another process was recomputing it. The value is
+  the waiting time in seconds.
+- `snapshot_fallback`: A group was served from the snapshot file, after a cache or database error.
+- `enum_hit`: An enum was served from the enum cache.
+- `enum_rebuild`: An enum was built.
+- `invalidation`: A group was invalidated.
+"""
+
+MetricsHook = Callable[[str, str, float], Any]
+"""A callable receiving every recorded `(event, group_name, value)`."""
+
+
+class ChoiceMetrics:
+    """A thread-safe, in-process aggregation of registry events, per group.
+
+    For every group and event, the number of occurrences, the sum and the maximum of their
+    values are kept. Recording an event only updates a few numbers, so it is cheap enough to
+    leave on all the time.
+
+    Args:
+        hook (MetricsHook | None):
+            A callable receiving every recorded event, e.g. to forward it to StatsD or Prometheus.
+        flush_interval (float | None):
+            The number of seconds after which `record` reports the counters are due for a flush.
+            If None, the counters are never due.
+    """
+
+    def __init__(self, hook: MetricsHook | None = None, flush_interval: float | None = 60):
+        self.hook = hook
+        self.flush_interval = flush_interval
+        self._token = uuid.uuid4().hex[:8]  # Tells apart restarted processes reusing a pid
+        self._counters: dict[str, dict[str, list[float]]] = {}
+        self._lock = threading.Lock()
+        self._flushed_at = time.monotonic()
+
+    @property
+    def process_key(self) -> str:
+        """The shared cache key of the counters of this process."""
+        # Read on every flush, as forked workers inherit the instance of their parent
+        return f"{STATS_KEY}:{socket.gethostname()}:{os.getpid()}:{self._token}"
+
+    def record(self, event: str, group_name: str, value: float = 1.0) -> bool:
+        """Record an event of a group, returning whether the counters are due for a flush.
+
+        Errors of the hook are logged rather than raised, as metrics should never break a lookup.
+        """
+        if self.hook is not None:
+            try:
+                self.hook(event, group_name, value)
+            except Exception:
+                logger.warning(f"Failed to forward the choice metric '{event}' of group '{group_name}'.", exc_info=True)
+
+        now = time.monotonic()
+        with self._lock:
+            counter = self._counters.setdefault(group_name, {}).get(event)
+            if counter is None:
+                self._counters[group_name][event] = [1, value, value]
+            else:
+                counter[0] += 1
+                counter[1] += value
+                counter[2] = max(counter[2], value)
+
+            if self.flush_interval is None or now - self._flushed_at < self.flush_interval:
+                return False
+            self._flushed_at = now
+            return True
+
+    def snapshot(self) -> dict[str, dict[str, list[float]]]:
+        """Return a copy of the counters, as `{group_name: {event: [count, total, max]}}`."""
+        with self._lock:
+            return {
+                group_name: {e: list(c) for e, c in events.items()} for group_name, events in self._counters.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+def merge_counters(*snapshots: dict[str, dict[str, list[float]]]) -> dict[str, dict[str, list[float]]]:
+    """Merge the counters of several processes, as returned by `ChoiceMetrics.snapshot`."""
+    merged: dict[str, dict[str, list[float]]] = {}
+    for snapshot in snapshots:
+        for group_name, events in snapshot.items():
+            for event, (count, total, maximum) in events.items():
+                counter = merged.setdefault(group_name, {}).setdefault(event, [0, 0.0, maximum])
+                counter[0] += count
+                counter[1] += total
+                counter[2] = max(counter[2], maximum)
+    return merged
+
+
+def summarize_counters(counters: dict[str, dict[str, list[float]]], limit: int = 10) -> dict[str, Any]:
+    """Summarize merged counters into totals per event, and the heaviest groups by size and traffic.
+
+    Args:
+        counters (dict[str, dict[str, list[float]]]):
+            The counters, as returned by `merge_counters`.
+        limit (int):
+            The number of groups to list in each ranking.
+    """
+    totals: dict[str, dict[str, float]] = {}
+    sizes: dict[str, int] = {}
+    traffic: dict[str, int] = {}
+    for group_name, events in counters.items():
+        for event, (count, total, maximum) in events.items():
+            event_totals = totals.setdefault(event, {"count": 0, "total": 0.0, "max": maximum})
+            event_totals["count"] += count
+            event_totals["total"] += total
+            event_totals["max"] = max(event_totals["max"], maximum)
+
+        if "payload_size" in events:
+            sizes[group_name] = int(events["payload_size"][2])
+        # Every lookup ends up in exactly one of these tiers
+        traffic[group_name] = sum(
+            events[event][0] for event in ("local_hit", "revalidated", "shared_hit", "shared_miss") if event in events
+        )
+
+    return {
+        "totals": {event: totals[event] for event in EVENTS if event in totals},
+        "heaviest_by_size": [
+            {"group": name, "choices": size} for name, size in sorted(sizes.items(), key=lambda i: -i[1])[:limit]
+        ],
+        "heaviest_by_traffic": [
+            {"group": name, "lookups": count}
+            for name, count in sorted(traffic.items(), key=lambda i: -i[1])[:limit]
+            if count
+        ],
+    }
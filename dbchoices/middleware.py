@@ -0,0 +1,39 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from dbchoices.registry import ChoiceRegistry
+
+
+class ChoiceSnapshotMiddleware:
+    """
+    A middleware pinning a snapshot of every choice group looked up during a request.
+
+    Model validation, forms, templates and serializers then share a single fetch of each group,
+    and always see the same version of it for the whole request. The snapshot is dropped once
+    the response is returned.
+
+    Usage:
+        MIDDLEWARE = [
+            # ...
+            "dbchoices.middleware.ChoiceSnapshotMiddleware",
+        ]
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        with ChoiceRegistry.snapshot():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with ChoiceRegistry.snapshot():
+            return await self.get_response(request)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dbchoices", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dynamicchoice",
+            index=models.Index(
+                fields=["group_name", "ordering", "value", "label"], name="dbchoices_d_group_n_75ca10_idx"
+            ),
+        ),
+    ]
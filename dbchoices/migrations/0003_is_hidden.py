@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dbchoices", "0002_lookup_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dynamicchoice",
+            name="is_hidden",
+            field=models.BooleanField(
+                default=False,
+                help_text="Hides the choice, or for an override of a partition, the shared choice with the same value.",
+            ),
+        ),
+    ]
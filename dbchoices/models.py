@@ -1,9 +1,36 @@
-from typing import Self
+from collections.abc import Iterable
+from typing import Any, Self
 
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+LOOKUP_INDEX_FIELDS = ("group_name", "ordering", "value", "label")
+
+
+def choice_lookup_index(*leading_fields: str, **kwargs) -> models.Index:
+    """Return a composite index covering the queries loading choice groups.
+
+    Groups are filtered by `group_name`, ordered by `ordering` and `value`, and only read
+    `value` and `label`, so an index on these columns serves the query without touching
+    the table on every backend. Custom choice models scoping choices further (e.g. per
+    tenant) can prepend their scoping fields.
+
+    Usage:
+        class TenantChoice(AbstractDynamicChoice):
+            tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)
+
+            class Meta:
+                indexes = [choice_lookup_index("tenant")]
+
+    Args:
+        *leading_fields (str):
+            Fields to prepend to the index, which lookups always filter on.
+        **kwargs:
+            Extra arguments for `models.Index`, such as `name` or `condition`.
+    """
+    return models.Index(fields=[*leading_fields, *LOOKUP_INDEX_FIELDS], **kwargs)
+
 
 class AbstractDynamicChoice(models.Model):
     """Abstract base model for storing dynamic choices."""
@@ -35,20 +62,131 @@ class AbstractDynamicChoice(models.Model):
         default=False,
         help_text=_("Indicates if this choice was created by the system during startup."),
     )
+    is_hidden = models.BooleanField(
+        default=False,
+        help_text=_("Hides the choice, or for an override of a partition, the shared choice with the same value."),
+    )
     meta_created_at = models.DateTimeField(default=timezone.now, editable=False)
 
+    partition_field: str | None = None
+    """The name of a nullable field partitioning choices, e.g. per tenant.
+
+    Choices with no partition are shared by every partition, and choices of a partition
+    override shared choices with the same value: they relabel or reorder them, hide them
+    with `is_hidden`, or add new ones. When set, filtering on this field, e.g.
+    `ChoiceRegistry.get_choices("status", tenant=tenant)`, merges the choices of the
+    partition over the shared ones, and editing a choice only invalidates its partition.
+    """
+
     class Meta:
         abstract = True
         ordering = ("group_name", "ordering", "label")
+        indexes = [choice_lookup_index()]
+
+    @classmethod
+    def split_partition(cls, group_filters: dict[str, Any]) -> tuple[Any, dict[str, Any]]:
+        """Split the partition out of `group_filters`, returning `(partition, other_filters)`.
+
+        The partition can be given by field name or attribute name, as an instance or a key.
+        """
+        if cls.partition_field is None:
+            return None, group_filters
+
+        field = cls._meta.get_field(cls.partition_field)
+        filters = dict(group_filters)
+        partition = None
+        for key in (field.name, field.attname):
+            if key in filters:
+                partition = filters.pop(key)
+        return getattr(partition, "pk", partition), filters
+
+    def get_partition(self) -> Any:
+        """Return the partition of this choice, or None if it is shared."""
+        if self.partition_field is None:
+            return None
+        return getattr(self, self._meta.get_field(self.partition_field).attname)
+
+    def get_cached_layers(self) -> set[tuple[str, Any]]:
+        """Return the `(group_name, partition)` layers this choice is cached in, e.g. to invalidate them.
+
+        Besides its current group and partition, this includes the ones it was loaded with, so
+        moving a choice to another group or partition invalidates both.
+        """
+        layers = {(self.group_name, self.get_partition())}
+        loaded_layer = getattr(self, "_loaded_layer", None)
+        if loaded_layer is not None:
+            layers.add(loaded_layer)
+        return layers
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        partition_attname = cls.partition_field and cls._meta.get_field(cls.partition_field).attname
+        # Only remember the layer if it was loaded, as reading deferred fields would query them
+        if "group_name" in instance.__dict__ and (partition_attname is None or partition_attname in instance.__dict__):
+            instance._loaded_layer = (instance.group_name, instance.get_partition())
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._loaded_layer = (self.group_name, self.get_partition())
 
     @classmethod
     def get_choices(cls, group_name: str, **group_filters):
         """Fetch all choices for a given `group_name` from the database."""
-        return cls.objects.filter(group_name=group_name, **group_filters).order_by("ordering", "value")
+        return cls.get_many_choices([group_name], **group_filters).order_by("ordering", "value")
+
+    @classmethod
+    def get_many_choices(cls, group_names: list[str], **group_filters):
+        """Fetch all choices for several groups from the database in a single query.
+
+        For partitioned models, the shared choices are fetched along with the ones of the
+        partition given in `group_filters`, if any.
+        """
+        partition, group_filters = cls.split_partition(group_filters)
+        queryset = cls.objects.filter(group_name__in=group_names, **group_filters)
+        if cls.partition_field is not None:
+            scope = models.Q(**{f"{cls.partition_field}__isnull": True})
+            if partition is not None:
+                scope |= models.Q(**{cls.partition_field: partition})
+            queryset = queryset.filter(scope)
+        return queryset.order_by("group_name", "ordering", "value")
+
+    @classmethod
+    def get_layer_choices(cls, group_names: list[str], partition: Any = None, **group_filters):
+        """Fetch the choices of several groups stored for a single partition, in a single query.
+
+        Without a `partition`, only the shared choices are fetched. This only applies to
+        partitioned models, see `partition_field`.
+        """
+        scope = {f"{cls.partition_field}__isnull": True} if partition is None else {cls.partition_field: partition}
+        return cls.objects.filter(group_name__in=group_names, **scope, **group_filters).order_by(
+            "group_name", "ordering", "value"
+        )
+
+    @classmethod
+    def get_default_choices(cls, group_names: list[str]):
+        """Fetch the choices of several groups that default definitions are synchronized to."""
+        queryset = cls.objects.filter(group_name__in=group_names)
+        if cls.partition_field is not None:
+            # Defaults are shared, and never touch the overrides of a partition
+            queryset = queryset.filter(**{f"{cls.partition_field}__isnull": True})
+        return queryset
+
+    @classmethod
+    def get_group_names(cls) -> list[str]:
+        """Fetch the distinct names of all groups stored in the database."""
+        return list(cls.objects.order_by().values_list("group_name", flat=True).distinct())
+
+    @classmethod
+    def _create_choices(
+        cls, choices: list[Self], ignore_conflicts: bool = True, batch_size: int | None = None
+    ) -> list[Self]:
+        return cls.objects.bulk_create(choices, ignore_conflicts=ignore_conflicts, batch_size=batch_size)
 
     @classmethod
-    def _create_choices(cls, choices: list[Self], ignore_conflicts: bool = True) -> list[Self]:
-        return cls.objects.bulk_create(choices, ignore_conflicts=ignore_conflicts)
+    def _update_choices(cls, choices: list[Self], fields: Iterable[str], batch_size: int | None = None) -> int:
+        return cls.objects.bulk_update(choices, fields=fields, batch_size=batch_size)
 
     @classmethod
     def _delete_choices(cls, group_names: list[str], **group_filters) -> None:
@@ -68,4 +206,5 @@ class DynamicChoice(AbstractDynamicChoice):
     class Meta:
         swappable = "DBCHOICE_MODEL"
         unique_together = (("group_name", "name"), ("group_name", "value"))
+        indexes = [choice_lookup_index()]
         verbose_name = _("Dynamic Choice")
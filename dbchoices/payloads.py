@@ -0,0 +1,93 @@
+import json
+import sys
+import zlib
+from typing import Any
+
+
+class PayloadSerializer:
+    """Base class for the encoding of choice groups in the shared cache.
+
+    Payloads hold (value, label) pairs, or longer rows of strings for partitioned choice
+    models. The encoded payload is stored as-is by the cache backend, which still pickles it.
+    Subclasses implement `dumps` and `loads`, and `loads` raises `ValueError` for payloads
+    it cannot read, e.g. ones written by another serializer before a deploy, which are
+    then treated as missing.
+    """
+
+    def dumps(self, choices: list[tuple[str, ...]]) -> Any:
+        raise NotImplementedError("Subclasses must implement `dumps`.")
+
+    def loads(self, payload: Any) -> list[tuple[str, ...]]:
+        raise NotImplementedError("Subclasses must implement `loads`.")
+
+
+class PickleSerializer(PayloadSerializer):
+    """Store choices as a plain list of (value, label) tuples, pickled by the cache backend."""
+
+    def dumps(self, choices: list[tuple[str, ...]]) -> list[tuple[str, ...]]:
+        return list(choices)
+
+    def loads(self, payload: Any) -> list[tuple[str, ...]]:
+        if not isinstance(payload, list):
+            raise ValueError("Not a pickled choice payload.")
+        return payload
+
+
+class CompactSerializer(PayloadSerializer):
+    """Store choices as a single UTF-8 blob of NUL-separated values and labels, prefixed by the row length.
+
+    Compared to a pickled list of tuples, the blob is smaller, is (un)pickled by the cache
+    backend as a single object, and is decoded with a single split. Groups with values or
+    labels containing NUL characters are stored as JSON instead.
+
+    Args:
+        compress_threshold (int | None):
+            The size in bytes from which blobs are compressed with zlib. If None, blobs are
+            never compressed.
+        compress_level (int):
+            The zlib compression level, favoring speed by default.
+        intern (bool):
+            Whether to intern values and labels when decoding, so groups holding the same
+            strings, like the filtered variants of a group, share them in memory. This makes
+            decoding several times slower.
+    """
+
+    PLAIN = b"\x01"
+    COMPRESSED = b"\x02"
+    JSON = b"\x03"
+    SEPARATOR = "\0"
+
+    def __init__(self, compress_threshold: int | None = 16 * 1024, compress_level: int = 1, intern: bool = False):
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+        self.intern = intern
+
+    def dumps(self, choices: list[tuple[str, ...]]) -> bytes:
+        arity = bytes([len(choices[0]) if choices else 2])
+        parts = [part for choice in choices for part in choice]
+        text = self.SEPARATOR.join(parts)
+        if parts and text.count(self.SEPARATOR) != len(parts) - 1:
+            return self.JSON + arity + json.dumps(parts, separators=(",", ":")).encode()
+
+        data = text.encode()
+        if self.compress_threshold is not None and len(data) >= self.compress_threshold:
+            return self.COMPRESSED + arity + zlib.compress(data, self.compress_level)
+        return self.PLAIN + arity + data
+
+    def loads(self, payload: Any) -> list[tuple[str, ...]]:
+        if not isinstance(payload, bytes) or len(payload) < 2:
+            raise ValueError("Not a compact choice payload.")
+
+        tag, arity, data = payload[:1], payload[1], memoryview(payload)[2:]
+        if tag == self.JSON:
+            return list(zip(*[iter(json.loads(bytes(data)))] * arity, strict=False))
+        if tag == self.COMPRESSED:
+            data = zlib.decompress(data)
+        elif tag != self.PLAIN:
+            raise ValueError(f"Unknown compact choice payload tag {tag!r}.")
+
+        if not data:
+            return []
+        parts = str(data, "utf-8").split(self.SEPARATOR)
+        parts = map(sys.intern, parts) if self.intern else iter(parts)
+        return list(zip(*[parts] * arity, strict=False))
@@ -0,0 +1,174 @@
+from typing import Any
+
+from django.core.exceptions import FieldError
+from django.db import models
+from django.db.models.expressions import Expression
+from django.db.models.functions import Coalesce
+from django.db.models.lookups import Exact
+
+from dbchoices.fields import DynamicChoiceField
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+
+CASE = "case"
+SUBQUERY = "subquery"
+AUTO = "auto"
+CASE_MAX_CHOICES = 500
+"""Groups with more choices than this are resolved with a subquery when the strategy is `auto`."""
+
+
+def choice_label_case(
+    expression: str | Expression, group_name: str, group_filters: dict[str, Any] | None = None
+) -> models.Case:
+    """Build a `CASE` expression mapping the values of `expression` to their labels.
+
+    The mapping is built from the cached choice group, so it needs no join. Values that
+    are not part of the group are returned as-is, like the `choice_label` template filter.
+
+    Args:
+        expression (str | Expression):
+            The field name or expression holding the choice values.
+        group_name (str):
+            The name of the choice group to resolve labels from.
+        group_filters (dict[str, Any] | None):
+            Query filters to narrow down the choices.
+    """
+    if isinstance(expression, str):
+        expression = models.F(expression)
+
+    group = ChoiceRegistry.get_group(group_name, **(group_filters or {}))
+    return models.Case(
+        *(models.When(Exact(expression, value), then=models.Value(label)) for value, label in group.labels.items()),
+        default=expression,
+        output_field=models.CharField(),
+    )
+
+
+def visible_choices(group_name: str, group_filters: dict[str, Any] | None = None) -> models.QuerySet:
+    """Return the stored choices of a group that `ChoiceRegistry.get_group` would return, as a queryset.
+
+    Hidden choices are left out. For partitioned models, these are the shared choices, with
+    the overrides of the partition given in `group_filters` replacing them.
+
+    Args:
+        group_name (str):
+            The name of the choice group.
+        group_filters (dict[str, Any] | None):
+            Query filters to narrow down the choices.
+    """
+    choice_model = get_choice_model()
+    partition, group_filters = choice_model.split_partition(group_filters or {})
+    choices = choice_model.objects.filter(group_name=group_name, **group_filters)
+    if choice_model.partition_field is None:
+        return choices.filter(is_hidden=False)
+
+    partition_attname = choice_model._meta.get_field(choice_model.partition_field).attname
+    shared = models.Q(**{f"{partition_attname}__isnull": True})
+    if partition is not None:
+        overrides = choices.filter(**{partition_attname: partition})
+        shared &= ~models.Exists(overrides.filter(value=models.OuterRef("value")))
+        shared |= models.Q(**{partition_attname: partition})
+    return choices.filter(shared, is_hidden=False)
+
+
+def choice_label_subquery(
+    expression: str | Expression, group_name: str, group_filters: dict[str, Any] | None = None
+) -> Coalesce:
+    """Build a correlated subquery resolving the values of `expression` to their labels.
+
+    Unlike `choice_label_case`, the size of the query does not grow with the group, which
+    suits large groups. Values that are not part of the group are returned as-is. Labels
+    are looked up in the `visible_choices` of the group, like `ChoiceRegistry.get_choices`.
+
+    Args:
+        expression (str | Expression):
+            The name of the field holding the choice values on the outer queryset, or an
+            expression of the outer queryset resolving to them.
+        group_name (str):
+            The name of the choice group to resolve labels from.
+        group_filters (dict[str, Any] | None):
+            Query filters to narrow down the choices.
+    """
+    if isinstance(expression, str):
+        outer, expression = models.OuterRef(expression), models.F(expression)
+    else:
+        outer = expression
+
+    labels = visible_choices(group_name, group_filters).filter(value=outer).order_by().values("label")[:1]
+    return Coalesce(models.Subquery(labels), expression, output_field=models.CharField())
+
+
+def choice_label(
+    expression: str | Expression, group_name: str, group_filters: dict[str, Any] | None = None, strategy: str = AUTO
+) -> models.Case | Coalesce:
+    """Build an expression resolving the values of `expression` to their labels on the database side.
+
+    Args:
+        expression (str | Expression):
+            The name of the field holding the choice values, or an expression resolving to them.
+        group_name (str):
+            The name of the choice group to resolve labels from.
+        group_filters (dict[str, Any] | None):
+            Query filters to narrow down the choices.
+        strategy (str):
+            `case` to inline the cached group in a `CASE` expression, `subquery` to look labels
+            up in the choice table, or `auto` to pick `case` for groups of up to
+            `CASE_MAX_CHOICES` choices and `subquery` for larger ones.
+    """
+    if strategy == AUTO:
+        group = ChoiceRegistry.get_group(group_name, **(group_filters or {}))
+        strategy = CASE if len(group) <= CASE_MAX_CHOICES else SUBQUERY
+
+    if strategy == CASE:
+        return choice_label_case(expression, group_name, group_filters)
+    if strategy == SUBQUERY:
+        return choice_label_subquery(expression, group_name, group_filters)
+    raise ValueError(f"Unknown label strategy '{strategy}', expected one of: {AUTO}, {CASE}, {SUBQUERY}.")
+
+
+def annotate_choice_labels(
+    queryset: models.QuerySet, *field_names: str, suffix: str = "_label", strategy: str = AUTO
+) -> models.QuerySet:
+    """Annotate the label of dynamic choice fields on every row of a queryset.
+
+    The labels are resolved by the database, in the same query, so they can be filtered,
+    sorted and streamed without any per-row lookups.
+
+    Usage:
+        annotate_choice_labels(Ticket.objects.all(), "status").order_by("status_label")
+
+    Args:
+        queryset (QuerySet):
+            The queryset to annotate.
+        *field_names (str):
+            The dynamic choice fields to annotate. If none are given, every dynamic choice
+            field of the model is annotated.
+        suffix (str):
+            The suffix appended to each field name to name its annotation.
+        strategy (str):
+            The strategy used to resolve labels, see `choice_label`.
+    """
+    opts = queryset.model._meta
+    fields = [opts.get_field(name) for name in field_names] or [
+        field for field in opts.concrete_fields if isinstance(field, DynamicChoiceField)
+    ]
+    annotations = {}
+    for field in fields:
+        if not isinstance(field, DynamicChoiceField):
+            raise FieldError(f"'{field.name}' is not a DynamicChoiceField.")
+        annotations[f"{field.name}{suffix}"] = choice_label(
+            field.attname, field.group_name, field.group_filters, strategy=strategy
+        )
+
+    return queryset.annotate(**annotations)
+
+
+class DynamicChoiceQuerySet(models.QuerySet):
+    """A QuerySet providing database-side helpers for models with dynamic choice fields."""
+
+    def annotate_choice_labels(self, *field_names: str, suffix: str = "_label", strategy: str = AUTO):
+        """Annotate the label of dynamic choice fields on every row, see `annotate_choice_labels`."""
+        return annotate_choice_labels(self, *field_names, suffix=suffix, strategy=strategy)
+
+
+DynamicChoiceManager = models.Manager.from_queryset(DynamicChoiceQuerySet)
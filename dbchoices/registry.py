@@ -1,27 +1,53 @@
+import asyncio
 import logging
-from collections.abc import Iterable
+import math
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from typing import Any
+from typing import IO, Any, NamedTuple
 
-from django.conf import settings
-from django.core.cache import caches
-from django.db import models, transaction
+from asgiref.local import Local
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, models, transaction
 from django.utils.regex_helper import _lazy_re_compile
 from django.utils.text import slugify
 
-from dbchoices.utils import generate_cache_key, get_choice_model
+from dbchoices.cache import CacheEntry, LocalCache, jitter_timeout
+from dbchoices.conf import ChoiceModelProxy, SharedCacheProxy, choice_settings, lazy_class_attribute
+from dbchoices.groups import ChoiceGroup, ChoiceLayer, ChoicePage
+from dbchoices.metrics import STATS_KEY, STATS_TIMEOUT, ChoiceMetrics, merge_counters
+from dbchoices.snapshots import read_snapshot, write_snapshot
+from dbchoices.sync import SYNC_FIELDS, ChoiceDiff, compute_diff
+from dbchoices.transfer import IMPORT_FIELDS, TRANSFER_FIELDS, chunked, read_choices, write_choices
+from dbchoices.utils import generate_cache_key, generate_generation_key, generate_member_name
 
 logger = logging.getLogger(__name__)
-cache_timeout = getattr(settings, "DBCHOICES_CACHE_TIMEOUT", 1 * 60 * 60)  # Default: 1 hour
-cache = caches[getattr(settings, "DBCHOICES_CACHE_ALIAS", "default")]
+lock_poll_interval = 0.05
 safe_slug_regex = _lazy_re_compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
-
-ChoiceModel = get_choice_model()
+# The cache backend, the choice model and the settings are only resolved on first use
+cache = SharedCacheProxy()
+ChoiceModel = ChoiceModelProxy()
+pending_invalidations: ContextVar[set[tuple[str, Any]] | None] = ContextVar(
+    "dbchoices_pending_invalidations", default=None
+)
+pinned_groups: ContextVar[dict[str, dict[str, ChoiceGroup]] | None] = ContextVar("dbchoices_snapshot", default=None)
 EnumTuple = tuple[str, str, str]
 """A tuple representing an enum member with (name, value, label)."""
 
 
+class EnumCacheInfo(NamedTuple):
+    """Statistics of the enum cache of the registry."""
+
+    hits: int
+    rebuilds: int
+    size: int
+    max_size: int
+
+
 class ChoiceRegistry:
     """
     A registry for managing dynamic database-backed choices.
@@ -31,7 +57,22 @@ class ChoiceRegistry:
     """
 
     _defaults: dict[str, Iterable[EnumTuple]] = {}
-    _enum_cache: dict[str, type[models.TextChoices]] = {}
+    _member_names: dict[str, dict[str, str]] = {}
+    # Entries are (generation, enum) pairs
+    _enum_cache = lazy_class_attribute(
+        lambda: LocalCache(max_size=choice_settings.ENUM_CACHE_SIZE), settings=("ENUM_CACHE_SIZE",)
+    )
+    _enum_stats = Counter(hits=0, rebuilds=0)
+    _local_cache = lazy_class_attribute(
+        lambda: LocalCache(max_size=choice_settings.LOCAL_CACHE_SIZE), settings=("LOCAL_CACHE_SIZE",)
+    )
+    _metrics = lazy_class_attribute(
+        lambda: ChoiceMetrics(hook=choice_settings.METRICS_HOOK, flush_interval=choice_settings.METRICS_FLUSH_INTERVAL),
+        settings=("METRICS_HOOK", "METRICS_FLUSH_INTERVAL"),
+    )
+    _flush_tasks: set[asyncio.Task] = set()  # Metrics flushes scheduled by async lookups, until they finish
+    _snapshot_groups: dict[str, ChoiceGroup] = {}  # Read-only groups loaded from a snapshot file, by cache key
+    _commit_invalidations = Local()  # Per-connection groups waiting for a commit, like Django connections
 
     @classmethod
     def register_defaults(cls, group_name: str, choices: Iterable[EnumTuple | tuple[str, str]]) -> None:
@@ -80,7 +121,7 @@ class ChoiceRegistry:
             name_set.add(name_str)
             normalized_choices.append((name_str, value_str, label_str))
 
-        cls._defaults[group_name] = normalized_choices
+        cls._set_defaults(group_name, normalized_choices)
 
     @classmethod
     def register_enum(cls, enum_cls: type[Enum | models.Choices], group_name: str | None = None) -> None:
@@ -107,7 +148,12 @@ class ChoiceRegistry:
             else:
                 choices.append((member.name, str(member.value), str(member.name)))
 
+        cls._set_defaults(group_name, choices)
+
+    @classmethod
+    def _set_defaults(cls, group_name: str, choices: list[EnumTuple]) -> None:
         cls._defaults[group_name] = choices
+        cls._member_names[group_name] = {value: generate_member_name(value) for _, value, _ in choices}
 
     @classmethod
     def get_choices(cls, group_name: str, **group_filters: Any) -> list[tuple[str, str]]:
@@ -120,23 +166,743 @@ class ChoiceRegistry:
                 Query filters to narrow down the choices. Useful in scenarios
                 where choices may depend on other attributes.
         """
-        cache_key = generate_cache_key(group_name, **group_filters)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
+        return list(cls.get_group(group_name, **group_filters).choices)
+
+    @classmethod
+    async def aget_choices(cls, group_name: str, **group_filters: Any) -> list[tuple[str, str]]:
+        """Asynchronous version of `get_choices`."""
+        return list((await cls.aget_group(group_name, **group_filters)).choices)
+
+    @classmethod
+    def get_group(cls, group_name: str, **group_filters: Any) -> ChoiceGroup:
+        """Return the compiled `ChoiceGroup` for a given `group_name`.
+
+        The group is loaded through the process-local cache, the shared cache and
+        finally the database, and is only rebuilt when its generation changes.
+
+        Args:
+            group_name (str):
+                The name of the choice group to retrieve choices for.
+            **group_filters:
+                Query filters to narrow down the choices.
+        """
+        return cls.get_many_groups([group_name], **group_filters)[group_name]
+
+    @classmethod
+    async def aget_group(cls, group_name: str, **group_filters: Any) -> ChoiceGroup:
+        """Asynchronous version of `get_group`."""
+        return (await cls.aget_many_groups([group_name], **group_filters))[group_name]
+
+    @classmethod
+    def get_many_choices(cls, group_names: Iterable[str], **group_filters: Any) -> dict[str, list[tuple[str, str]]]:
+        """Return a mapping of `group_name` to its list of (value, label) for several groups at once.
+
+        Args:
+            group_names (Iterable[str]):
+                The names of the choice groups to retrieve choices for.
+            **group_filters:
+                Query filters applied to every group.
+        """
+        groups = cls.get_many_groups(group_names, **group_filters)
+        return {name: list(group.choices) for name, group in groups.items()}
 
-        choice_queryset = ChoiceModel.get_choices(group_name, **group_filters)
-        choices = list(choice_queryset.values_list("value", "label"))
-        cache.set(cache_key, choices, timeout=cache_timeout)
-        return choices
+    @classmethod
+    async def aget_many_choices(
+        cls, group_names: Iterable[str], **group_filters: Any
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Asynchronous version of `get_many_choices`."""
+        groups = await cls.aget_many_groups(group_names, **group_filters)
+        return {name: list(group.choices) for name, group in groups.items()}
+
+    @classmethod
+    def get_many_groups(cls, group_names: Iterable[str], **group_filters: Any) -> dict[str, ChoiceGroup]:
+        """Return a mapping of `group_name` to its compiled `ChoiceGroup` for several groups at once.
+
+        Groups missing from the process-local cache are fetched from the shared cache in a
+        single round-trip, and groups missing from both are loaded with a single query. Within
+        a `snapshot` block, groups are only fetched once and then pinned for the whole block.
+
+        Args:
+            group_names (Iterable[str]):
+                The names of the choice groups to retrieve choices for.
+            **group_filters:
+                Query filters applied to every group.
+        """
+        snapshot = pinned_groups.get()
+        if snapshot is None:
+            return cls._fetch_groups(group_names, group_filters)
+
+        # Groups pinned by an active snapshot are served as-is, and newly fetched ones are pinned
+        cache_keys = {name: generate_cache_key(name, **group_filters) for name in group_names}
+        missing = [name for name, cache_key in cache_keys.items() if cache_key not in snapshot.get(name, {})]
+        if missing:
+            for name, group in cls._fetch_groups(missing, group_filters).items():
+                snapshot.setdefault(name, {})[cache_keys[name]] = group
+
+        return {name: snapshot[name][cache_key] for name, cache_key in cache_keys.items()}
+
+    @classmethod
+    async def aget_many_groups(cls, group_names: Iterable[str], **group_filters: Any) -> dict[str, ChoiceGroup]:
+        """Asynchronous version of `get_many_groups`."""
+        snapshot = pinned_groups.get()
+        if snapshot is None:
+            return await cls._afetch_groups(group_names, group_filters)
+
+        cache_keys = {name: generate_cache_key(name, **group_filters) for name in group_names}
+        missing = [name for name, cache_key in cache_keys.items() if cache_key not in snapshot.get(name, {})]
+        if missing:
+            for name, group in (await cls._afetch_groups(missing, group_filters)).items():
+                snapshot.setdefault(name, {})[cache_keys[name]] = group
+
+        return {name: snapshot[name][cache_key] for name, cache_key in cache_keys.items()}
+
+    @classmethod
+    def _fetch_groups(cls, group_names: Iterable[str], group_filters: dict[str, Any]) -> dict[str, ChoiceGroup]:
+        group_names = list(group_names)
+        try:
+            return cls._resolve_groups(group_names, group_filters)
+        except Exception:
+            groups = cls._fallback_groups(group_names, group_filters)
+            if groups is None:
+                raise
+            return groups
+
+    @classmethod
+    async def _afetch_groups(cls, group_names: Iterable[str], group_filters: dict[str, Any]) -> dict[str, ChoiceGroup]:
+        group_names = list(group_names)
+        try:
+            return await cls._aresolve_groups(group_names, group_filters)
+        except Exception:
+            groups = cls._fallback_groups(group_names, group_filters)
+            if groups is None:
+                raise
+            return groups
+
+    @classmethod
+    def _fallback_groups(cls, group_names: list[str], group_filters: dict[str, Any]) -> dict[str, ChoiceGroup] | None:
+        # When the cache or the database fails, groups are served from the snapshot file if possible
+        groups = {name: cls._snapshot_groups.get(generate_cache_key(name, **group_filters)) for name in group_names}
+        if not group_names or None in groups.values():
+            return None
+
+        cls._record_many("snapshot_fallback", group_names)
+        logger.warning(f"Serving choice groups {group_names} from the snapshot file.", exc_info=True)
+        return groups
+
+    @classmethod
+    def _resolve_groups(cls, group_names: list[str], group_filters: dict[str, Any]) -> dict[str, ChoiceGroup]:
+        if ChoiceModel.partition_field is None:
+            return cls._resolve_layers(group_names, group_filters)
+
+        # The shared layer is cached once for every partition, which only caches its overrides
+        partition, filters = ChoiceModel.split_partition(group_filters)
+        shared = cls._resolve_layers(group_names, filters)
+        if partition is None:
+            return {name: layer.group for name, layer in shared.items()}
+
+        overrides = cls._resolve_layers(group_names, {**filters, ChoiceModel.partition_field: partition})
+        return cls._merge_layers(shared, overrides, group_filters)
+
+    @classmethod
+    async def _aresolve_groups(cls, group_names: list[str], group_filters: dict[str, Any]) -> dict[str, ChoiceGroup]:
+        if ChoiceModel.partition_field is None:
+            return await cls._aresolve_layers(group_names, group_filters)
+
+        partition, filters = ChoiceModel.split_partition(group_filters)
+        shared = await cls._aresolve_layers(group_names, filters)
+        if partition is None:
+            return {name: layer.group for name, layer in shared.items()}
+
+        overrides = await cls._aresolve_layers(group_names, {**filters, ChoiceModel.partition_field: partition})
+        return cls._merge_layers(shared, overrides, group_filters)
+
+    @classmethod
+    def _resolve_layers(cls, group_names: list[str], group_filters: dict[str, Any]) -> dict[str, Any]:
+        # Groups of unpartitioned models, or `ChoiceLayer`s of partitioned ones
+        cache_keys, generation_keys = cls._layer_keys(group_names, group_filters)
+        groups, local_groups = cls._local_groups(cache_keys, generation_keys)
+        if not local_groups:
+            return groups
+
+        cached_data = cache.get_many(cls._shared_keys(local_groups, cache_keys, generation_keys))
+        for name in local_groups:
+            if not cached_data.get(generation_keys[name]):
+                cached_data[generation_keys[name]] = cls._init_generation(generation_keys[name])
+        generations = cls._revalidate_groups(groups, local_groups, cached_data, generation_keys)
+
+        stale_keys = [cache_keys[name] for name in generations if local_groups[name] is not None]
+        if stale_keys:
+            cached_data.update(cache.get_many(stale_keys))
+
+        stale_entries = cls._cached_groups(groups, generations, cached_data, cache_keys)
+        if stale_entries:
+            groups.update(cls._load_groups(stale_entries, cache_keys, generations, group_filters))
+
+        return {name: groups[name] for name in cache_keys}
+
+    @classmethod
+    async def _aresolve_layers(cls, group_names: list[str], group_filters: dict[str, Any]) -> dict[str, Any]:
+        cache_keys, generation_keys = cls._layer_keys(group_names, group_filters)
+        groups, local_groups = cls._local_groups(cache_keys, generation_keys)
+        if not local_groups:
+            return groups
+
+        cached_data = await cache.aget_many(cls._shared_keys(local_groups, cache_keys, generation_keys))
+        for name in local_groups:
+            if not cached_data.get(generation_keys[name]):
+                cached_data[generation_keys[name]] = await cls._ainit_generation(generation_keys[name])
+        generations = cls._revalidate_groups(groups, local_groups, cached_data, generation_keys)
+
+        stale_keys = [cache_keys[name] for name in generations if local_groups[name] is not None]
+        if stale_keys:
+            cached_data.update(await cache.aget_many(stale_keys))
+
+        stale_entries = cls._cached_groups(groups, generations, cached_data, cache_keys)
+        if stale_entries:
+            groups.update(await cls._aload_groups(stale_entries, cache_keys, generations, group_filters))
+
+        return {name: groups[name] for name in cache_keys}
+
+    @classmethod
+    def _layer_keys(
+        cls, group_names: list[str], group_filters: dict[str, Any]
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        partition, filters = ChoiceModel.split_partition(group_filters)
+        cache_keys = {name: generate_cache_key(name, partition, **filters) for name in group_names}
+        generation_keys = {name: generate_generation_key(name, partition) for name in group_names}
+        return cache_keys, generation_keys
+
+    @classmethod
+    def _merge_layers(
+        cls, shared: dict[str, ChoiceLayer], overrides: dict[str, ChoiceLayer], group_filters: dict[str, Any]
+    ) -> dict[str, ChoiceGroup]:
+        # Merged groups are kept locally until either of their layers changes
+        partition, filters = ChoiceModel.split_partition(group_filters)
+        groups: dict[str, ChoiceGroup] = {}
+        for name, layer in shared.items():
+            generation = cls._combine_generations([layer.generation, overrides[name].generation])
+            cache_key = f"{generate_cache_key(name, partition, **filters)}:merged"
+            group = cls._local_cache.get(cache_key)
+            if group is None or group.generation != generation:
+                group = layer.merge(overrides[name], generation=generation)
+                cls._local_cache.set(cache_key, group)
+            groups[name] = group
+
+        return groups
+
+    @classmethod
+    def _generation_keys(cls, group_name: str, partition: Any = None) -> list[str]:
+        if partition is None:
+            return [generate_generation_key(group_name)]
+        return [generate_generation_key(group_name), generate_generation_key(group_name, partition)]
+
+    @classmethod
+    def _combine_generations(cls, generations: Iterable[int]) -> int:
+        # Replacing any of the generations replaces the combined one
+        combined = 0
+        for generation in generations:
+            combined ^= generation
+        return combined
+
+    @classmethod
+    def _local_groups(
+        cls, cache_keys: dict[str, str], generation_keys: dict[str, str]
+    ) -> tuple[dict[str, ChoiceGroup], dict[str, ChoiceGroup | None]]:
+        # Process-local tier: groups are tagged with the generation they were loaded at. Groups from
+        # a snapshot file are only candidates, which are served once their generation is confirmed.
+        snapshot_groups = cls._snapshot_groups if ChoiceModel.partition_field is None else {}
+        groups: dict[str, ChoiceGroup] = {}
+        local_groups: dict[str, ChoiceGroup | None] = {}
+        for name, cache_key in cache_keys.items():
+            # Groups define `__len__`, so an empty group must not be mistaken for a missing one
+            local_group = cls._local_cache.get(cache_key)
+            if local_group is None:
+                local_group = snapshot_groups.get(cache_key)
+            if local_group is not None and local_group.generation == cls._local_cache.get(generation_keys[name]):
+                groups[name] = local_group
+                cls._record("local_hit", name)
+            else:
+                local_groups[name] = local_group
+
+        return groups, local_groups
+
+    @classmethod
+    def _shared_keys(
+        cls,
+        local_groups: dict[str, ChoiceGroup | None],
+        cache_keys: dict[str, str],
+        generation_keys: dict[str, str],
+    ) -> list[str]:
+        # Shared tier: local groups only need their (cheap) generation to be revalidated
+        keys = [generation_keys[name] for name in local_groups]
+        keys += [cache_keys[name] for name, local_group in local_groups.items() if local_group is None]
+        return keys
+
+    @classmethod
+    def _revalidate_groups(
+        cls,
+        groups: dict[str, ChoiceGroup],
+        local_groups: dict[str, ChoiceGroup | None],
+        cached_data: dict[str, Any],
+        generation_keys: dict[str, str],
+    ) -> dict[str, int]:
+        # Local groups still at the current generation are kept, the others need to be loaded
+        generations: dict[str, int] = {}
+        for name, local_group in local_groups.items():
+            generation = cached_data[generation_keys[name]]
+            cls._remember_generation(generation_keys[name], generation)
+            if local_group is not None and local_group.generation == generation:
+                groups[name] = local_group
+                cls._record("revalidated", name)
+            else:
+                generations[name] = generation
+
+        return generations
+
+    @classmethod
+    def _cached_groups(
+        cls,
+        groups: dict[str, ChoiceGroup],
+        generations: dict[str, int],
+        cached_data: dict[str, Any],
+        cache_keys: dict[str, str],
+    ) -> dict[str, CacheEntry | None]:
+        # Entries from another generation, or due for an early refresh, are kept as stale fallbacks
+        stale_entries: dict[str, CacheEntry | None] = {}
+        for name, generation in generations.items():
+            entry = cls._decode_entry(cached_data.get(cache_keys[name]))
+            if (
+                entry is not None
+                and entry.generation == generation
+                and not entry.should_refresh(choice_settings.EARLY_REFRESH_BETA)
+            ):
+                groups[name] = cls._store_group(cache_keys[name], entry.payload, generation)
+                cls._record("shared_hit", name)
+            else:
+                stale_entries[name] = entry
+                cls._record("shared_miss", name)
+
+        return stale_entries
+
+    @classmethod
+    def _decode_entry(cls, entry: Any) -> CacheEntry | None:
+        # Entries are returned with their payload decoded to rows, e.g. (value, label) pairs
+        if not isinstance(entry, CacheEntry):  # Missing, or written in an older format
+            return None
+        try:
+            return entry._replace(payload=choice_settings.PAYLOAD_SERIALIZER.loads(entry.payload))
+        except ValueError:  # Written by another serializer
+            return None
+
+    @classmethod
+    def prefetch_fields(cls, fields: Iterable[Any]) -> list[ChoiceGroup]:
+        """Load the groups of several dynamic choice fields into the cache at once.
+
+        Fields are expected to expose `group_name` and `group_filters` attributes, as the
+        model, validator and serializer integrations do. Fields sharing the same filters are
+        fetched together with `get_many_groups`.
+
+        Returns:
+            The `ChoiceGroup` of every field, in the order the fields were given.
+        """
+        fields = list(fields)
+        names_by_filters: dict[str, tuple[dict, list[str]]] = {}
+        field_keys: list[str] = []
+        for field in fields:
+            group_filters = getattr(field, "group_filters", None) or {}
+            filters_key = generate_cache_key("", **group_filters)
+            names_by_filters.setdefault(filters_key, (group_filters, []))[1].append(field.group_name)
+            field_keys.append(filters_key)
+
+        groups_by_filters = {
+            filters_key: cls.get_many_groups(group_names, **group_filters)
+            for filters_key, (group_filters, group_names) in names_by_filters.items()
+        }
+        return [
+            groups_by_filters[filters_key][field.group_name]
+            for field, filters_key in zip(fields, field_keys, strict=True)
+        ]
+
+    @classmethod
+    def _load_groups(
+        cls,
+        stale_entries: dict[str, CacheEntry | None],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+        group_filters: dict[str, Any],
+    ) -> dict[str, ChoiceGroup]:
+        """Load groups from the database, making sure only one process recomputes each of them.
+
+        A short lease is taken in the shared cache before loading a group. Groups leased by
+        another process are served from their stale entry if there is one, or waited on
+        for up to `DBCHOICES_CACHE_LOCK_WAIT` seconds otherwise.
+        """
+        groups: dict[str, ChoiceGroup] = {}
+        lock_keys = cls._lock_keys(stale_entries, cache_keys, generations)
+        leased, waiting = [], []
+        for name, entry in stale_entries.items():
+            if cache.add(lock_keys[name], True, timeout=choice_settings.CACHE_LOCK_TIMEOUT):
+                leased.append(name)
+            elif entry is not None:
+                groups[name] = cls._stale_group(cache_keys[name], entry, generations[name])
+                cls._record("stale_served", name)
+            else:
+                waiting.append(name)
+
+        try:
+            if waiting:
+                groups.update(cls._wait_for_groups(waiting, cache_keys, generations))
+
+            # Groups still missing after waiting are loaded anyway, rather than failing
+            names = leased + [name for name in waiting if name not in groups]
+            if names:
+                groups.update(cls._query_groups(names, cache_keys, generations, group_filters))
+        finally:
+            if leased:
+                cache.delete_many([lock_keys[name] for name in leased])
+
+        return groups
+
+    @classmethod
+    async def _aload_groups(
+        cls,
+        stale_entries: dict[str, CacheEntry | None],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+        group_filters: dict[str, Any],
+    ) -> dict[str, ChoiceGroup]:
+        """Asynchronous version of `_load_groups`."""
+        groups: dict[str, ChoiceGroup] = {}
+        lock_keys = cls._lock_keys(stale_entries, cache_keys, generations)
+        leased, waiting = [], []
+        for name, entry in stale_entries.items():
+            if await cache.aadd(lock_keys[name], True, timeout=choice_settings.CACHE_LOCK_TIMEOUT):
+                leased.append(name)
+            elif entry is not None:
+                groups[name] = cls._stale_group(cache_keys[name], entry, generations[name])
+                cls._record("stale_served", name)
+            else:
+                waiting.append(name)
+
+        try:
+            if waiting:
+                groups.update(await cls._await_groups(waiting, cache_keys, generations))
+
+            names = leased + [name for name in waiting if name not in groups]
+            if names:
+                groups.update(await cls._aquery_groups(names, cache_keys, generations, group_filters))
+        finally:
+            if leased:
+                await cache.adelete_many([lock_keys[name] for name in leased])
+
+        return groups
+
+    @classmethod
+    def _lock_keys(
+        cls, group_names: Iterable[str], cache_keys: dict[str, str], generations: dict[str, int]
+    ) -> dict[str, str]:
+        return {name: f"{cache_keys[name]}:lock:{generations[name]}" for name in group_names}
+
+    @classmethod
+    def _query_groups(
+        cls,
+        group_names: list[str],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+        group_filters: dict[str, Any],
+    ) -> dict[str, ChoiceGroup]:
+        # Database tier: all missing groups are loaded with a single query
+        started_at = time.monotonic()
+        rows = list(cls._choice_rows(group_names, group_filters))
+        delta = time.monotonic() - started_at
+        loaded = cls._group_rows(group_names, rows)
+
+        entries, timeout = cls._cache_entries(loaded, cache_keys, generations, delta)
+        cls._record_loads(loaded, delta)
+        cache.set_many(entries, timeout=timeout)
+        return {
+            name: cls._store_group(cache_keys[name], choices, generations[name]) for name, choices in loaded.items()
+        }
+
+    @classmethod
+    async def _aquery_groups(
+        cls,
+        group_names: list[str],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+        group_filters: dict[str, Any],
+    ) -> dict[str, ChoiceGroup]:
+        started_at = time.monotonic()
+        rows = [row async for row in cls._choice_rows(group_names, group_filters)]
+        delta = time.monotonic() - started_at
+        loaded = cls._group_rows(group_names, rows)
+
+        entries, timeout = cls._cache_entries(loaded, cache_keys, generations, delta)
+        cls._record_loads(loaded, delta)
+        await cache.aset_many(entries, timeout=timeout)
+        return {
+            name: cls._store_group(cache_keys[name], choices, generations[name]) for name, choices in loaded.items()
+        }
+
+    @classmethod
+    def _choice_rows(cls, group_names: list[str], group_filters: dict[str, Any]) -> models.QuerySet:
+        if ChoiceModel.partition_field is None:
+            queryset = ChoiceModel.get_many_choices(group_names, **group_filters).filter(is_hidden=False)
+            return queryset.values_list("group_name", "value", "label")
+
+        # Layers of partitioned models keep what is needed to merge them over each other
+        partition, filters = ChoiceModel.split_partition(group_filters)
+        queryset = ChoiceModel.get_layer_choices(group_names, partition, **filters)
+        return queryset.values_list("group_name", "value", "label", "ordering", "is_hidden")
+
+    @classmethod
+    def _group_rows(cls, group_names: list[str], rows: list[tuple]) -> dict[str, list[tuple[str, ...]]]:
+        loaded: dict[str, list[tuple[str, ...]]] = {name: [] for name in group_names}
+        if ChoiceModel.partition_field is None:
+            for name, value, label in rows:
+                loaded[name].append((value, label))
+            return loaded
+
+        for name, value, label, ordering, is_hidden in rows:
+            loaded[name].append((value, label, str(ordering), "1" if is_hidden else ""))
+        return loaded
+
+    @classmethod
+    def _cache_entries(
+        cls,
+        loaded: dict[str, list[tuple[str, ...]]],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+        delta: float,
+    ) -> tuple[dict[str, CacheEntry], float | None]:
+        timeout = jitter_timeout(choice_settings.CACHE_TIMEOUT, choice_settings.CACHE_TIMEOUT_JITTER)
+        expires_at = time.time() + timeout if timeout is not None else math.inf
+        entries = {
+            cache_keys[name]: CacheEntry(
+                generations[name], choice_settings.PAYLOAD_SERIALIZER.dumps(choices), expires_at, delta
+            )
+            for name, choices in loaded.items()
+        }
+        return entries, timeout
+
+    @classmethod
+    def _wait_for_groups(
+        cls, group_names: list[str], cache_keys: dict[str, str], generations: dict[str, int]
+    ) -> dict[str, ChoiceGroup]:
+        groups: dict[str, ChoiceGroup] = {}
+        pending = list(group_names)
+        started_at = time.monotonic()
+        deadline = started_at + choice_settings.CACHE_LOCK_WAIT
+        while pending and time.monotonic() < deadline:
+            time.sleep(lock_poll_interval)
+            cached_data = cache.get_many([cache_keys[name] for name in pending])
+            cls._collect_groups(groups, pending, cached_data, cache_keys, generations)
+
+        cls._record_many("lock_wait", group_names, time.monotonic() - started_at)
+        return groups
+
+    @classmethod
+    async def _await_groups(
+        cls, group_names: list[str], cache_keys: dict[str, str], generations: dict[str, int]
+    ) -> dict[str, ChoiceGroup]:
+        groups: dict[str, ChoiceGroup] = {}
+        pending = list(group_names)
+        started_at = time.monotonic()
+        deadline = started_at + choice_settings.CACHE_LOCK_WAIT
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(lock_poll_interval)
+            cached_data = await cache.aget_many([cache_keys[name] for name in pending])
+            cls._collect_groups(groups, pending, cached_data, cache_keys, generations)
+
+        cls._record_many("lock_wait", group_names, time.monotonic() - started_at)
+        return groups
+
+    @classmethod
+    def _collect_groups(
+        cls,
+        groups: dict[str, ChoiceGroup],
+        pending: list[str],
+        cached_data: dict[str, Any],
+        cache_keys: dict[str, str],
+        generations: dict[str, int],
+    ) -> None:
+        # Groups stored by the process holding the lease are picked up and no longer waited on
+        for name in list(pending):
+            entry = cls._decode_entry(cached_data.get(cache_keys[name]))
+            if entry is not None and entry.generation == generations[name]:
+                groups[name] = cls._store_group(cache_keys[name], entry.payload, entry.generation)
+                pending.remove(name)
+
+    @classmethod
+    def _record_loads(cls, loaded: dict[str, list[tuple[str, ...]]], delta: float) -> None:
+        # Groups loaded together share the latency of their query
+        for name, choices in loaded.items():
+            cls._record("db_load", name, delta)
+            cls._record("payload_size", name, len(choices))
+
+    @classmethod
+    def _stale_group(cls, cache_key: str, entry: CacheEntry, generation: int) -> ChoiceGroup | ChoiceLayer:
+        if entry.generation == generation:
+            # The entry is only due for an early refresh, so it is still valid
+            return cls._store_group(cache_key, entry.payload, generation)
+
+        # Outdated entries are served as-is, but never kept in the local cache
+        return cls._build_group(entry.payload, entry.generation)
+
+    @classmethod
+    def _store_group(cls, cache_key: str, choices: list[tuple[str, ...]], generation: int) -> ChoiceGroup | ChoiceLayer:
+        group = cls._build_group(choices, generation)
+        cls._local_cache.set(cache_key, group)
+        return group
+
+    @classmethod
+    def _build_group(cls, choices: list[tuple[str, ...]], generation: int) -> ChoiceGroup | ChoiceLayer:
+        # Partitioned models cache layers, which are merged into groups on access
+        if ChoiceModel.partition_field is None:
+            return ChoiceGroup(choices, generation=generation)
+        return ChoiceLayer(choices, generation=generation)
+
+    @classmethod
+    def get_generation(cls, group_name: str, partition: Any = None) -> int:
+        """Return the current generation of a choice group.
+
+        The generation changes every time the group is invalidated, and is shared by
+        every process using the same cache. The generation of a partition also changes
+        when the partition is invalidated.
+        """
+        generations = []
+        for generation_key in cls._generation_keys(group_name, partition):
+            generation = cls._local_cache.get(generation_key)
+            if generation is None:
+                generation = cache.get(generation_key) or cls._init_generation(generation_key)
+                cls._remember_generation(generation_key, generation)
+            generations.append(generation)
+        return cls._combine_generations(generations)
+
+    @classmethod
+    async def aget_generation(cls, group_name: str, partition: Any = None) -> int:
+        """Asynchronous version of `get_generation`."""
+        generations = []
+        for generation_key in cls._generation_keys(group_name, partition):
+            generation = cls._local_cache.get(generation_key)
+            if generation is None:
+                generation = await cache.aget(generation_key) or await cls._ainit_generation(generation_key)
+                cls._remember_generation(generation_key, generation)
+            generations.append(generation)
+        return cls._combine_generations(generations)
+
+    @classmethod
+    def _remember_generation(cls, generation_key: str, generation: int) -> None:
+        # The local generation is trusted for a short while to skip revalidation entirely
+        if choice_settings.LOCAL_CACHE_TIMEOUT:
+            cls._local_cache.set(generation_key, generation, timeout=choice_settings.LOCAL_CACHE_TIMEOUT)
+
+    @classmethod
+    def _init_generation(cls, generation_key: str) -> int:
+        # A time-based token ensures a generation is never reused, even if the key was evicted
+        generation = time.time_ns()
+        if cache.add(generation_key, generation, timeout=None):
+            return generation
+        return cache.get(generation_key) or generation
+
+    @classmethod
+    async def _ainit_generation(cls, generation_key: str) -> int:
+        generation = time.time_ns()
+        if await cache.aadd(generation_key, generation, timeout=None):
+            return generation
+        return await cache.aget(generation_key) or generation
 
     @classmethod
     def get_label(cls, group_name: str, value: str, default: Any = None, **group_filters: Any) -> str:
         """Translates a stored value to its label for a given group_name."""
-        for db_val, label in cls.get_choices(group_name, **group_filters):
-            if str(db_val) == value:
-                return label
-        return default
+        return cls.get_group(group_name, **group_filters).get_label(value, default)
+
+    @classmethod
+    async def aget_label(cls, group_name: str, value: str, default: Any = None, **group_filters: Any) -> str:
+        """Asynchronous version of `get_label`."""
+        return (await cls.aget_group(group_name, **group_filters)).get_label(value, default)
+
+    @classmethod
+    def get_value(cls, group_name: str, label: str, default: Any = None, **group_filters: Any) -> str:
+        """Translates a label back to its stored value for a given group_name."""
+        return cls.get_group(group_name, **group_filters).get_value(label, default)
+
+    @classmethod
+    async def aget_value(cls, group_name: str, label: str, default: Any = None, **group_filters: Any) -> str:
+        """Asynchronous version of `get_value`."""
+        return (await cls.aget_group(group_name, **group_filters)).get_value(label, default)
+
+    @classmethod
+    def get_choices_page(
+        cls, group_name: str, after: str | None = None, limit: int = 50, **group_filters: Any
+    ) -> ChoicePage:
+        """Return a page of up to `limit` choices of a group, following the choice with the value `after`.
+
+        Pages are served from the cached group, so paging through a large group makes no queries
+        once it is cached. Pass the `next_cursor` of a page as `after` to fetch the next one.
+
+        Args:
+            group_name (str):
+                The name of the choice group.
+            after (str | None):
+                The cursor of the page, i.e. the value of the last choice of the previous page.
+            limit (int):
+                The maximum number of choices in the page.
+            **group_filters:
+                Query filters to narrow down the choices.
+        """
+        return cls.get_group(group_name, **group_filters).page(after, limit)
+
+    @classmethod
+    async def aget_choices_page(
+        cls, group_name: str, after: str | None = None, limit: int = 50, **group_filters: Any
+    ) -> ChoicePage:
+        """Asynchronous version of `get_choices_page`."""
+        return (await cls.aget_group(group_name, **group_filters)).page(after, limit)
+
+    @classmethod
+    def search_choices(
+        cls,
+        group_name: str,
+        query: str,
+        after: str | None = None,
+        limit: int = 20,
+        contains: bool = False,
+        **group_filters: Any,
+    ) -> ChoicePage:
+        """Return a page of the choices of a group whose label starts with, or contains, `query`.
+
+        Prefix searches bisect a sorted index of the labels, built once per cached group and
+        rebuilt only when the group changes. See `ChoiceGroup.search`.
+
+        Args:
+            group_name (str):
+                The name of the choice group.
+            query (str):
+                The text to search labels for, case-insensitively.
+            after (str | None):
+                The cursor of the page, i.e. the value of the last choice of the previous page.
+            limit (int):
+                The maximum number of choices in the page.
+            contains (bool):
+                If True, match labels containing `query` anywhere rather than starting with it.
+            **group_filters:
+                Query filters to narrow down the choices.
+        """
+        return cls.get_group(group_name, **group_filters).search(query, after, limit, contains=contains)
+
+    @classmethod
+    async def asearch_choices(
+        cls,
+        group_name: str,
+        query: str,
+        after: str | None = None,
+        limit: int = 20,
+        contains: bool = False,
+        **group_filters: Any,
+    ) -> ChoicePage:
+        """Asynchronous version of `search_choices`."""
+        return (await cls.aget_group(group_name, **group_filters)).search(query, after, limit, contains=contains)
 
     @classmethod
     def get_enum(cls, group_name: str, **group_filters: Any) -> type[models.TextChoices]:
@@ -152,84 +918,568 @@ class ChoiceRegistry:
                 where choices may depend on other attributes.
         """
         group_filters["is_system_default"] = True  # Only include system default choices in enums
+        return cls._group_enum(group_name, cls.get_group(group_name, **group_filters), group_filters)
+
+    @classmethod
+    async def aget_enum(cls, group_name: str, **group_filters: Any) -> type[models.TextChoices]:
+        """Asynchronous version of `get_enum`."""
+        group_filters["is_system_default"] = True
+        return cls._group_enum(group_name, await cls.aget_group(group_name, **group_filters), group_filters)
+
+    @classmethod
+    def _group_enum(
+        cls, group_name: str, group: ChoiceGroup, group_filters: dict[str, Any]
+    ) -> type[models.TextChoices]:
         cache_key = generate_cache_key(group_name, **group_filters)
-        if cache_key not in cls._enum_cache:
-            members = {}
-            choices = cls.get_choices(group_name, **group_filters)
-            if not choices:
-                raise ValueError(f"No choices found for group '{group_name}' to create enum.")
+        cached_enum = cls._enum_cache.get(cache_key)
+        if cached_enum is not None and cached_enum[0] == group.generation:
+            cls._enum_stats["hits"] += 1
+            cls._record("enum_hit", group_name)
+            return cached_enum[1]
 
-            for val, label in choices:
-                # Create valid python identifier: 'In Progress' -> 'IN_PROGRESS'
-                safe_key = slugify(str(val)).replace("-", "_").upper()
-                if not safe_key or safe_key[0].isdigit():
-                    safe_key = f"K_{safe_key}"
+        if not group.choices:
+            raise ValueError(f"No choices found for group '{group_name}' to create enum.")
 
-                members[safe_key] = (val, label)
+        # Member names of registered defaults are computed once, at registration
+        member_names = cls._member_names.get(group_name, {})
+        members = {member_names.get(val) or generate_member_name(val): (val, label) for val, label in group.choices}
 
-            # Dynamically create a TextChoices subclass
-            class_name = f"{group_name.title().replace('_', '')}Choices"
-            cls._enum_cache[cache_key] = models.TextChoices(class_name, members)
+        # Dynamically create a TextChoices subclass
+        class_name = f"{group_name.title().replace('_', '')}Choices"
+        enum_cls = models.TextChoices(class_name, members)
+        cls._enum_cache.set(cache_key, (group.generation, enum_cls))
+        cls._enum_stats["rebuilds"] += 1
+        cls._record("enum_rebuild", group_name)
+        return enum_cls
 
-        return cls._enum_cache[cache_key]
+    @classmethod
+    def enum_cache_info(cls) -> EnumCacheInfo:
+        """Return the statistics of the enum cache, in the spirit of `functools.lru_cache`."""
+        return EnumCacheInfo(
+            hits=cls._enum_stats["hits"],
+            rebuilds=cls._enum_stats["rebuilds"],
+            size=len(cls._enum_cache),
+            max_size=cls._enum_cache.max_size,
+        )
 
     @classmethod
-    def sync_defaults(
+    def _record(cls, event: str, group_name: str, value: float = 1.0) -> None:
+        if not cls._metrics.record(event, group_name, value):
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            cls.flush_metrics()
+        else:
+            # Lookups running on the event loop must not block on the cache, so the flush runs as a task
+            task = loop.create_task(cls.aflush_metrics())
+            cls._flush_tasks.add(task)
+            task.add_done_callback(cls._flush_tasks.discard)
+
+    @classmethod
+    def _record_many(cls, event: str, group_names: Iterable[str], value: float = 1.0) -> None:
+        for group_name in group_names:
+            cls._record(event, group_name, value)
+
+    @classmethod
+    def flush_metrics(cls) -> None:
+        """Write the metrics of this process to the shared cache, so `get_stats` can aggregate them.
+
+        This happens every `DBCHOICES_METRICS_FLUSH_INTERVAL` seconds while groups are looked up.
+        Errors are logged rather than raised, as metrics should never break a lookup.
+        """
+        try:
+            process_key = cls._metrics.process_key
+            cache.set(process_key, cls._metrics.snapshot(), timeout=STATS_TIMEOUT)
+            cache.set(STATS_KEY, cls._stats_index(cache.get(STATS_KEY), process_key), timeout=STATS_TIMEOUT)
+        except Exception:
+            logger.warning("Failed to flush choice metrics to the shared cache.", exc_info=True)
+
+    @classmethod
+    async def aflush_metrics(cls) -> None:
+        """Asynchronous version of `flush_metrics`."""
+        try:
+            process_key = cls._metrics.process_key
+            await cache.aset(process_key, cls._metrics.snapshot(), timeout=STATS_TIMEOUT)
+            index = cls._stats_index(await cache.aget(STATS_KEY), process_key)
+            await cache.aset(STATS_KEY, index, timeout=STATS_TIMEOUT)
+        except Exception:
+            logger.warning("Failed to flush choice metrics to the shared cache.", exc_info=True)
+
+    @classmethod
+    def _stats_index(cls, processes: dict[str, float] | None, process_key: str) -> dict[str, float]:
+        # The index is updated without a lock; a process dropped by a concurrent flush re-adds itself
+        now = time.time()
+        processes = {key: at for key, at in (processes or {}).items() if now - at < STATS_TIMEOUT}
+        processes[process_key] = now
+        return processes
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict[str, list[float]]]:
+        """Return the metrics of every process, as `{group_name: {event: [count, total, max]}}`.
+
+        The metrics of this process are flushed first. See `dbchoices.metrics.EVENTS` for the
+        recorded events.
+        """
+        cls.flush_metrics()
+        processes = cache.get(STATS_KEY) or {}
+        return merge_counters(*cache.get_many(list(processes)).values())
+
+    @classmethod
+    def warm_cache(cls, group_names: Iterable[str] | None = None) -> list[str]:
+        """Load choice groups into the shared cache, the local cache and the enum cache.
+
+        This avoids paying cold-cache queries on the first requests after a deploy or a
+        cache flush.
+
+        Args:
+            group_names (Iterable[str] | None):
+                The names of the groups to warm. If None, every group registered in code
+                and every group stored in the database is warmed.
+
+        Returns:
+            The names of the warmed groups.
+        """
+        if group_names is None:
+            group_names = set(cls._defaults) | set(ChoiceModel.get_group_names())
+
+        group_names = sorted(group_names)
+        cls.get_many_groups(group_names)
+        for group_name, group in cls.get_many_groups(group_names, is_system_default=True).items():
+            if group.choices:
+                cls.get_enum(group_name)
+
+        logger.info(f"Warmed the cache of {len(group_names)} choice groups.")
+        return group_names
+
+    @classmethod
+    def export_snapshot(cls, path: str | None = None, group_names: Iterable[str] | None = None) -> list[str]:
+        """Write choice groups, along with their current generation, to a snapshot file.
+
+        Args:
+            path (str | None):
+                The path of the snapshot file. Defaults to `DBCHOICES_SNAPSHOT_PATH`.
+            group_names (Iterable[str] | None):
+                The names of the groups to export. If None, every group registered in code
+                and every group stored in the database is exported.
+
+        Returns:
+            The names of the exported groups.
+        """
+        path = path or choice_settings.SNAPSHOT_PATH
+        if not path:
+            raise ValueError("No snapshot path given, and `DBCHOICES_SNAPSHOT_PATH` is not set.")
+
+        if group_names is None:
+            group_names = set(cls._defaults) | set(ChoiceModel.get_group_names())
+
+        group_names = sorted(group_names)
+        write_snapshot(path, cls.get_many_groups(group_names))
+        return group_names
+
+    @classmethod
+    def load_snapshot(cls, path: str | None = None) -> list[str]:
+        """Load the groups of a snapshot file as a read-only tier below the process-local cache.
+
+        A group from the snapshot is only served once its generation matches the current one
+        in the shared cache, so outdated snapshots are never preferred. When the shared cache
+        or the database is unavailable, groups are served from the snapshot regardless.
+
+        Args:
+            path (str | None):
+                The path of the snapshot file. Defaults to `DBCHOICES_SNAPSHOT_PATH`.
+
+        Returns:
+            The names of the loaded groups.
+        """
+        path = path or choice_settings.SNAPSHOT_PATH
+        if not path:
+            raise ValueError("No snapshot path given, and `DBCHOICES_SNAPSHOT_PATH` is not set.")
+
+        groups = read_snapshot(path)
+        cls._snapshot_groups = {generate_cache_key(name): group for name, group in groups.items()}
+        logger.info(f"Loaded {len(groups)} choice groups from the snapshot file '{path}'.")
+        return list(groups)
+
+    @classmethod
+    def export_choices(
+        cls,
+        file: IO[str],
+        group_names: Iterable[str] | None = None,
+        file_format: str = "ndjson",
+        chunk_size: int | None = None,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Stream the choices stored in the database to a NDJSON or CSV file.
+
+        Choices are read with a server-side cursor where supported, `chunk_size` rows at a
+        time, so exporting very large groups runs in bounded memory.
+
+        Args:
+            file (IO[str]):
+                The text file to write to.
+            group_names (Iterable[str] | None):
+                The names of the groups to export. If None, every stored group is exported.
+            file_format (str):
+                Either `ndjson` (one JSON object per line) or `csv`.
+            chunk_size (int | None):
+                The number of rows fetched at a time. Defaults to `DBCHOICES_TRANSFER_CHUNK_SIZE`.
+            progress (Callable[[int], None] | None):
+                Called with the number of rows exported so far after every chunk.
+
+        Returns:
+            The number of exported choices.
+        """
+        chunk_size = chunk_size or choice_settings.TRANSFER_CHUNK_SIZE
+        fields = cls._transfer_fields()
+        queryset = ChoiceModel.objects.all()
+        if group_names is not None:
+            queryset = queryset.filter(group_name__in=list(group_names))
+        rows = queryset.order_by("group_name", "ordering", "value").values_list(*fields)
+
+        count = 0
+        for chunk in chunked(rows.iterator(chunk_size=chunk_size), chunk_size):
+            count += write_choices(file, fields, chunk, file_format=file_format, header=not count)
+            if progress is not None:
+                progress(count)
+        if not count:
+            write_choices(file, fields, [], file_format=file_format)
+        return count
+
+    @classmethod
+    def import_choices(
+        cls,
+        file: IO[str],
+        file_format: str = "ndjson",
+        chunk_size: int | None = None,
+        progress: Callable[[int], None] | None = None,
+    ) -> dict[str, int]:
+        """Stream choices from a NDJSON or CSV file into the database.
+
+        Rows are read and written `chunk_size` at a time: choices matching an existing one
+        by group, value (and partition) are updated in place, and the others are created,
+        so importing very large groups runs in bounded memory. The whole import runs in a
+        single transaction, and only the cache of the imported groups is invalidated.
+
+        Args:
+            file (IO[str]):
+                The text file to read from, as written by `export_choices`.
+            file_format (str):
+                Either `ndjson` (one JSON object per line) or `csv`.
+            chunk_size (int | None):
+                The number of rows written at a time. Defaults to `DBCHOICES_TRANSFER_CHUNK_SIZE`.
+            progress (Callable[[int], None] | None):
+                Called with the number of rows imported so far after every chunk.
+
+        Returns:
+            The number of created and updated choices.
+        """
+        chunk_size = chunk_size or choice_settings.TRANSFER_CHUNK_SIZE
+        counts = {"created": 0, "updated": 0}
+        imported: set[tuple[str, Any]] = set()
+        with transaction.atomic():
+            for chunk in chunked(read_choices(file, file_format=file_format), chunk_size):
+                created, updated = cls._import_chunk(chunk, imported)
+                if updated:
+                    ChoiceModel._update_choices(updated, fields=IMPORT_FIELDS, batch_size=chunk_size)
+                if created:
+                    ChoiceModel._create_choices(created, ignore_conflicts=False, batch_size=chunk_size)
+
+                counts["created"] += len(created)
+                counts["updated"] += len(updated)
+                if progress is not None:
+                    progress(counts["created"] + counts["updated"])
+
+        logger.info(f"Imported {counts['created']} new and {counts['updated']} updated choices.")
+        cls._invalidate_partitions(imported)
+        return counts
+
+    @classmethod
+    def _transfer_fields(cls) -> tuple[str, ...]:
+        if ChoiceModel.partition_field is None:
+            return TRANSFER_FIELDS
+        return (*TRANSFER_FIELDS, ChoiceModel._meta.get_field(ChoiceModel.partition_field).attname)
+
+    @classmethod
+    def _import_chunk(cls, rows: list[dict[str, Any]], imported: set[tuple[str, Any]]) -> tuple[list, list]:
+        # Existing choices of the chunk are matched with a single query
+        partition_key = cls._transfer_fields()[-1] if ChoiceModel.partition_field is not None else None
+        existing = ChoiceModel.objects.filter(
+            group_name__in={row["group_name"] for row in rows}, value__in={row["value"] for row in rows}
+        )
+        existing_by_key = {
+            (choice.group_name, choice.value, cls._partition_key(choice.get_partition())): choice for choice in existing
+        }
+
+        created, updated = [], []
+        for row in rows:
+            partition = row.get(partition_key) if partition_key else None
+            imported.add((row["group_name"], partition))
+            choice = existing_by_key.get((row["group_name"], row["value"], cls._partition_key(partition)))
+            if choice is None:
+                fields = {field: row[field] for field in TRANSFER_FIELDS}
+                if partition_key:
+                    fields[partition_key] = partition
+                created.append(ChoiceModel(**fields))
+            else:
+                for field in IMPORT_FIELDS:
+                    setattr(choice, field, row[field])
+                updated.append(choice)
+
+        return created, updated
+
+    @classmethod
+    def _partition_key(cls, partition: Any) -> str | None:
+        # Partitions read from CSV files are strings, while stored ones are usually integers
+        return None if partition is None else str(partition)
+
+    @classmethod
+    def plan_defaults(
         cls, group_names: list[str] | None = None, recreate_defaults: bool = True, recreate_all: bool = False
-    ) -> None:
-        """Recreate all default choices from code definitions.
+    ) -> dict[str, ChoiceDiff]:
+        """Compute the changes `sync_defaults` would apply, without writing anything.
+
+        The current choices of all groups are loaded with a single query.
 
         Args:
             group_names (list[str] | None):
-                A list of group names to sync. If None, all registered groups will be synced.
+                A list of group names to plan. If None, all registered groups will be planned.
             recreate_defaults (bool):
                 If True, all choices that are no longer a part of the default definitions will be deleted.
             recreate_all (bool):
-                If True, the entire set of default choices will be deleted and recreated. It can potentially
-                delete user-added choices as well. Use with caution.
+                If True, every choice that is not a part of the default definitions will be deleted,
+                including user-added choices.
         """
-        # Accumulate all default choice instances to be created/updated
         if group_names is None:
             group_names = list(cls._defaults.keys())
 
-        choice_instances = [
-            ChoiceModel(
-                group_name=group,
-                name=name,
-                value=value,
-                label=label,
-                ordering=idx,
-                is_system_default=True,
+        group_names = [group for group in group_names if group in cls._defaults]
+        existing: dict[str, list] = {group: [] for group in group_names}
+        for choice in ChoiceModel.get_default_choices(group_names):
+            existing[choice.group_name].append(choice)
+
+        return {
+            group: compute_diff(
+                group,
+                cls._defaults[group],
+                existing[group],
+                ChoiceModel,
+                recreate_defaults=recreate_defaults,
+                recreate_all=recreate_all,
             )
-            for group, items in cls._defaults.items()
-            for idx, (name, value, label) in enumerate(items)
-            if group in group_names
-        ]
-        if not choice_instances:
-            logger.info("No default choices to synchronize.")
-            return
+            for group in group_names
+        }
+
+    @classmethod
+    def sync_defaults(
+        cls, group_names: list[str] | None = None, recreate_defaults: bool = True, recreate_all: bool = False
+    ) -> dict[str, ChoiceDiff]:
+        """Synchronize default choices from code definitions to the database.
+
+        Only the differences are applied: missing choices are inserted, changed choices are
+        updated in place, and abandoned choices are deleted. Only the cache of groups that
+        actually changed is invalidated.
+
+        Args:
+            group_names (list[str] | None):
+                A list of group names to sync. If None, all registered groups will be synced.
+            recreate_defaults (bool):
+                If True, all choices that are no longer a part of the default definitions will be deleted.
+            recreate_all (bool):
+                If True, every choice that is not a part of the default definitions will be deleted.
+                It can potentially delete user-added choices as well. Use with caution.
 
+        Returns:
+            A mapping of group name to the `ChoiceDiff` that was applied.
+        """
         with transaction.atomic():
-            if recreate_all:
-                logger.info("Recreating all default choices.")
-                ChoiceModel._delete_choices(group_names)
-            elif recreate_defaults:
-                logger.info("Deleting abandoned default choices.")
-                ChoiceModel._delete_choices(group_names, is_system_default=True)
+            diffs = cls.plan_defaults(group_names, recreate_defaults=recreate_defaults, recreate_all=recreate_all)
+            if not diffs:
+                logger.info("No default choices to synchronize.")
+                return diffs
+
+            deleted = [choice.pk for diff in diffs.values() for choice in diff.deleted]
+            updated = [choice for diff in diffs.values() for choice in diff.updated]
+            created = [choice for diff in diffs.values() for choice in diff.created]
+            if deleted:
+                ChoiceModel._delete_choices(list(diffs), pk__in=deleted)
+            renamed = [choice for diff in diffs.values() for choice in diff.renamed]
+            if renamed:
+                cls._release_names(renamed)
+            if updated:
+                ChoiceModel._update_choices(updated, fields=SYNC_FIELDS)
+            if created:
+                ChoiceModel._create_choices(created)
+
+            logger.info(
+                f"Synchronized {len(diffs)} groups: {len(created)} created, "
+                f"{len(updated)} updated and {len(deleted)} deleted choices."
+            )
+
+        cls.invalidate_many([group for group, diff in diffs.items() if diff.has_changes])
+        return diffs
+
+    @classmethod
+    def _release_names(cls, choices: list[Any]) -> None:
+        # Move the choices to unique temporary names first, so swapped names never collide
+        names = [choice.name for choice in choices]
+        for choice in choices:
+            choice.name = f"~{choice.pk}"
+        ChoiceModel._update_choices(choices, fields=["name"])
+        for choice, name in zip(choices, names, strict=True):
+            choice.name = name
 
-            ChoiceModel._create_choices(choice_instances)
-            logger.info(f"Synchronized {len(cls._defaults)} groups and {len(choice_instances)} choices.")
+    @classmethod
+    async def async_defaults(
+        cls, group_names: list[str] | None = None, recreate_defaults: bool = True, recreate_all: bool = False
+    ) -> dict[str, ChoiceDiff]:
+        """Asynchronous version of `sync_defaults`.
+
+        Since transactions are not supported in async code, the synchronization runs in a
+        worker thread, and still applies every change within a single transaction.
+        """
+        return await sync_to_async(cls.sync_defaults)(group_names, recreate_defaults, recreate_all)
+
+    @classmethod
+    def invalidate_many(cls, group_names: Iterable[str], partition: Any = None) -> None:
+        """Invalidate the dynamic choice cache of several groups with a single cache round-trip.
+
+        If `partition` is given, only the variants of the groups for that partition are
+        invalidated. Otherwise, every variant of the groups is invalidated, including the
+        ones of every partition.
+        """
+        cls._invalidate_partitions((group_name, partition) for group_name in group_names)
+
+    @classmethod
+    async def ainvalidate_many(cls, group_names: Iterable[str], partition: Any = None) -> None:
+        """Asynchronous version of `invalidate_many`."""
+        partitions = cls._invalidated_now((group_name, partition) for group_name in group_names)
+        if partitions:
+            await cache.adelete_many([generate_generation_key(*item) for item in partitions])
+            cls._forget_groups(partitions)
+
+    @classmethod
+    def _invalidate_partitions(cls, partitions: Iterable[tuple[str, Any]]) -> None:
+        partitions = cls._invalidated_now(partitions)
+        if partitions:
+            cache.delete_many([generate_generation_key(*item) for item in partitions])
+            cls._forget_groups(partitions)
+
+    @classmethod
+    def _invalidated_now(cls, partitions: Iterable[tuple[str, Any]]) -> set[tuple[str, Any]]:
+        # Groups invalidated within a `batch_invalidation` block are deferred until it exits
+        pending = pending_invalidations.get()
+        if pending is not None:
+            pending.update(partitions)
+            return set()
+        return set(partitions)
+
+    @classmethod
+    def _forget_groups(cls, partitions: set[tuple[str, Any]]) -> None:
+        for group_name, partition in partitions:
+            cls._local_cache.delete(generate_generation_key(group_name, partition))
+            cls._record("invalidation", group_name)
+
+        snapshot = pinned_groups.get()
+        if snapshot is not None:
+            # Let the current block see its own changes
+            for group_name, _ in partitions:
+                snapshot.pop(group_name, None)
+
+    @classmethod
+    def invalidate_on_commit(cls, group_name: str, using: str | None = None, partition: Any = None) -> None:
+        """Invalidate the dynamic choice cache of a group once the current transaction commits.
+
+        Groups invalidated within the same transaction are collected and invalidated together
+        with a single cache round-trip. Outside of a transaction, the group is invalidated
+        immediately. If `partition` is given, only its variants of the group are invalidated.
+        """
+        using = using or DEFAULT_DB_ALIAS
+        pending = getattr(cls._commit_invalidations, using, None)
+        if pending is None:
+            pending = set()
+            setattr(cls._commit_invalidations, using, pending)
 
-        for group_name in cls._defaults:
-            cls.invalidate_cache(group_name)
+        pending.add((group_name, partition))
+        # Rolled back transactions discard their callbacks, so one is registered on every call;
+        # the first one to run after a commit flushes every pending group.
+        transaction.on_commit(lambda: cls._flush_commit_invalidations(using), using=using)
+
+    @classmethod
+    def _flush_commit_invalidations(cls, using: str) -> None:
+        pending = getattr(cls._commit_invalidations, using, None)
+        if pending:
+            setattr(cls._commit_invalidations, using, set())
+            cls._invalidate_partitions(pending)
+
+    @classmethod
+    @contextmanager
+    def batch_invalidation(cls, using: str | None = None) -> Iterator[None]:
+        """Collect every group invalidated within the block, and invalidate them once on exit.
+
+        This is useful for scripts and data migrations saving many choices at once. If the
+        block is exited within a transaction, the groups are invalidated once it commits.
+
+        Usage:
+            with ChoiceRegistry.batch_invalidation():
+                for choice in choices:
+                    choice.save()
+        """
+        if pending_invalidations.get() is not None:
+            # Nested batches are flushed by the outermost one
+            yield
+            return
+
+        pending: set[tuple[str, Any]] = set()
+        token = pending_invalidations.set(pending)
+        try:
+            yield
+        finally:
+            pending_invalidations.reset(token)
+            if pending:
+                transaction.on_commit(lambda: cls._invalidate_partitions(pending), using=using)
+
+    @classmethod
+    @contextmanager
+    def snapshot(cls) -> Iterator[None]:
+        """Pin every group looked up within the block, so each is fetched at most once.
+
+        Repeated lookups of a group within the block are answered from memory and always
+        see the same version of it, even if it is invalidated elsewhere in the meantime.
+        Groups invalidated from within the block are fetched again on their next lookup.
+        The `ChoiceSnapshotMiddleware` opens a snapshot for every request.
+
+        Usage:
+            with ChoiceRegistry.snapshot():
+                for ticket in tickets:
+                    ChoiceRegistry.get_label("ticket_status", ticket.status)
+        """
+        if pinned_groups.get() is not None:
+            # Nested snapshots share the outermost one
+            yield
+            return
+
+        token = pinned_groups.set({})
+        try:
+            yield
+        finally:
+            pinned_groups.reset(token)
 
     @classmethod
     def invalidate_cache(cls, group_name: str, **group_filters: Any) -> None:
-        """Invalidate dynamic choice cache from the application."""
-        # Note: This only invalidates the cache for the specific group_name and group_filters.
-        # Invalidating all caches would require tracking all keys, or using a different caching strategy.
-        cache_key = generate_cache_key(group_name, **group_filters)
-        cache.delete(cache_key)
+        """Invalidate dynamic choice cache from the application.
 
-        if cache_key in cls._enum_cache:
-            del cls._enum_cache[cache_key]
+        This replaces the generation of the group, which invalidates every cached variant
+        of it (regardless of `group_filters`) in the shared cache and in all processes.
+        For partitioned choice models, giving the partition in `group_filters` only
+        invalidates the variants of that partition.
+        """
+        partition, _ = ChoiceModel.split_partition(group_filters)
+        cls.invalidate_many([group_name], partition=partition)
+
+    @classmethod
+    async def ainvalidate_cache(cls, group_name: str, **group_filters: Any) -> None:
+        """Asynchronous version of `invalidate_cache`."""
+        partition, _ = ChoiceModel.split_partition(group_filters)
+        await cls.ainvalidate_many([group_name], partition=partition)
@@ -1,10 +1,29 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from rest_framework import serializers
 
+from dbchoices.groups import ChoiceGroup
 from dbchoices.registry import ChoiceRegistry
 
 
+def _label_choices(group: ChoiceGroup) -> Mapping[str, str]:
+    return MappingProxyType({label: label for label in group.values_by_label})
+
+
+def _value_strings(group: ChoiceGroup) -> Mapping[str, str]:
+    return MappingProxyType({value: value for value in group.labels})
+
+
 class ChoiceFieldMixin:
-    """A mixin to provide common functionality for dynamic choice fields."""
+    """A mixin to provide common functionality for dynamic choice fields.
+
+    The choice group is resolved once and then reused by every value the field handles, so
+    serializing a list makes a single registry lookup per field instead of one per row. DRF
+    copies declared fields for every serializer instance, so a group is never reused across
+    serializer passes. The maps built from the group are memoized on the group itself, and
+    are only rebuilt when its generation changes.
+    """
 
     def __init__(self, group_name: str, group_filters: dict | None = None, **kwargs):
         self.group_filters = group_filters or {}
@@ -12,19 +31,39 @@ class ChoiceFieldMixin:
         kwargs["choices"] = group_name  # Overwrite any passed choices
         super().__init__(**kwargs)
 
+    def get_group(self) -> ChoiceGroup:
+        """Return the `ChoiceGroup` the field resolves its choices from."""
+        if self._group is None:
+            self._group = ChoiceRegistry.get_group(self._group_name, **self.group_filters)
+        return self._group
+
+    def set_group(self, group: ChoiceGroup) -> None:
+        """Use an already resolved `ChoiceGroup`, e.g. one fetched alongside other fields."""
+        self._group = group
+
+    def refresh_choices(self) -> bool:
+        """Resolve the choice group again, returning whether it changed since it was last resolved."""
+        previous, self._group = self._group, None
+        return previous is None or self.get_group().generation != previous.generation
+
     @property
     def choices(self):
         """Choices fetched dynamically from the ChoiceRegistry."""
-        choices = ChoiceRegistry.get_choices(self._group_name, **self.group_filters)
+        group = self.get_group()
         if self.from_label:
-            return dict((label, label) for _, label in choices)
-        return dict(choices)
+            return group.derive("drf_label_choices", _label_choices)
+        return group.labels
 
     @choices.setter
     def choices(self, value):
         # This setter is required by DRF ChoiceField but we don't want to allow
         # external setting of choices, so we only capture the group_name here.
         self._group_name = value
+        self._group = None
+
+    @property
+    def group_name(self):
+        return self._group_name
 
     @property
     def grouped_choices(self):
@@ -36,7 +75,19 @@ class ChoiceFieldMixin:
     def choice_strings_to_values(self):
         # This is used to map string representations back to their values
         # This value is populated by DRF internally as part of choice setter.
-        return {str(value): value for value, _ in self.choices.items()}
+        group = self.get_group()
+        if self.from_label:
+            return group.derive("drf_label_choices", _label_choices)
+        return group.derive("drf_value_strings", _value_strings)
+
+    def to_internal_value(self, data):
+        try:
+            return super().to_internal_value(data)
+        except serializers.ValidationError:
+            # The resolved group may predate the submitted choice, so retry once against the latest one
+            if not self.refresh_choices():
+                raise
+            return super().to_internal_value(data)
 
 
 class DynamicChoiceField(ChoiceFieldMixin, serializers.ChoiceField):
@@ -0,0 +1,40 @@
+from dbchoices.fields import get_dynamic_choice_fields
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.rest_framework.fields import ChoiceFieldMixin
+
+
+class DynamicChoiceSerializerMixin:
+    """
+    A serializer mixin that prefetches the choice groups of every dynamic choice field
+    with a single cache round-trip, once per serializer instance. Declared dynamic choice
+    fields then reuse the prefetched groups for every row, without any further lookups.
+
+    Both fields declared with `ChoiceFieldMixin` and, for model serializers, fields generated
+    from a model `DynamicChoiceField` are prefetched.
+    """
+
+    def prefetch_choices(self):
+        if getattr(self, "_choices_prefetched", False):
+            return
+
+        self._choices_prefetched = True
+        choice_fields = [field for field in self.fields.values() if isinstance(field, ChoiceFieldMixin)]
+        model = getattr(getattr(self, "Meta", None), "model", None)
+        if model is not None:
+            choice_fields += [
+                field
+                for field in get_dynamic_choice_fields(model)
+                if field.name in self.fields and not isinstance(self.fields[field.name], ChoiceFieldMixin)
+            ]
+        groups = ChoiceRegistry.prefetch_fields(choice_fields)
+        for field, group in zip(choice_fields, groups, strict=True):
+            if isinstance(field, ChoiceFieldMixin):
+                field.set_group(group)
+
+    def to_representation(self, instance):
+        self.prefetch_choices()
+        return super().to_representation(instance)
+
+    def to_internal_value(self, data):
+        self.prefetch_choices()
+        return super().to_internal_value(data)
@@ -0,0 +1,58 @@
+from typing import Any
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.views import ChoiceSearchAccessMixin
+
+
+class ChoiceSearchView(ChoiceSearchAccessMixin, APIView):
+    """An API view searching and paginating the choices of a group.
+
+    It accepts a `q` query searched in the labels of the group (every choice is listed if it
+    is empty), a `cursor` continuing from a previous page and a `limit`, and responds with:
+
+        {"results": [{"value": value, "label": label}, ...], "next_cursor": value}
+
+    Authentication and permissions follow the DRF settings of the project. On top of them,
+    every request is denied until `group_names` or `permission_required` is set, or their
+    `DBCHOICES_AUTOCOMPLETE_*` settings. Subclass it to narrow down choices with
+    `get_group_filters` (e.g. to the tenant of the request).
+
+    Usage:
+        path("choices/<slug:group_name>/", ChoiceSearchView.as_view(group_names=["ticket_status"]))
+    """
+
+    contains: bool = False
+    """Whether to match labels containing the query anywhere, rather than starting with it."""
+    page_size: int = 50
+    max_page_size: int = 500
+
+    def get(self, request, group_name: str) -> Response:
+        self.check_group_access(request, group_name)
+
+        try:
+            limit = min(int(request.query_params.get("limit", self.page_size)), self.max_page_size)
+            page = ChoiceRegistry.search_choices(
+                group_name,
+                request.query_params.get("q", ""),
+                after=request.query_params.get("cursor") or None,
+                limit=max(limit, 1),
+                contains=self.contains,
+                **self.get_group_filters(request, group_name),
+            )
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)}) from e
+
+        return Response(
+            {
+                "results": [{"value": value, "label": label} for value, label in page.choices],
+                "next_cursor": page.next_cursor,
+            }
+        )
+
+    def get_group_filters(self, request, group_name: str) -> dict[str, Any]:
+        """Return the query filters narrowing down the searched choices."""
+        return {}
@@ -1,5 +1,33 @@
-def invalidate_choice_cache(sender, instance, **kwargs):
+import logging
+
+from django.core.signals import request_started
+
+from dbchoices.conf import choice_settings
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_choice_cache(sender, instance, using=None, **kwargs):
     """Signal handler to invalidate choice cache on model save/delete."""
     from dbchoices.registry import ChoiceRegistry
 
-    ChoiceRegistry.invalidate_cache(instance.group_name)
+    # A choice moved to another group or partition is also invalidated where it was loaded from
+    for group_name, partition in instance.get_cached_layers():
+        if choice_settings.INVALIDATE_ON_COMMIT:
+            # Coalesce invalidations until the writing transaction commits
+            ChoiceRegistry.invalidate_on_commit(group_name, using=using, partition=partition)
+        else:
+            # Editing a shared choice invalidates every partition, and a partitioned one only its own
+            ChoiceRegistry.invalidate_many([group_name], partition=partition)
+
+
+def warm_choice_cache(sender, **kwargs):
+    """One-shot signal handler warming the choice cache before the first request of a process."""
+    from dbchoices.registry import ChoiceRegistry
+
+    request_started.disconnect(dispatch_uid="dbchoices_warm_cache")
+    try:
+        ChoiceRegistry.warm_cache()
+    except Exception:
+        # Warming is an optimization, and must never break the request being served
+        logger.exception("Failed to warm the choice cache.")
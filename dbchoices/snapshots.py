@@ -0,0 +1,56 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from dbchoices.groups import ChoiceGroup
+
+SNAPSHOT_FORMAT = "dbchoices-snapshot"
+SNAPSHOT_VERSION = 1
+
+
+def write_snapshot(path: str | os.PathLike, groups: dict[str, ChoiceGroup]) -> None:
+    """Write choice groups, along with their generation, to a snapshot file.
+
+    The file is written atomically, so processes loading it concurrently never see a
+    partially written snapshot.
+
+    Args:
+        path (str | os.PathLike):
+            The path of the snapshot file.
+        groups (dict[str, ChoiceGroup]):
+            A mapping of group name to its unfiltered `ChoiceGroup`.
+    """
+    path = Path(path)
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "created_at": time.time(),
+        "groups": {name: {"generation": group.generation, "choices": group.choices} for name, group in groups.items()},
+    }
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, prefix=f".{path.name}.", delete=False) as file:
+        json.dump(payload, file, separators=(",", ":"))
+    os.replace(file.name, path)
+
+
+def read_snapshot(path: str | os.PathLike) -> dict[str, ChoiceGroup]:
+    """Read the choice groups of a snapshot file.
+
+    Args:
+        path (str | os.PathLike):
+            The path of the snapshot file.
+
+    Returns:
+        A mapping of group name to its `ChoiceGroup`, tagged with the generation it was exported at.
+    """
+    with open(path) as file:
+        payload = json.load(file)
+
+    if payload.get("format") != SNAPSHOT_FORMAT or payload.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"'{path}' is not a version {SNAPSHOT_VERSION} choice snapshot.")
+
+    return {
+        name: ChoiceGroup(map(tuple, group["choices"]), generation=group["generation"])
+        for name, group in payload["groups"].items()
+    }
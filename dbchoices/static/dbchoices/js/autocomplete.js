@@ -0,0 +1,38 @@
+"use strict";
+{
+    const $ = django.jQuery;
+
+    function init(element) {
+        const $element = $(element);
+        $element.select2({
+            allowClear: $element.data("allow-clear"),
+            placeholder: $element.data("placeholder"),
+            ajax: {
+                url: $element.data("autocomplete-url"),
+                dataType: "json",
+                delay: 250,
+                data: function(params) {
+                    // Pages after the first continue from the cursor of the previous one
+                    const cursor = params.page > 1 ? $element.data("next-cursor") : "";
+                    return {q: params.term || "", cursor: cursor || "", scope: $element.data("autocomplete-scope")};
+                },
+                processResults: function(data) {
+                    $element.data("next-cursor", data.next_cursor);
+                    return {results: data.results, pagination: data.pagination};
+                }
+            }
+        });
+    }
+
+    $(function() {
+        $(".dbchoices-autocomplete").not("[name*=__prefix__]").each(function() {
+            init(this);
+        });
+    });
+
+    document.addEventListener("formset:added", function(event) {
+        $(event.target).find(".dbchoices-autocomplete").each(function() {
+            init(this);
+        });
+    });
+}
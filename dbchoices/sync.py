@@ -0,0 +1,131 @@
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SYNC_FIELDS = ("name", "label", "ordering", "is_system_default")
+"""The fields of an existing choice that are updated from its default definition."""
+
+
+@dataclass
+class ChoiceDiff:
+    """The set of changes needed to bring a choice group in line with its default definitions."""
+
+    group_name: str
+    created: list[Any] = field(default_factory=list)
+    """Choice instances to be inserted."""
+    updated: list[Any] = field(default_factory=list)
+    """Existing choice instances, with their new field values applied."""
+    deleted: list[Any] = field(default_factory=list)
+    """Existing choice instances to be deleted."""
+    changes: dict[str, dict[str, tuple[Any, Any]]] = field(default_factory=dict)
+    """The (old, new) values of every changed field of updated choices, keyed by choice value."""
+    renamed: list[Any] = field(default_factory=list)
+    """Updated choices whose current name is taken by another updated choice, e.g. when names are swapped."""
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+    def counts(self) -> dict[str, int]:
+        return {"created": len(self.created), "updated": len(self.updated), "deleted": len(self.deleted)}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation of the diff."""
+        return {
+            "counts": self.counts(),
+            "created": [_choice_as_dict(choice) for choice in self.created],
+            "updated": [
+                {
+                    "value": choice.value,
+                    "changes": {attr: list(change) for attr, change in self.changes[choice.value].items()},
+                }
+                for choice in self.updated
+            ],
+            "deleted": [_choice_as_dict(choice) for choice in self.deleted],
+        }
+
+
+def _choice_as_dict(choice: Any) -> dict[str, Any]:
+    return {
+        "name": choice.name,
+        "value": choice.value,
+        "label": choice.label,
+        "ordering": choice.ordering,
+        "is_system_default": choice.is_system_default,
+    }
+
+
+def compute_diff(
+    group_name: str,
+    defaults: list[tuple[str, str, str]],
+    existing: list[Any],
+    choice_model: type,
+    recreate_defaults: bool = True,
+    recreate_all: bool = False,
+) -> ChoiceDiff:
+    """Compute the changes needed to bring the `existing` choices of a group in line with its `defaults`.
+
+    Existing choices are matched to their default definition by value, since that is what
+    is stored in referencing rows.
+
+    Args:
+        group_name (str):
+            The name of the choice group.
+        defaults (list[tuple[str, str, str]]):
+            The (name, value, label) default definitions of the group, in order.
+        existing (list[AbstractDynamicChoice]):
+            The choices of the group currently stored in the database.
+        choice_model (type[AbstractDynamicChoice]):
+            The choice model used to build new instances.
+        recreate_defaults (bool):
+            If True, system default choices that are no longer defined are deleted.
+        recreate_all (bool):
+            If True, every choice that is not defined, including user-added ones, is deleted.
+    """
+    diff = ChoiceDiff(group_name)
+    existing_by_value = {choice.value: choice for choice in existing}
+    matched = []
+    for ordering, (name, value, label) in enumerate(defaults):
+        target = {"name": name, "label": label, "ordering": ordering, "is_system_default": True}
+        choice = existing_by_value.pop(value, None)
+        if choice is None:
+            diff.created.append(choice_model(group_name=group_name, value=value, **target))
+        else:
+            matched.append((choice, target))
+
+    for choice in existing_by_value.values():
+        if recreate_all or (recreate_defaults and choice.is_system_default):
+            diff.deleted.append(choice)
+
+    # Names of kept, unmatched choices cannot be claimed without violating uniqueness
+    deleted_ids = {choice.pk for choice in diff.deleted}
+    reserved_names = {choice.name for choice in existing_by_value.values() if choice.pk not in deleted_ids}
+    for choice, target in matched:
+        if target["name"] in reserved_names:
+            target["name"] = choice.name
+        changes = {attr: (getattr(choice, attr), target[attr]) for attr in SYNC_FIELDS}
+        changes = {attr: change for attr, change in changes.items() if change[0] != change[1]}
+        if changes:
+            for attr, (_, new_value) in changes.items():
+                setattr(choice, attr, new_value)
+            diff.updated.append(choice)
+            diff.changes[choice.value] = changes
+
+    # A choice cannot take the name of another one before it is renamed, which a single update cannot order
+    renames = {value: changes["name"] for value, changes in diff.changes.items() if "name" in changes}
+    new_names = {new_name for _, new_name in renames.values()}
+    diff.renamed = [
+        choice for choice in diff.updated if choice.value in renames and renames[choice.value][0] in new_names
+    ]
+
+    # Matched choices may keep their name when their default one is reserved, which new choices cannot claim
+    taken_names = reserved_names | {choice.name for choice, _ in matched}
+    for choice in diff.created:
+        if choice.name in taken_names:
+            logger.warning(
+                f"Choice '{choice.name}' in group '{group_name}' conflicts with an existing choice and will be skipped."
+            )
+    diff.created = [choice for choice in diff.created if choice.name not in taken_names]
+    return diff
@@ -0,0 +1,104 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import IO, Any
+
+TRANSFER_FORMATS = ("ndjson", "csv")
+TRANSFER_FIELDS = ("group_name", "name", "value", "label", "ordering", "is_system_default", "is_hidden")
+"""The fields of a choice written to and read from transfer files, along with its partition if any."""
+IMPORT_FIELDS = ("name", "label", "ordering", "is_system_default", "is_hidden")
+"""The fields of an existing choice that are updated from an imported row."""
+
+
+def infer_format(path: str) -> str:
+    """Return the transfer format matching the extension of `path`, defaulting to NDJSON."""
+    return "csv" if str(path).lower().endswith(".csv") else "ndjson"
+
+
+def write_choices(
+    file: IO[str], fields: tuple[str, ...], rows: Iterable[tuple], file_format: str = "ndjson", header: bool = True
+) -> int:
+    """Write choice rows to a text file, one at a time.
+
+    Args:
+        file (IO[str]):
+            The text file to write to.
+        fields (tuple[str, ...]):
+            The field names of the rows, written as the CSV header or as NDJSON keys.
+        rows (Iterable[tuple]):
+            The rows to write, in the order of `fields`. They are consumed lazily.
+        file_format (str):
+            Either `ndjson` (one JSON object per line) or `csv`.
+        header (bool):
+            Whether to write the CSV header, e.g. False when appending to a file.
+
+    Returns:
+        The number of rows written.
+    """
+    count = 0
+    if file_format == "csv":
+        writer = csv.writer(file)
+        if header:
+            writer.writerow(fields)
+        for row in rows:
+            writer.writerow(["" if item is None else _csv_value(item) for item in row])
+            count += 1
+        return count
+
+    _check_format(file_format)
+    for row in rows:
+        file.write(json.dumps(dict(zip(fields, row, strict=True)), separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def read_choices(file: IO[str], file_format: str = "ndjson") -> Iterator[dict[str, Any]]:
+    """Read choice rows from a text file, one at a time.
+
+    Rows are returned as dicts with `ordering` as an integer and `is_system_default` and
+    `is_hidden` as booleans. Other fields are returned as-is, with empty CSV cells as None.
+
+    Args:
+        file (IO[str]):
+            The text file to read from.
+        file_format (str):
+            Either `ndjson` (one JSON object per line) or `csv`.
+    """
+    if file_format == "csv":
+        rows = ({key: value if value != "" else None for key, value in row.items()} for row in csv.DictReader(file))
+    else:
+        _check_format(file_format)
+        rows = (json.loads(line) for line in file if line.strip())
+
+    for line_number, row in enumerate(rows, start=1):
+        missing = [field for field in ("group_name", "name", "value") if not row.get(field)]
+        if missing:
+            raise ValueError(f"Row {line_number} is missing the required fields {missing}.")
+        row["label"] = row.get("label") or row["value"]
+        row["ordering"] = int(row.get("ordering") or 0)
+        row["is_system_default"] = _parse_bool(row.get("is_system_default"))
+        row["is_hidden"] = _parse_bool(row.get("is_hidden"))
+        yield row
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most `size` items, consuming it lazily."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _check_format(file_format: str) -> None:
+    if file_format not in TRANSFER_FORMATS:
+        raise ValueError(f"Unknown transfer format '{file_format}', expected one of {TRANSFER_FORMATS}.")
+
+
+def _csv_value(value: Any) -> Any:
+    return int(value) if isinstance(value, bool) else value
+
+
+def _parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from dbchoices.views import ChoiceAutocompleteView
+
+app_name = "dbchoices"
+
+urlpatterns = [
+    path("autocomplete/<slug:group_name>/", ChoiceAutocompleteView.as_view(), name="autocomplete"),
+]
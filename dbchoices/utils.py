@@ -1,8 +1,10 @@
 import json
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from django.apps import apps
 from django.conf import settings
+from django.utils.text import slugify
 
 if TYPE_CHECKING:
     from dbchoices.models import AbstractDynamicChoice
@@ -25,12 +27,36 @@ def get_choice_model() -> type["AbstractDynamicChoice"]:
     return apps.get_model(model_label, require_ready=False)
 
 
-def generate_cache_key(group_name: str, **filters) -> str:
-    """Generate a cache key for storing/retrieving choices."""
-    cache_key = f"dbchoice:{group_name}"
+def generate_cache_key(group_name: str, partition: Any = None, **filters) -> str:
+    """Generate a cache key for storing/retrieving choices.
+
+    Keys of partitioned choices (e.g. per tenant) are namespaced by their partition.
+    """
+    cache_key = f"dbchoice:{group_name}" if partition is None else f"dbchoice:{group_name}@{partition}"
 
     if filters:
         filter_items = tuple((k, str(v)) for k, v in filters.items())
         return cache_key + ":" + json.dumps(sorted(filter_items), separators=(",", ":"))
 
     return cache_key
+
+
+def generate_generation_key(group_name: str, partition: Any = None) -> str:
+    """Generate the cache key holding the current generation of a choice group.
+
+    Every cached variant of a group is tagged with this generation, so replacing it
+    invalidates all of them at once. Partitions of a group have a generation of their
+    own, so they can be invalidated independently.
+    """
+    if partition is None:
+        return f"dbchoice:{group_name}:generation"
+    return f"dbchoice:{group_name}@{partition}:generation"
+
+
+@lru_cache(maxsize=4096)
+def generate_member_name(value: str) -> str:
+    """Generate a valid enum member name from a choice value (e.g. 'In Progress' -> 'IN_PROGRESS')."""
+    member_name = slugify(str(value)).replace("-", "_").upper()
+    if not member_name or member_name[0].isdigit():
+        member_name = f"K_{member_name}"
+    return member_name
@@ -17,8 +17,8 @@ class DynamicChoiceValidator:
 
     def __call__(self, value):
         # Retrieve the valid values from the registry and validate
-        choices = ChoiceRegistry.get_choices(self.group_name, **self.group_filters)
-        if not any(str(value) == str(valid_value) for valid_value, _ in choices):
+        group = ChoiceRegistry.get_group(self.group_name, **self.group_filters)
+        if value not in group:
             raise ValidationError(f"'{value}' is not a valid choice.", code="invalid_choice_group")
 
     def __eq__(self, other):
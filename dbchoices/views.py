@@ -0,0 +1,124 @@
+from collections.abc import Iterable
+from typing import Any
+
+from django.core import signing
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, JsonResponse
+from django.views import View
+
+from dbchoices.conf import choice_settings
+from dbchoices.registry import ChoiceRegistry
+
+SCOPE_SALT = "dbchoices.autocomplete"
+
+
+def sign_scope(group_name: str, group_filters: dict[str, Any] | None = None) -> str:
+    """Sign the group and filters searched by an autocomplete widget, so clients cannot alter them.
+
+    Model instances given as filters, e.g. a tenant, are signed as their primary key.
+    """
+    filters = {key: getattr(value, "pk", value) for key, value in (group_filters or {}).items()}
+    return signing.dumps({"group_name": group_name, "group_filters": filters}, salt=SCOPE_SALT, compress=True)
+
+
+def load_scope(scope: str) -> tuple[str, dict[str, Any]]:
+    """Return the `(group_name, group_filters)` signed by `sign_scope`, or raise `signing.BadSignature`."""
+    data = signing.loads(scope, salt=SCOPE_SALT)
+    return data["group_name"], data["group_filters"]
+
+
+class ChoiceSearchAccessMixin:
+    """Restrict the choice groups a view can search, denying every request unless configured.
+
+    Groups can be searched once they are allowed by `group_names`, or once users are required
+    to have `permission_required`, or both.
+    """
+
+    group_names: Iterable[str] | None = None
+    """The groups that can be searched. Defaults to `DBCHOICES_AUTOCOMPLETE_GROUPS`."""
+    permission_required: str | Iterable[str] | None = None
+    """The permissions required to search groups. Defaults to `DBCHOICES_AUTOCOMPLETE_PERMISSION`."""
+
+    def get_group_names(self) -> Iterable[str] | None:
+        return self.group_names if self.group_names is not None else choice_settings.AUTOCOMPLETE_GROUPS
+
+    def get_permission_required(self) -> tuple[str, ...]:
+        permissions = self.permission_required
+        if permissions is None:
+            permissions = choice_settings.AUTOCOMPLETE_PERMISSION
+        if permissions is None:
+            return ()
+        return (permissions,) if isinstance(permissions, str) else tuple(permissions)
+
+    def check_group_access(self, request: HttpRequest, group_name: str) -> None:
+        """Raise `Http404` if `group_name` cannot be searched, or `PermissionDenied` if the user may not."""
+        group_names = self.get_group_names()
+        permissions = self.get_permission_required()
+        if group_names is None and not permissions:
+            raise PermissionDenied("Searching choice groups requires an allowlist of groups or a permission.")
+        if group_names is not None and group_name not in group_names:
+            raise Http404(f"Choice group '{group_name}' cannot be searched.")
+        if permissions and not request.user.has_perms(permissions):
+            raise PermissionDenied(f"Searching choice group '{group_name}' is not permitted.")
+
+
+class ChoiceAutocompleteView(ChoiceSearchAccessMixin, View):
+    """A JSON view searching the choices of a group, page by page, for `ChoiceAutocompleteWidget`.
+
+    It accepts a `q` query searched in the labels of the group, a `cursor` continuing from a
+    previous page and a `limit`, and responds with the format expected by select2:
+
+        {"results": [{"id": value, "text": label}, ...], "pagination": {"more": bool}, "next_cursor": value}
+
+    Requests must also carry the `scope` signed by the widget, so the choices are narrowed
+    down by the `group_filters` of its field. Every request is denied until `group_names` or
+    `permission_required` is set, or their `DBCHOICES_AUTOCOMPLETE_*` settings. Subclass it
+    to narrow down choices further with `get_group_filters` (e.g. to the tenant of the request).
+    """
+
+    contains: bool = False
+    """Whether to match labels containing the query anywhere, rather than starting with it."""
+    page_size: int = 20
+    max_page_size: int = 100
+
+    def get(self, request: HttpRequest, group_name: str) -> JsonResponse:
+        self.check_group_access(request, group_name)
+
+        try:
+            scoped_group_name, group_filters = load_scope(request.GET.get("scope", ""))
+        except signing.BadSignature:
+            return JsonResponse({"error": "Invalid scope."}, status=400)
+        if scoped_group_name != group_name:
+            return JsonResponse({"error": "Invalid scope."}, status=400)
+
+        try:
+            limit = min(int(request.GET.get("limit", self.page_size)), self.max_page_size)
+        except ValueError:
+            return JsonResponse({"error": "Invalid limit."}, status=400)
+
+        try:
+            page = ChoiceRegistry.search_choices(
+                group_name,
+                request.GET.get("q", ""),
+                after=request.GET.get("cursor") or None,
+                limit=max(limit, 1),
+                contains=self.contains,
+                **(group_filters | self.get_group_filters(request, group_name)),
+            )
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=400)
+
+        return JsonResponse(
+            {
+                "results": [{"id": value, "text": label} for value, label in page.choices],
+                "pagination": {"more": page.next_cursor is not None},
+                "next_cursor": page.next_cursor,
+            }
+        )
+
+    def get_group_filters(self, request: HttpRequest, group_name: str) -> dict[str, Any]:
+        """Return the query filters narrowing down the searched choices, on top of the signed ones."""
+        return {}
+
+
+__all__ = ["ChoiceAutocompleteView", "ChoiceSearchAccessMixin", "load_scope", "sign_scope"]
@@ -0,0 +1,70 @@
+from typing import Any
+
+from django import forms
+from django.urls import reverse
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.views import sign_scope
+
+SELECT2_JS = ("admin/js/vendor/jquery/jquery.min.js", "admin/js/vendor/select2/select2.full.min.js")
+SELECT2_CSS = ("admin/css/vendor/select2/select2.min.css", "admin/css/autocomplete.css")
+
+
+class ChoiceAutocompleteWidget(forms.Select):
+    """A select widget searching the choices of a group as the user types.
+
+    Only the selected choice is rendered with the form, and the others are fetched page by
+    page from the autocomplete view, so forms and the admin stay light for groups of any
+    size. It uses the select2 library shipped with `django.contrib.admin`, which must be
+    installed, and requires the `dbchoices.urls` to be included in the URLconf.
+
+    The group and its filters are signed into the rendered select, so the view searches the
+    same choices the field accepts, and clients cannot search others.
+
+    Args:
+        group_name (str):
+            The name of the choice group to search.
+        group_filters (dict | None):
+            Query filters narrowing down the choices, which must be JSON serializable or model instances.
+        url (str | None):
+            The URL of the autocomplete view. Defaults to the `dbchoices:autocomplete` view.
+        attrs (dict | None):
+            HTML attributes of the select element.
+    """
+
+    def __init__(
+        self, group_name: str, group_filters: dict | None = None, url: str | None = None, attrs: dict | None = None
+    ):
+        super().__init__(attrs)
+        self.group_name = group_name
+        self.group_filters = group_filters or {}
+        self.url = url
+
+    class Media:
+        js = (*SELECT2_JS, "admin/js/jquery.init.js", "dbchoices/js/autocomplete.js")
+        css = {"screen": SELECT2_CSS}
+
+    def get_url(self) -> str:
+        return self.url or reverse("dbchoices:autocomplete", args=[self.group_name])
+
+    def build_attrs(self, base_attrs: dict, extra_attrs: dict | None = None) -> dict:
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs.setdefault("class", "")
+        attrs["class"] = f"{attrs['class']} dbchoices-autocomplete".strip()
+        attrs["data-autocomplete-url"] = self.get_url()
+        attrs["data-autocomplete-scope"] = sign_scope(self.group_name, self.group_filters)
+        attrs["data-allow-clear"] = "false" if self.is_required else "true"
+        attrs["data-placeholder"] = ""
+        return attrs
+
+    def optgroups(self, name: str, value: list[Any], attrs: dict | None = None) -> list:
+        # Only the selected choices are rendered, the others are searched for on demand
+        group = ChoiceRegistry.get_group(self.group_name, **self.group_filters)
+        selected = [str(item) for item in value if item not in (None, "")]
+        options = [] if self.is_required and selected else [self.create_option(name, "", "", not selected, 0)]
+        for index, item in enumerate(selected, start=1):
+            options.append(self.create_option(name, item, group.get_label(item, item), True, index))
+        return [(None, options, 0)]
+
+
+__all__ = ["ChoiceAutocompleteWidget"]
@@ -1,7 +1,8 @@
 from django.db import models
 
 from dbchoices.fields import DynamicChoiceField
-from dbchoices.models import AbstractDynamicChoice
+from dbchoices.models import AbstractDynamicChoice, choice_lookup_index
+from dbchoices.query import DynamicChoiceManager
 
 
 class CustomChoiceModel(AbstractDynamicChoice):
@@ -12,10 +13,27 @@ class CustomChoiceModel(AbstractDynamicChoice):
         verbose_name_plural = "Custom Choices"
 
 
+class Tenant(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class TenantChoice(AbstractDynamicChoice):
+    """A choice model partitioned per tenant, choices with no tenant being shared"""
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE, null=True, blank=True)
+
+    partition_field = "tenant"
+
+    class Meta:
+        indexes = [choice_lookup_index("tenant")]
+
+
 class Ticket(models.Model):
     title = models.CharField(max_length=200)
     status = DynamicChoiceField("ticket_status", max_length=50)
     genre = DynamicChoiceField("ticket_genre", group_filters={"is_system_default": True}, null=True, blank=True)
 
+    objects = DynamicChoiceManager()
+
     def __str__(self):
         return self.title
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from dbchoices.rest_framework.fields import DynamicChoiceField
+from dbchoices.rest_framework.serializers import DynamicChoiceSerializerMixin
 from tests.models import Ticket
 
 
@@ -24,3 +25,7 @@ class TicketSerializerWithField(serializers.ModelSerializer):
     class Meta:
         model = Ticket
         fields = ("id", "title", "status", "genre")
+
+
+class PrefetchedTicketSerializer(DynamicChoiceSerializerMixin, TicketSerializerWithField):
+    """Ticket serializer prefetching all dynamic choice groups"""
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 from rest_framework.exceptions import ValidationError
 
+from dbchoices.registry import ChoiceRegistry
 from dbchoices.rest_framework.fields import DynamicChoiceField, DynamicMultipleChoiceField
 from dbchoices.utils import get_choice_model
 from tests.base import BaseTestCase
@@ -63,6 +66,40 @@ class TestDRFDynamicChoiceField(BaseTestCase):
         assert "open" in field.choices
         assert "new_default" not in field.choices
 
+    def test_group_resolved_once_for_many_values(self, register_status):
+        field = DynamicChoiceField(group_name="ticket_status")
+        with patch.object(ChoiceRegistry, "get_group", wraps=ChoiceRegistry.get_group) as mock_get_group:
+            for _ in range(10):
+                assert field.to_representation("open") == "open"
+                assert field.run_validation("closed") == "closed"
+
+        assert mock_get_group.call_count == 1
+
+    def test_maps_shared_until_group_changes(self, register_status):
+        first = DynamicChoiceField(group_name="ticket_status")
+        second = DynamicChoiceField(group_name="ticket_status")
+        assert first.choice_strings_to_values is second.choice_strings_to_values
+
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        third = DynamicChoiceField(group_name="ticket_status")
+        assert third.choice_strings_to_values is not first.choice_strings_to_values
+        assert third.choice_strings_to_values == first.choice_strings_to_values
+
+    def test_refresh_choices(self, register_status):
+        field = DynamicChoiceField(group_name="ticket_status")
+        field.get_group()
+        assert not field.refresh_choices()
+
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        assert field.refresh_choices()
+
+    def test_from_label_validation(self, register_status):
+        field = DynamicChoiceField(group_name="ticket_status", from_label=True)
+        label = ChoiceRegistry.get_label("ticket_status", "open")
+        assert field.run_validation(label) == label
+        with pytest.raises(ValidationError):
+            field.run_validation("open")
+
 
 @pytest.mark.django_db
 class TestDRFDynamicMultipleChoiceField:
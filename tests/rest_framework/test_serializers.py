@@ -0,0 +1,45 @@
+from unittest.mock import patch
+
+import pytest
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+from tests.models import Ticket
+from tests.rest_framework import serializers
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.mark.django_db
+class TestDynamicChoiceSerializerMixin(BaseTestCase):
+    def test_prefetch_choices_once_per_serializer(self, register_status, register_ticket_genre):
+        Ticket.objects.create(title="Test 1", status="open")
+        Ticket.objects.create(title="Test 2", status="closed")
+
+        serializer = serializers.PrefetchedTicketSerializer(Ticket.objects.all(), many=True)
+        with patch.object(ChoiceRegistry, "prefetch_fields", wraps=ChoiceRegistry.prefetch_fields) as mock_prefetch:
+            data = serializer.data
+
+        assert [row["status"] for row in data] == ["open", "closed"]
+        assert mock_prefetch.call_count == 1
+        prefetched = {field.group_name for field in mock_prefetch.call_args.args[0]}
+        assert prefetched == {"ticket_status", "ticket_genre"}
+
+    def test_prefetched_validation_without_queries(self, register_status, register_ticket_genre):
+        serializer = serializers.PrefetchedTicketSerializer(data={"title": "Test", "status": "open"})
+        serializer.prefetch_choices()
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            assert serializer.is_valid(), serializer.errors
+            assert mock_filter.call_count == 0, "Choices should have been prefetched"
+
+    def test_prefetched_groups_reused_for_every_row(self, register_status, register_ticket_genre):
+        for i in range(5):
+            Ticket.objects.create(title=f"Test {i}", status="open")
+
+        serializer = serializers.PrefetchedTicketSerializer(Ticket.objects.all(), many=True)
+        with patch.object(ChoiceRegistry, "get_group", wraps=ChoiceRegistry.get_group) as mock_get_group:
+            data = serializer.data
+
+        assert [row["status"] for row in data] == ["open"] * 5
+        assert mock_get_group.call_count == 0
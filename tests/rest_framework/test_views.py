@@ -0,0 +1,40 @@
+import pytest
+from django.test import override_settings
+
+from tests.base import BaseTestCase
+
+
+@pytest.fixture
+def searchable():
+    with override_settings(DBCHOICES_AUTOCOMPLETE_GROUPS=["ticket_status"]):
+        yield
+
+
+@pytest.mark.django_db
+class TestChoiceSearchView(BaseTestCase):
+    def test_search(self, client, register_status, searchable):
+        response = client.get("/api/choices/ticket_status/", {"q": "RE"}, HTTP_ACCEPT="application/json")
+        assert response.status_code == 200
+        assert response.json() == {"results": [{"value": "resolved", "label": "RESOLVED"}], "next_cursor": None}
+
+    def test_pages(self, client, register_status, searchable):
+        response = client.get("/api/choices/ticket_status/", {"limit": 2}, HTTP_ACCEPT="application/json")
+        assert response.json()["next_cursor"] == "in_progress"
+
+        response = client.get(
+            "/api/choices/ticket_status/", {"limit": 2, "cursor": "in_progress"}, HTTP_ACCEPT="application/json"
+        )
+        assert [result["value"] for result in response.json()["results"]] == ["resolved", "closed"]
+        assert response.json()["next_cursor"] is None
+
+    def test_invalid_cursor(self, client, register_status, searchable):
+        response = client.get("/api/choices/ticket_status/", {"cursor": "missing"}, HTTP_ACCEPT="application/json")
+        assert response.status_code == 400
+
+    def test_denied_by_default(self, client, register_status):
+        response = client.get("/api/choices/ticket_status/", HTTP_ACCEPT="application/json")
+        assert response.status_code == 403
+
+    def test_group_outside_of_allowlist(self, client, register_status, searchable):
+        response = client.get("/api/choices/ticket_genre/", HTTP_ACCEPT="application/json")
+        assert response.status_code == 404
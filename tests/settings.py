@@ -62,6 +62,8 @@ TEMPLATES = [
     },
 ]
 
+STATIC_URL = "static/"
+
 USE_TZ = True
 TIME_ZONE = "UTC"
 
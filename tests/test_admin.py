@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from django.contrib import admin
+
+from dbchoices.admin import DynamicChoiceFieldsAdminMixin
+from dbchoices.registry import ChoiceRegistry
+from tests.models import Ticket
+
+
+class TicketAdmin(DynamicChoiceFieldsAdminMixin, admin.ModelAdmin):
+    pass
+
+
+class TestDynamicChoiceFieldsAdminMixin:
+    def test_prefetch_choices(self):
+        model_admin = TicketAdmin(Ticket, admin.site)
+        with patch.object(ChoiceRegistry, "prefetch_fields") as mock_prefetch:
+            model_admin.prefetch_choices()
+
+        prefetched = [field.name for field in mock_prefetch.call_args.args[0]]
+        assert prefetched == ["status", "genre"]
+
+    def test_views_prefetch_choices(self):
+        model_admin = TicketAdmin(Ticket, admin.site)
+        with (
+            patch.object(TicketAdmin, "prefetch_choices") as mock_prefetch,
+            patch.object(admin.ModelAdmin, "changelist_view"),
+            patch.object(admin.ModelAdmin, "changeform_view"),
+        ):
+            model_admin.changelist_view(None)
+            model_admin.changeform_view(None)
+
+        assert mock_prefetch.call_count == 2
@@ -0,0 +1,130 @@
+import pytest
+from django import forms
+from django.contrib.auth.models import Permission
+from django.test import override_settings
+
+from dbchoices.fields import DynamicChoiceField
+from dbchoices.forms import DynamicAutocompleteField
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+from dbchoices.views import load_scope, sign_scope
+from dbchoices.widgets import ChoiceAutocompleteWidget
+from tests.base import BaseTestCase
+
+DynamicChoice = get_choice_model()
+
+
+URL = "/dbchoices/autocomplete/ticket_status/"
+
+
+@pytest.fixture
+def searchable():
+    with override_settings(DBCHOICES_AUTOCOMPLETE_GROUPS=["ticket_status", "ticket_genre"]):
+        yield
+
+
+@pytest.mark.django_db
+class TestChoiceAutocompleteView(BaseTestCase):
+    def search(self, client, group_name="ticket_status", group_filters=None, **params):
+        scope = sign_scope(group_name, group_filters)
+        return client.get(f"/dbchoices/autocomplete/{group_name}/", {"scope": scope, **params})
+
+    def test_search(self, client, register_status, searchable):
+        response = self.search(client, q="in")
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [{"id": "in_progress", "text": "IN_PROGRESS"}],
+            "pagination": {"more": False},
+            "next_cursor": None,
+        }
+
+    def test_pages(self, client, register_status, searchable):
+        response = self.search(client, limit=3)
+        assert response.json()["pagination"] == {"more": True}
+
+        response = self.search(client, limit=3, cursor=response.json()["next_cursor"])
+        assert [result["id"] for result in response.json()["results"]] == ["closed"]
+
+    @pytest.mark.parametrize("params", [{"limit": "many"}, {"cursor": "missing"}])
+    def test_invalid_parameters(self, client, register_status, searchable, params):
+        assert self.search(client, **params).status_code == 400
+
+    def test_applies_signed_group_filters(self, client, register_ticket_genre, searchable):
+        DynamicChoice.objects.create(group_name="ticket_genre", name="KIDS", value="kids", label="Kids")
+        response = self.search(client, "ticket_genre", {"is_system_default": True}, q="k")
+        assert response.json()["results"] == []
+        response = self.search(client, "ticket_genre", q="k")
+        assert response.json()["results"] == [{"id": "kids", "text": "Kids"}]
+
+    @pytest.mark.parametrize("scope", ["", "tampered", sign_scope("ticket_genre")])
+    def test_rejects_invalid_scopes(self, client, register_status, searchable, scope):
+        assert client.get(URL, {"scope": scope}).status_code == 400
+
+    def test_denies_access_by_default(self, client, register_status):
+        assert self.search(client).status_code == 403
+
+    def test_denies_groups_outside_of_allowlist(self, client, register_status):
+        with override_settings(DBCHOICES_AUTOCOMPLETE_GROUPS=["ticket_genre"]):
+            assert self.search(client).status_code == 404
+
+    def test_requires_permission(self, client, django_user_model, register_status):
+        user = django_user_model.objects.create_user("editor")
+        with override_settings(DBCHOICES_AUTOCOMPLETE_PERMISSION="dbchoices.view_dynamicchoice"):
+            assert self.search(client).status_code == 403
+
+            client.force_login(user)
+            assert self.search(client).status_code == 403
+
+            user.user_permissions.add(Permission.objects.get(codename="view_dynamicchoice"))
+            client.force_login(django_user_model.objects.get(pk=user.pk))
+            assert self.search(client).status_code == 200
+
+
+@pytest.mark.django_db
+class TestAutocompleteFormField(BaseTestCase):
+    def test_model_field_builds_autocomplete_form_field(self, register_status):
+        field = DynamicChoiceField("ticket_status", max_length=50, autocomplete=True).formfield(widget=forms.TextInput)
+        assert isinstance(field, DynamicAutocompleteField)
+        assert isinstance(field.widget, ChoiceAutocompleteWidget)
+        assert field.clean("open") == "open"
+        with pytest.raises(forms.ValidationError, match="not one of the available choices"):
+            field.clean("missing")
+
+    def test_widget_only_renders_selected_choice(self, register_status):
+        widget = ChoiceAutocompleteWidget("ticket_status")
+        widget.is_required = True
+        html = widget.render("status", "resolved")
+        assert 'data-autocomplete-url="/dbchoices/autocomplete/ticket_status/"' in html
+        assert '<option value="resolved" selected>RESOLVED</option>' in html
+        assert "open" not in html
+        assert "dbchoices/js/autocomplete.js" in str(widget.media)
+
+    def test_widget_signs_group_filters(self, register_ticket_genre):
+        field = DynamicChoiceField("ticket_genre", group_filters={"is_system_default": True}, autocomplete=True)
+        widget = field.formfield().widget
+        scope = widget.build_attrs({})["data-autocomplete-scope"]
+        assert load_scope(scope) == ("ticket_genre", {"is_system_default": True})
+
+    def test_widget_renders_blank_choice(self, register_status):
+        html = ChoiceAutocompleteWidget("ticket_status").render("status", None)
+        assert '<option value="" selected></option>' in html
+
+
+@pytest.mark.django_db
+class TestSearchChoices(BaseTestCase):
+    def test_search_choices(self, register_status):
+        assert ChoiceRegistry.search_choices("ticket_status", "c").choices == [("closed", "CLOSED")]
+        assert ChoiceRegistry.search_choices("ticket_status", "o", contains=True).choices == [
+            ("open", "OPEN"),
+            ("in_progress", "IN_PROGRESS"),
+            ("resolved", "RESOLVED"),
+            ("closed", "CLOSED"),
+        ]
+
+    def test_get_choices_page(self, register_status):
+        page = ChoiceRegistry.get_choices_page("ticket_status", limit=2)
+        assert page.choices == [("open", "OPEN"), ("in_progress", "IN_PROGRESS")]
+        assert ChoiceRegistry.get_choices_page("ticket_status", page.next_cursor).choices == [
+            ("resolved", "RESOLVED"),
+            ("closed", "CLOSED"),
+        ]
@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from dbchoices.cache import CacheEntry, LocalCache, jitter_timeout
+
+
+class TestLocalCache:
+    def test_get_missing_returns_default(self):
+        local_cache = LocalCache(max_size=2)
+        assert local_cache.get("missing") is None
+        assert local_cache.get("missing", default=[]) == []
+
+    def test_set_and_get(self):
+        local_cache = LocalCache(max_size=2)
+        local_cache.set("key", [("open", "Open")])
+        assert local_cache.get("key") == [("open", "Open")]
+
+    def test_evicts_least_recently_used(self):
+        local_cache = LocalCache(max_size=2)
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        local_cache.get("a")  # Mark "a" as recently used
+        local_cache.set("c", 3)
+
+        assert local_cache.get("a") == 1
+        assert local_cache.get("b") is None, "Least recently used entry should be evicted"
+        assert local_cache.get("c") == 3
+
+    def test_entries_expire_after_timeout(self):
+        local_cache = LocalCache(max_size=2, timeout=5)
+        with patch("dbchoices.cache.time.monotonic", return_value=100):
+            local_cache.set("key", 1)
+
+        with patch("dbchoices.cache.time.monotonic", return_value=104):
+            assert local_cache.get("key") == 1
+
+        with patch("dbchoices.cache.time.monotonic", return_value=105):
+            assert local_cache.get("key") is None
+        assert len(local_cache) == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        local_cache = LocalCache(max_size=0)
+        local_cache.set("key", 1)
+        assert local_cache.get("key") is None
+
+    def test_delete_and_clear(self):
+        local_cache = LocalCache(max_size=4)
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+
+        local_cache.delete("a")
+        assert "a" not in local_cache
+        assert "b" in local_cache
+
+        local_cache.clear()
+        assert len(local_cache) == 0
+
+
+class TestCacheEntry:
+    def test_should_refresh_far_from_expiry(self):
+        entry = CacheEntry(generation=1, payload=[], expires_at=1000, delta=0.01)
+        with patch("dbchoices.cache.time.time", return_value=100):
+            assert not entry.should_refresh()
+
+    def test_should_refresh_after_expiry(self):
+        entry = CacheEntry(generation=1, payload=[], expires_at=1000, delta=0.01)
+        with patch("dbchoices.cache.time.time", return_value=1000):
+            assert entry.should_refresh()
+
+    def test_should_refresh_expensive_entry_close_to_expiry(self):
+        entry = CacheEntry(generation=1, payload=[], expires_at=1000, delta=5)
+        with (
+            patch("dbchoices.cache.time.time", return_value=999),
+            patch("dbchoices.cache.random.random", return_value=0.5),
+        ):
+            assert entry.should_refresh()
+
+    def test_should_refresh_disabled(self):
+        entry = CacheEntry(generation=1, payload=[], expires_at=1000, delta=5)
+        with patch("dbchoices.cache.time.time", return_value=1000):
+            assert not entry.should_refresh(beta=0)
+
+
+class TestJitterTimeout:
+    def test_jitter_timeout_bounds(self):
+        for _ in range(100):
+            assert 90 <= jitter_timeout(100, 0.1) <= 100
+
+    def test_jitter_timeout_disabled(self):
+        assert jitter_timeout(100, 0) == 100
+        assert jitter_timeout(None, 0.1) is None
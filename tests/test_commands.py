@@ -0,0 +1,95 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.mark.django_db
+class TestDbchoicesCommand(BaseTestCase):
+    def test_sync_reports_changes(self, register_status):
+        ChoiceRegistry.register_defaults("ticket_status", [("OPEN", "open", "Open"), ("NEW", "new", "New")])
+        stdout = StringIO()
+        call_command("dbchoices", "--sync", "ticket_status", "--recreate-defaults", stdout=stdout)
+        assert "1 created, 1 updated, 3 deleted" in stdout.getvalue()
+
+    def test_plan_outputs_json(self, register_status):
+        ChoiceRegistry.register_defaults("ticket_status", [("OPEN", "open", "Open"), ("NEW", "new", "New")])
+        stdout = StringIO()
+        call_command("dbchoices", "--plan", "ticket_status", "--recreate-defaults", stdout=stdout)
+
+        plan = json.loads(stdout.getvalue())
+        assert plan["totals"] == {"created": 1, "updated": 1, "deleted": 3}
+        group_plan = plan["groups"]["ticket_status"]
+        assert [choice["value"] for choice in group_plan["created"]] == ["new"]
+        assert group_plan["updated"] == [{"value": "open", "changes": {"label": ["OPEN", "Open"]}}]
+        assert {choice["value"] for choice in group_plan["deleted"]} == {"in_progress", "resolved", "closed"}
+
+    def test_plan_does_not_write(self, register_status):
+        ChoiceRegistry.register_defaults("ticket_status", [("NEW", "new", "New")])
+        call_command("dbchoices", "--plan", "ticket_status", "--recreate-all", stdout=StringIO())
+        assert DynamicChoice.objects.filter(group_name="ticket_status").count() == 4
+        assert not DynamicChoice.objects.filter(group_name="ticket_status", value="new").exists()
+
+    def test_warm(self, register_status, register_ticket_genre):
+        stdout = StringIO()
+        call_command("dbchoices", "--warm", "ticket_status", "ticket_genre", stdout=stdout)
+        assert "Warmed the cache of 2 groups" in stdout.getvalue()
+
+    def test_export_snapshot(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        stdout = StringIO()
+        call_command("dbchoices", "--export-snapshot", str(path), stdout=stdout)
+        assert "Exported" in stdout.getvalue()
+        assert "ticket_status" in json.loads(path.read_text())["groups"]
+
+    def test_export_snapshot_default_path(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        with override_settings(DBCHOICES_SNAPSHOT_PATH=str(path)):
+            call_command("dbchoices", "--export-snapshot", stdout=StringIO())
+        assert path.exists()
+
+    def test_export_snapshot_without_path(self):
+        with pytest.raises(CommandError, match="No snapshot path given"):
+            call_command("dbchoices", "--export-snapshot", stdout=StringIO())
+
+    def test_export_and_import(self, register_status, tmp_path):
+        path = tmp_path / "choices.csv"
+        stderr = StringIO()
+        call_command("dbchoices", "--export", str(path), "--group", "ticket_status", stderr=stderr)
+        assert "Exported 4 choices" in stderr.getvalue()
+        assert path.read_text().startswith("group_name,name,value,label")
+
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").delete()
+        stderr = StringIO()
+        call_command("dbchoices", "--import", str(path), "--chunk-size", "2", stderr=stderr)
+        assert "Imported 4 choices..." in stderr.getvalue()
+        assert "Imported 1 new and 3 updated choices" in stderr.getvalue()
+        assert DynamicChoice.objects.filter(group_name="ticket_status").count() == 4
+
+    def test_export_to_stdout(self, register_status):
+        stdout = StringIO()
+        call_command("dbchoices", "--export", "-", stdout=stdout, stderr=StringIO())
+        assert [json.loads(line)["group_name"] for line in stdout.getvalue().splitlines()] == ["ticket_status"] * 4
+
+    def test_import_invalid_file(self, tmp_path):
+        path = tmp_path / "choices.ndjson"
+        path.write_text('{"value": "open"}\n')
+        with pytest.raises(CommandError, match="missing the required fields"):
+            call_command("dbchoices", "--import", str(path), stderr=StringIO())
+
+    def test_stats(self, register_status):
+        ChoiceRegistry.get_group("ticket_status")
+        stdout = StringIO()
+        call_command("dbchoices", "--stats", "--top", "1", stdout=stdout)
+
+        stats = json.loads(stdout.getvalue())
+        assert stats["totals"]["invalidation"]["count"] >= 1
+        assert len(stats["heaviest_by_traffic"]) == 1
@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from django.core.cache import caches
+from django.test import override_settings
+
+from dbchoices.conf import choice_settings, lazy_class_attribute
+from dbchoices.payloads import PickleSerializer
+from dbchoices.registry import ChoiceModel, ChoiceRegistry, cache
+from tests.models import CustomChoiceModel
+
+
+def record_metric(event, group_name, value):
+    pass
+
+
+class TestChoiceSettings:
+    def test_defaults(self):
+        assert choice_settings.LOCAL_CACHE_TIMEOUT == 0
+        assert choice_settings.CACHE_TIMEOUT == 60  # From the test settings
+
+    def test_follows_overrides(self):
+        with override_settings(DBCHOICES_CACHE_TIMEOUT=5):
+            assert choice_settings.CACHE_TIMEOUT == 5
+        assert choice_settings.CACHE_TIMEOUT == 60
+
+    def test_imports_dotted_paths(self):
+        with override_settings(
+            DBCHOICES_PAYLOAD_SERIALIZER="dbchoices.payloads.PickleSerializer",
+            DBCHOICES_METRICS_HOOK="tests.test_conf.record_metric",
+        ):
+            assert isinstance(choice_settings.PAYLOAD_SERIALIZER, PickleSerializer)
+            assert choice_settings.METRICS_HOOK is record_metric
+
+    def test_rejects_unknown_settings(self):
+        with pytest.raises(AttributeError, match="Invalid dbchoices setting"):
+            choice_settings.UNKNOWN  # noqa: B018
+
+
+class TestLazyResolution:
+    def test_registry_imports_without_settings(self):
+        env = {key: value for key, value in os.environ.items() if key != "DJANGO_SETTINGS_MODULE"}
+        script = "import dbchoices.fields, dbchoices.registry"
+        result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)  # noqa: S603
+        assert result.returncode == 0, result.stderr
+
+    def test_cache_follows_alias_override(self):
+        other = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "dbchoices-other"}
+        with override_settings(CACHES={"default": other | {"LOCATION": "default"}, "other": other}):
+            with override_settings(DBCHOICES_CACHE_ALIAS="other"):
+                cache.set("dbchoices-test", 1)
+                assert caches["other"].get("dbchoices-test") == 1
+            assert caches["default"].get("dbchoices-test") is None
+
+    def test_choice_model_follows_setting(self):
+        assert ChoiceModel._meta.label == "dbchoices.DynamicChoice"
+        with override_settings(DBCHOICE_MODEL="tests.CustomChoiceModel"):
+            assert ChoiceModel._meta.model is CustomChoiceModel
+            assert isinstance(ChoiceModel(group_name="status"), CustomChoiceModel)
+
+    def test_lazy_class_attribute(self):
+        built = []
+        lazy = lazy_class_attribute(lambda: built.append(1) or len(built))
+
+        class Holder:
+            value = lazy
+
+        assert Holder.value == 1
+        assert Holder.value == 1
+        assert Holder.__dict__["value"] == 1
+        assert built == [1]
+
+        lazy.reset()
+        assert Holder.value == 2
+
+    def test_registry_attributes_follow_overrides(self):
+        local_cache, metrics = ChoiceRegistry._local_cache, ChoiceRegistry._metrics
+        with override_settings(DBCHOICES_LOCAL_CACHE_SIZE=7, DBCHOICES_METRICS_HOOK="tests.test_conf.record_metric"):
+            assert ChoiceRegistry._local_cache.max_size == 7
+            assert ChoiceRegistry._metrics.hook is record_metric
+        assert ChoiceRegistry._local_cache.max_size == local_cache.max_size
+        assert ChoiceRegistry._metrics.hook is metrics.hook
+
+    def test_registry_attributes_survive_unrelated_overrides(self):
+        local_cache = ChoiceRegistry._local_cache
+        with override_settings(DBCHOICES_CACHE_TIMEOUT=5):
+            assert ChoiceRegistry._local_cache is local_cache
@@ -50,3 +50,11 @@ class TestDynamicChoiceField(BaseTestCase):
 
         assert "genre" in exc_info.value.error_dict, "Expected 'genre' to be in error dict"
         assert "status" not in exc_info.value.error_dict, "Did not expect 'status' to be in error dict"
+
+    def test_get_display(self, register_status, register_ticket_genre):
+        DynamicChoice.objects.create(group_name="ticket_genre", value="kids", label="Kids")
+        assert Ticket(status="resolved").get_status_display() == "RESOLVED"
+        assert Ticket(status="unknown").get_status_display() == "unknown"
+        # Choices outside of the group filters are displayed as their value
+        assert Ticket(genre="comedy").get_genre_display() == "COMEDY"
+        assert Ticket(genre="kids").get_genre_display() == "kids"
@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+import pytest
+from django import forms
+
+from dbchoices.forms import DynamicChoiceFormMixin
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+from tests.models import Ticket
+
+DynamicChoice = get_choice_model()
+
+
+def make_form_class(*field_names):
+    # Model forms resolve their choices at class creation, which requires database access
+    class TicketForm(DynamicChoiceFormMixin, forms.ModelForm):
+        class Meta:
+            model = Ticket
+            fields = ("title", *field_names)
+
+    return TicketForm
+
+
+@pytest.mark.django_db
+class TestDynamicChoiceFormMixin(BaseTestCase):
+    def test_form_prefetches_dynamic_fields(self, register_status, register_ticket_genre):
+        TicketForm = make_form_class("status", "genre")
+        with patch.object(ChoiceRegistry, "prefetch_fields") as mock_prefetch:
+            TicketForm()
+
+        prefetched = [field.name for field in mock_prefetch.call_args.args[0]]
+        assert prefetched == ["status", "genre"]
+
+    def test_form_only_prefetches_included_fields(self, register_status):
+        TicketStatusForm = make_form_class("status")
+        with patch.object(ChoiceRegistry, "prefetch_fields") as mock_prefetch:
+            TicketStatusForm()
+
+        prefetched = [field.name for field in mock_prefetch.call_args.args[0]]
+        assert prefetched == ["status"]
+
+    def test_form_renders_choices_without_queries(self, register_status, register_ticket_genre):
+        form = make_form_class("status", "genre")()
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            assert "in_progress" in str(form["status"])
+            assert mock_filter.call_count == 0, "Choices should have been prefetched"
+
+    def test_form_refreshes_choices(self, register_status):
+        TicketForm = make_form_class("status")
+        DynamicChoice.objects.create(group_name="ticket_status", name="CUSTOM", value="custom", label="Custom")
+        assert "custom" in dict(TicketForm().fields["status"].choices)
+
+    def test_form_validation(self, register_status):
+        TicketForm = make_form_class("status")
+        assert TicketForm(data={"title": "Test", "status": "open"}).is_valid()
+        assert not TicketForm(data={"title": "Test", "status": "invalid"}).is_valid()
@@ -0,0 +1,93 @@
+import pytest
+
+from dbchoices.groups import ChoiceGroup, ChoiceLayer, ChoicePage
+
+
+class TestChoiceGroup:
+    def test_choices_preserve_order(self):
+        group = ChoiceGroup([("b", "Bee"), ("a", "Ay")])
+        assert group.choices == (("b", "Bee"), ("a", "Ay"))
+        assert tuple(group) == group.choices
+        assert len(group) == 2
+
+    def test_is_immutable(self):
+        group = ChoiceGroup([("a", "Ay")])
+        with pytest.raises(TypeError):
+            group.labels["b"] = "Bee"
+        with pytest.raises(AttributeError):
+            group.choices.append(("b", "Bee"))
+
+    def test_get_label(self):
+        group = ChoiceGroup([("open", "Open"), ("closed", "Closed")])
+        assert group.get_label("open") == "Open"
+        assert group.get_label("missing") is None
+        assert group.get_label("missing", default="fallback") == "fallback"
+
+    def test_get_value(self):
+        group = ChoiceGroup([("open", "Open"), ("closed", "Closed")])
+        assert group.get_value("Closed") == "closed"
+        assert group.get_value("missing") is None
+
+    def test_duplicate_labels_resolve_to_first_value(self):
+        group = ChoiceGroup([("a", "Same"), ("b", "Same")])
+        assert group.get_value("Same") == "a"
+
+    def test_membership_compares_string_values(self):
+        group = ChoiceGroup([("1", "One"), ("2", "Two")])
+        assert 1 in group
+        assert "2" in group
+        assert 3 not in group
+        assert group.values == frozenset({"1", "2"})
+
+
+class TestChoiceGroupPages:
+    GROUP = ChoiceGroup([(f"v{i}", label) for i, label in enumerate(["Peach", "apple", "Pear", "Banana", "plum"])])
+
+    def test_page_follows_cursor(self):
+        assert self.GROUP.page(limit=2) == ChoicePage([("v0", "Peach"), ("v1", "apple")], "v1")
+        assert self.GROUP.page("v1", limit=2) == ChoicePage([("v2", "Pear"), ("v3", "Banana")], "v3")
+        assert self.GROUP.page("v3", limit=2) == ChoicePage([("v4", "plum")], None)
+
+    def test_page_rejects_unknown_cursor(self):
+        with pytest.raises(ValueError, match="Unknown cursor"):
+            self.GROUP.page("missing")
+
+    def test_search_prefix_is_case_insensitive_and_alphabetical(self):
+        assert self.GROUP.search("P").choices == [("v0", "Peach"), ("v2", "Pear"), ("v4", "plum")]
+        assert self.GROUP.search("pea", limit=1) == ChoicePage([("v0", "Peach")], "v0")
+        assert self.GROUP.search("pea", "v0", limit=1) == ChoicePage([("v2", "Pear")], None)
+        assert self.GROUP.search("kiwi").choices == []
+
+    def test_search_contains(self):
+        page = self.GROUP.search("an", contains=True)
+        assert page == ChoicePage([("v3", "Banana")], None)
+        assert self.GROUP.search("a", "v1", limit=1, contains=True) == ChoicePage([("v2", "Pear")], "v2")
+
+    def test_search_without_query_pages_the_group(self):
+        assert self.GROUP.search("", limit=2) == self.GROUP.page(limit=2)
+
+
+class TestChoiceLayer:
+    SHARED = [("open", "Open", "1", ""), ("closed", "Closed", "2", ""), ("legacy", "Legacy", "3", "1")]
+
+    def test_group_skips_hidden_rows(self):
+        layer = ChoiceLayer(self.SHARED, generation=4)
+        assert layer.group.choices == (("open", "Open"), ("closed", "Closed"))
+        assert layer.group.generation == 4
+        assert layer.group is layer.group
+
+    def test_merge_relabels_in_place(self):
+        merged = ChoiceLayer(self.SHARED).merge(ChoiceLayer([("open", "To do", "1", "")]), generation=7)
+        assert merged.choices == (("open", "To do"), ("closed", "Closed"))
+        assert merged.generation == 7
+
+    def test_merge_hides_adds_and_reorders(self):
+        overrides = ChoiceLayer(
+            [("open", "Open", "1", "1"), ("blocked", "Blocked", "0", ""), ("closed", "Done", "5", "")]
+        )
+        merged = ChoiceLayer(self.SHARED).merge(overrides)
+        assert merged.choices == (("blocked", "Blocked"), ("closed", "Done"))
+
+    def test_merge_without_overrides(self):
+        layer = ChoiceLayer(self.SHARED)
+        assert layer.merge(ChoiceLayer([])).choices == layer.group.choices
@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+from tests.models import Ticket
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.fixture(autouse=True, params=["case", "subquery"])
+def strategy(request):
+    """Run every test against small groups, and against groups larger than `CASE_MAX_CHOICES`."""
+    if request.param == "case":
+        yield request.param
+        return
+    with patch("dbchoices.lookups.CASE_MAX_CHOICES", 1), patch("dbchoices.query.CASE_MAX_CHOICES", 1):
+        yield request.param
+
+
+@pytest.fixture
+def tickets(register_status, register_ticket_genre):
+    DynamicChoice.objects.filter(group_name="ticket_status", value="in_progress").update(label="Work In Progress")
+    Ticket.objects.create(title="A", status="open", genre="drama")
+    Ticket.objects.create(title="B", status="in_progress", genre="comedy")
+    Ticket.objects.create(title="C", status="closed", genre="horror")
+    Ticket.objects.create(title="D", status="unknown", genre=None)
+
+
+def titles(queryset):
+    return sorted(queryset.values_list("title", flat=True))
+
+
+@pytest.mark.django_db
+class TestLabelLookups(BaseTestCase):
+    @pytest.mark.parametrize(
+        "lookup,value,expected",
+        [
+            ("label", "OPEN", ["A"]),
+            ("label__exact", "open", []),
+            ("label__iexact", "open", ["A"]),
+            ("label__contains", "In", ["B"]),
+            ("label__icontains", "progress", ["B"]),
+            ("label__startswith", "CL", ["C"]),
+            ("label__istartswith", "work", ["B"]),
+            ("label__endswith", "EN", ["A"]),
+            ("label__iendswith", "sed", ["C"]),
+            ("label__in", ["OPEN", "CLOSED", "Missing"], ["A", "C"]),
+        ],
+    )
+    def test_filter_by_label(self, tickets, lookup, value, expected):
+        assert titles(Ticket.objects.filter(**{f"status__{lookup}": value})) == expected
+
+    def test_compiles_to_values(self, tickets, strategy):
+        with CaptureQueriesContext(connection) as queries:
+            list(Ticket.objects.filter(status__label__icontains="o"))
+        sql = queries.captured_queries[-1]["sql"]
+        assert "IN (" in sql
+        assert "CASE" not in sql, "Filtering should not need the label expression"
+        # Large groups select their values in a subquery, rather than binding each of them
+        assert ("IN (SELECT" in sql) == (strategy == "subquery")
+
+    def test_no_matching_labels(self, tickets):
+        assert titles(Ticket.objects.filter(status__label="Missing")) == []
+        assert titles(Ticket.objects.exclude(status__label="Missing")) == ["A", "B", "C", "D"]
+
+    def test_exclude_by_label(self, tickets):
+        assert titles(Ticket.objects.exclude(status__label__in=["OPEN", "CLOSED"])) == ["B", "D"]
+
+    def test_group_filters_respected(self, tickets):
+        DynamicChoice.objects.create(group_name="ticket_genre", name="MUSICAL", value="musical", label="DRAMATIC")
+        Ticket.objects.create(title="E", status="open", genre="musical")
+        assert titles(Ticket.objects.filter(genre__label__startswith="DRAMA")) == ["A"]
+
+    def test_expression_rhs_not_supported(self, tickets):
+        with pytest.raises(ValueError, match="only supports literal values"):
+            list(Ticket.objects.filter(status__label=F("title")))
+
+
+@pytest.mark.django_db
+class TestLabelOrdering(BaseTestCase):
+    def test_order_by_label(self, tickets):
+        queryset = Ticket.objects.order_by("status__label")
+        assert list(queryset.values_list("title", flat=True)) == ["C", "A", "B", "D"]
+
+    def test_order_by_label_descending(self, tickets):
+        queryset = Ticket.objects.order_by("-status__label")
+        assert list(queryset.values_list("title", flat=True)) == ["D", "B", "A", "C"]
+
+    def test_annotate_label(self, tickets):
+        ticket = Ticket.objects.annotate(status_label=F("status__label")).get(title="B")
+        assert ticket.status_label == "Work In Progress"
+
+    def test_large_groups_use_subquery(self, tickets, strategy):
+        sql = str(Ticket.objects.order_by("status__label").query)
+        assert ("CASE" in sql) == (strategy == "case")
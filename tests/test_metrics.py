@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import override_settings
+
+from dbchoices.metrics import STATS_KEY, ChoiceMetrics, merge_counters, summarize_counters
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.fixture
+def metrics():
+    metrics = ChoiceMetrics(flush_interval=None)
+    with patch.object(ChoiceRegistry, "_metrics", metrics):
+        yield metrics
+
+
+def events(metrics: ChoiceMetrics, group_name: str) -> dict[str, int]:
+    return {event: int(count) for event, (count, _, _) in metrics.snapshot().get(group_name, {}).items()}
+
+
+class TestChoiceMetrics:
+    def test_record_aggregates_values(self):
+        metrics = ChoiceMetrics()
+        metrics.record("db_load", "status", 0.5)
+        metrics.record("db_load", "status", 1.5)
+        assert metrics.snapshot() == {"status": {"db_load": [2, 2.0, 1.5]}}
+
+    def test_record_calls_hook(self):
+        hook = MagicMock()
+        ChoiceMetrics(hook=hook).record("local_hit", "status")
+        hook.assert_called_once_with("local_hit", "status", 1.0)
+
+    def test_record_logs_hook_errors(self, caplog):
+        hook = MagicMock(side_effect=ConnectionError)
+        metrics = ChoiceMetrics(hook=hook)
+        with caplog.at_level("WARNING"):
+            metrics.record("local_hit", "status")
+        assert metrics.snapshot() == {"status": {"local_hit": [1, 1.0, 1.0]}}
+        assert any("Failed to forward the choice metric" in record.message for record in caplog.records)
+
+    def test_record_reports_due_flush(self):
+        metrics = ChoiceMetrics(flush_interval=0)
+        assert metrics.record("local_hit", "status") is True
+        assert ChoiceMetrics(flush_interval=None).record("local_hit", "status") is False
+
+    def test_merge_and_summarize(self):
+        first = {"status": {"local_hit": [3, 3, 1], "payload_size": [1, 4, 4]}}
+        second = {"status": {"shared_miss": [1, 1, 1]}, "genre": {"payload_size": [1, 9, 9]}}
+        merged = merge_counters(first, second)
+        assert merged["status"] == {"local_hit": [3, 3, 1], "payload_size": [1, 4, 4], "shared_miss": [1, 1.0, 1]}
+
+        summary = summarize_counters(merged, limit=1)
+        assert summary["totals"]["payload_size"] == {"count": 2, "total": 13.0, "max": 9}
+        assert summary["heaviest_by_size"] == [{"group": "genre", "choices": 9}]
+        assert summary["heaviest_by_traffic"] == [{"group": "status", "lookups": 4}]
+
+
+@pytest.mark.django_db
+class TestRegistryMetrics(BaseTestCase):
+    def test_records_each_tier(self, register_status, metrics):
+        ChoiceRegistry._local_cache.clear()
+        cache.clear()
+        ChoiceRegistry.get_group("ticket_status")  # Loaded from the database
+        ChoiceRegistry.get_group("ticket_status")  # Revalidated against the shared generation
+        ChoiceRegistry._local_cache.clear()
+        ChoiceRegistry.get_group("ticket_status")  # Served by the shared cache
+
+        assert events(metrics, "ticket_status") == {
+            "shared_miss": 1,
+            "db_load": 1,
+            "payload_size": 1,
+            "revalidated": 1,
+            "shared_hit": 1,
+        }
+        assert metrics.snapshot()["ticket_status"]["payload_size"][1] == 4
+
+    def test_records_local_hits(self, register_status, metrics):
+        with override_settings(DBCHOICES_LOCAL_CACHE_TIMEOUT=60):
+            ChoiceRegistry.get_group("ticket_status")
+            ChoiceRegistry.get_group("ticket_status")
+        assert events(metrics, "ticket_status")["local_hit"] == 1
+
+    def test_records_enums_and_invalidations(self, register_status, metrics):
+        ChoiceRegistry.get_enum("ticket_status")
+        ChoiceRegistry.get_enum("ticket_status")
+        ChoiceRegistry.invalidate_cache("ticket_status")
+
+        recorded = events(metrics, "ticket_status")
+        assert recorded["enum_rebuild"] == 1
+        assert recorded["enum_hit"] == 1
+        assert recorded["invalidation"] == 1
+
+    def test_get_stats_merges_flushed_processes(self, register_status, metrics):
+        ChoiceRegistry.get_group("ticket_status")
+        cache.set("dbchoice:stats:other:1:abc", {"ticket_status": {"shared_hit": [2, 2, 1]}})
+        cache.set("dbchoice:stats", {"dbchoice:stats:other:1:abc": 1e12})
+
+        stats = ChoiceRegistry.get_stats()
+        assert stats["ticket_status"]["shared_hit"][0] == 2
+        assert stats["ticket_status"]["db_load"][0] == 1
+
+    def test_failing_hook_does_not_break_lookups(self, register_status):
+        metrics = ChoiceMetrics(hook=MagicMock(side_effect=ConnectionError), flush_interval=None)
+        with patch.object(ChoiceRegistry, "_metrics", metrics):
+            assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+
+    def test_async_lookups_flush_without_blocking(self, register_status):
+        async def lookup():
+            await ChoiceRegistry.aget_choices("ticket_status")
+            await asyncio.gather(*ChoiceRegistry._flush_tasks)
+
+        ChoiceRegistry.get_choices("ticket_status")
+        metrics = ChoiceMetrics(flush_interval=0)
+        with (
+            patch.object(ChoiceRegistry, "_metrics", metrics),
+            patch.object(ChoiceRegistry, "flush_metrics") as mock_flush,
+        ):
+            async_to_sync(lookup)()
+        assert mock_flush.call_count == 0, "Async lookups should not flush synchronously"
+        assert metrics.process_key in cache.get(STATS_KEY)
+
+    def test_flush_errors_are_logged(self, metrics, caplog):
+        with patch("dbchoices.registry.cache") as mock_cache, caplog.at_level("WARNING"):
+            mock_cache.set.side_effect = ConnectionError
+            ChoiceRegistry.flush_metrics()
+        assert any("Failed to flush choice metrics" in record.message for record in caplog.records)
@@ -0,0 +1,48 @@
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from dbchoices.middleware import ChoiceSnapshotMiddleware
+from dbchoices.registry import ChoiceRegistry
+from tests.base import BaseTestCase
+
+
+def label_view(request):
+    labels = [ChoiceRegistry.get_label("ticket_status", value) for value in ("open", "closed", "open")]
+    return HttpResponse(",".join(labels))
+
+
+@pytest.mark.django_db
+class TestChoiceSnapshotMiddleware(BaseTestCase):
+    def test_request_fetches_each_group_once(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        middleware = ChoiceSnapshotMiddleware(label_view)
+        with patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many:
+            response = middleware(RequestFactory().get("/"))
+
+        assert response.content == b"OPEN,CLOSED,OPEN"
+        assert mock_get_many.call_count == 1
+
+    def test_snapshot_dropped_after_request(self, register_status):
+        middleware = ChoiceSnapshotMiddleware(label_view)
+        middleware(RequestFactory().get("/"))
+        with patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many:
+            ChoiceRegistry.get_label("ticket_status", "open")
+
+        assert mock_get_many.call_count == 1
+
+    def test_async_request(self, register_status):
+        async def async_view(request):
+            return await sync_to_async(label_view)(request)
+
+        ChoiceRegistry.get_choices("ticket_status")
+        middleware = ChoiceSnapshotMiddleware(async_view)
+        with patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many:
+            response = async_to_sync(middleware)(RequestFactory().get("/"))
+
+        assert response.content == b"OPEN,CLOSED,OPEN"
+        assert mock_get_many.call_count == 1
@@ -1,6 +1,7 @@
 import pytest
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
 
+from dbchoices.models import choice_lookup_index
 from dbchoices.utils import get_choice_model
 from tests.base import BaseTestCase
 
@@ -79,3 +80,15 @@ class TestDynamicChoiceModel(BaseTestCase):
         DynamicChoice._delete_choices(["enum1"], is_system_default=True)
         assert DynamicChoice.objects.filter(group_name="enum1").count() == 1
         assert DynamicChoice.objects.filter(group_name="enum2").count() == 1
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="The query plan format is backend specific")
+    def test_lookup_query_uses_covering_index(self):
+        index_name = DynamicChoice._meta.indexes[0].name
+        queryset = DynamicChoice.get_many_choices(["status", "priority"]).values_list("group_name", "value", "label")
+        plan = queryset.explain()
+        assert f"COVERING INDEX {index_name}" in plan, plan
+
+    def test_choice_lookup_index_leading_fields(self):
+        index = choice_lookup_index("tenant", name="tenant_lookup_idx")
+        assert index.fields == ["tenant", "group_name", "ordering", "value", "label"]
+        assert index.name == "tenant_lookup_idx"
@@ -0,0 +1,191 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from dbchoices.query import choice_label
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.signals import invalidate_choice_cache
+from dbchoices.utils import generate_cache_key, generate_generation_key
+from tests.base import BaseTestCase
+from tests.models import Tenant, TenantChoice, Ticket
+
+
+@pytest.fixture
+def tenants():
+    acme, globex = Tenant.objects.create(name="Acme"), Tenant.objects.create(name="Globex")
+    TenantChoice.objects.bulk_create(
+        [
+            TenantChoice(group_name="status", name="OPEN", value="open", label="Open", ordering=1),
+            TenantChoice(group_name="status", name="CLOSED", value="closed", label="Closed", ordering=2),
+            TenantChoice(group_name="status", name="OPEN", value="open", label="To do", ordering=3, tenant=acme),
+            TenantChoice(group_name="status", name="BLOCKED", value="blocked", label="Blocked", tenant=acme),
+        ]
+    )
+    with patch("dbchoices.registry.ChoiceModel", TenantChoice):
+        ChoiceRegistry._local_cache.clear()
+        yield acme, globex
+    ChoiceRegistry._local_cache.clear()
+
+
+@pytest.mark.django_db
+class TestPartitionedChoices(BaseTestCase):
+    def test_partition_keys_are_namespaced(self):
+        assert generate_cache_key("status", 1) == "dbchoice:status@1"
+        assert generate_generation_key("status", 1) == "dbchoice:status@1:generation"
+        assert generate_cache_key("status") == "dbchoice:status"
+
+    def test_split_partition(self, tenants):
+        acme, _ = tenants
+        assert TenantChoice.split_partition({"tenant": acme, "is_system_default": True}) == (
+            acme.pk,
+            {"is_system_default": True},
+        )
+        assert TenantChoice.split_partition({"tenant_id": acme.pk}) == (acme.pk, {})
+
+    def test_merges_partition_choices_over_shared_ones(self, tenants):
+        acme, globex = tenants
+        with CaptureQueriesContext(connection) as queries:
+            choices = ChoiceRegistry.get_choices("status", tenant=acme)
+        assert len(queries.captured_queries) == 2, "The shared layer and the overrides are loaded separately"
+        assert choices == [("blocked", "Blocked"), ("closed", "Closed"), ("open", "To do")]
+
+        with CaptureQueriesContext(connection) as queries:
+            assert ChoiceRegistry.get_choices("status", tenant=globex) == [("open", "Open"), ("closed", "Closed")]
+        assert len(queries.captured_queries) == 1, "The shared layer should be reused by every partition"
+        assert ChoiceRegistry.get_choices("status") == [("open", "Open"), ("closed", "Closed")]
+
+    def test_caches_only_the_overrides_of_a_partition(self, tenants):
+        acme, _ = tenants
+        ChoiceRegistry.get_choices("status", tenant=acme)
+
+        entry = ChoiceRegistry._decode_entry(cache.get(generate_cache_key("status", acme.pk)))
+        assert [row[0] for row in entry.payload] == ["blocked", "open"]
+        entry = ChoiceRegistry._decode_entry(cache.get(generate_cache_key("status")))
+        assert [row[0] for row in entry.payload] == ["open", "closed"]
+
+    def test_partition_can_hide_and_reorder_shared_choices(self, tenants):
+        _, globex = tenants
+        TenantChoice.objects.bulk_create(
+            [
+                TenantChoice(
+                    group_name="status", name="OPEN", value="open", label="Open", is_hidden=True, tenant=globex
+                ),
+                TenantChoice(group_name="status", name="CLOSED", value="closed", label="Done", tenant=globex),
+            ]
+        )
+        assert ChoiceRegistry.get_choices("status", tenant=globex) == [("closed", "Done")]
+        assert ChoiceRegistry.get_choices("status") == [("open", "Open"), ("closed", "Closed")]
+
+    def test_merged_groups_are_kept_until_a_layer_changes(self, tenants):
+        acme, _ = tenants
+        group = ChoiceRegistry.get_group("status", tenant=acme)
+        assert ChoiceRegistry.get_group("status", tenant=acme) is group
+
+        ChoiceRegistry.invalidate_cache("status")
+        assert ChoiceRegistry.get_group("status", tenant=acme) is not group
+
+    def test_invalidating_a_partition_keeps_the_others(self, tenants):
+        acme, globex = tenants
+        ChoiceRegistry.get_choices("status", tenant=acme)
+        ChoiceRegistry.get_choices("status", tenant=globex)
+        ChoiceRegistry.get_choices("status")
+
+        ChoiceRegistry.invalidate_cache("status", tenant=acme)
+        with CaptureQueriesContext(connection) as queries:
+            ChoiceRegistry.get_choices("status", tenant=globex)
+            ChoiceRegistry.get_choices("status")
+        assert len(queries.captured_queries) == 0, "Other partitions should stay cached"
+
+        with CaptureQueriesContext(connection) as queries:
+            ChoiceRegistry.get_choices("status", tenant=acme)
+        assert len(queries.captured_queries) == 1
+
+    def test_invalidating_shared_choices_invalidates_every_partition(self, tenants):
+        acme, globex = tenants
+        ChoiceRegistry.get_choices("status", tenant=acme)
+        ChoiceRegistry.get_choices("status", tenant=globex)
+
+        ChoiceRegistry.invalidate_cache("status")
+        with CaptureQueriesContext(connection) as queries:
+            ChoiceRegistry.get_choices("status", tenant=acme)
+            ChoiceRegistry.get_choices("status", tenant=globex)
+        assert len(queries.captured_queries) == 1, "Only the shared layer should be reloaded"
+
+    def test_signal_invalidates_the_partition_of_the_choice(self, tenants):
+        acme, globex = tenants
+        shared_generation = ChoiceRegistry.get_generation("status")
+        acme_generation = ChoiceRegistry.get_generation("status", acme.pk)
+        globex_generation = ChoiceRegistry.get_generation("status", globex.pk)
+
+        choice = TenantChoice.objects.get(value="blocked")
+        choice.label = "On hold"
+        choice.save()
+        invalidate_choice_cache(sender=TenantChoice, instance=choice)
+
+        assert ChoiceRegistry.get_generation("status") == shared_generation
+        assert ChoiceRegistry.get_generation("status", globex.pk) == globex_generation
+        assert ChoiceRegistry.get_generation("status", acme.pk) != acme_generation
+        assert ("blocked", "On hold") in ChoiceRegistry.get_choices("status", tenant=acme)
+
+    def test_signal_invalidates_the_previous_partition_of_moved_choices(self, tenants):
+        acme, globex = tenants
+        post_save.connect(invalidate_choice_cache, sender=TenantChoice, dispatch_uid="test_partitions_move")
+        try:
+            assert ("closed", "Closed") in ChoiceRegistry.get_choices("status", tenant=globex)
+            assert ("blocked", "Blocked") in ChoiceRegistry.get_choices("status", tenant=acme)
+
+            # From the shared layer to a partition
+            choice = TenantChoice.objects.get(value="closed")
+            choice.tenant = acme
+            choice.save()
+            assert ChoiceRegistry.get_choices("status") == [("open", "Open")]
+            assert ChoiceRegistry.get_choices("status", tenant=globex) == [("open", "Open")]
+
+            # From a partition to another one
+            choice = TenantChoice.objects.get(value="blocked")
+            choice.tenant = globex
+            choice.save()
+            assert ("blocked", "Blocked") not in ChoiceRegistry.get_choices("status", tenant=acme)
+            assert ("blocked", "Blocked") in ChoiceRegistry.get_choices("status", tenant=globex)
+        finally:
+            post_save.disconnect(sender=TenantChoice, dispatch_uid="test_partitions_move")
+
+    def test_batch_invalidation_of_partitions(self, tenants, django_capture_on_commit_callbacks):
+        acme, globex = tenants
+        globex_generation = ChoiceRegistry.get_generation("status", globex.pk)
+        acme_generation = ChoiceRegistry.get_generation("status", acme.pk)
+        with django_capture_on_commit_callbacks(execute=True), ChoiceRegistry.batch_invalidation():
+            ChoiceRegistry.invalidate_cache("status", tenant=acme)
+            assert ChoiceRegistry.get_generation("status", acme.pk) == acme_generation
+
+        assert ChoiceRegistry.get_generation("status", acme.pk) != acme_generation
+        assert ChoiceRegistry.get_generation("status", globex.pk) == globex_generation
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("strategy", ["case", "subquery"])
+class TestPartitionedLabels(BaseTestCase):
+    @pytest.fixture
+    def tickets(self, tenants):
+        acme, _ = tenants
+        TenantChoice.objects.create(
+            group_name="status", name="CLOSED", value="closed", label="-", tenant=acme, is_hidden=True
+        )
+        for status in ("open", "closed", "blocked"):
+            Ticket.objects.create(title=status, status=status)
+        with patch("dbchoices.query.get_choice_model", return_value=TenantChoice):
+            yield acme
+
+    def labels(self, strategy, **group_filters):
+        label = choice_label("status", "status", group_filters, strategy=strategy)
+        return dict(Ticket.objects.annotate(label=label).values_list("status", "label"))
+
+    def test_shared_labels(self, tickets, strategy):
+        assert self.labels(strategy) == {"open": "Open", "closed": "Closed", "blocked": "blocked"}
+
+    def test_partition_labels(self, tickets, strategy):
+        assert self.labels(strategy, tenant=tickets) == {"open": "To do", "closed": "closed", "blocked": "Blocked"}
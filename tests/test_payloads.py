@@ -0,0 +1,56 @@
+import pytest
+
+from dbchoices.payloads import CompactSerializer, PickleSerializer
+
+CHOICES = [("open", "Open"), ("in_progress", "In progress"), ("", ""), ("résolu", "Résolu ✓")]
+
+
+class TestCompactSerializer:
+    @pytest.mark.parametrize("compress_threshold", [None, 0], ids=["plain", "compressed"])
+    def test_round_trip(self, compress_threshold):
+        serializer = CompactSerializer(compress_threshold=compress_threshold)
+        payload = serializer.dumps(CHOICES)
+        assert payload[:1] == (CompactSerializer.PLAIN if compress_threshold is None else CompactSerializer.COMPRESSED)
+        assert serializer.loads(payload) == CHOICES
+
+    def test_round_trip_empty_group(self):
+        serializer = CompactSerializer()
+        assert serializer.loads(serializer.dumps([])) == []
+
+    def test_round_trip_separator_in_choices(self):
+        serializer = CompactSerializer()
+        choices = [("a\0b", "A"), ("c", "C\0")]
+        payload = serializer.dumps(choices)
+        assert payload[:1] == CompactSerializer.JSON
+        assert serializer.loads(payload) == choices
+
+    def test_compresses_above_threshold(self):
+        choices = [(f"value_{i}", f"Label {i}") for i in range(1_000)]
+        plain = CompactSerializer(compress_threshold=None).dumps(choices)
+        compressed = CompactSerializer(compress_threshold=1024).dumps(choices)
+        assert len(compressed) < len(plain)
+
+    def test_round_trip_of_wider_rows(self):
+        rows = [("open", "Open", "1", ""), ("closed", "Closed", "2", "1")]
+        assert CompactSerializer().loads(CompactSerializer().dumps(rows)) == rows
+
+    def test_loads_interns_strings(self):
+        serializer = CompactSerializer(intern=True)
+        first = serializer.loads(serializer.dumps([("".join(["op", "en"]), "Open")]))
+        second = serializer.loads(serializer.dumps([("".join(["op", "en"]), "Open")]))
+        assert first[0][0] is second[0][0]
+
+    @pytest.mark.parametrize("payload", [[("open", "Open")], b"", b"\x09data"])
+    def test_loads_rejects_foreign_payloads(self, payload):
+        with pytest.raises(ValueError):
+            CompactSerializer().loads(payload)
+
+
+class TestPickleSerializer:
+    def test_round_trip(self):
+        serializer = PickleSerializer()
+        assert serializer.loads(serializer.dumps(CHOICES)) == CHOICES
+
+    def test_loads_rejects_foreign_payloads(self):
+        with pytest.raises(ValueError):
+            PickleSerializer().loads(CompactSerializer().dumps(CHOICES))
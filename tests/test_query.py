@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import FieldError
+from django.db.models import Case
+from django.db.models.functions import Coalesce
+
+from dbchoices.query import annotate_choice_labels, choice_label
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+from tests.models import Ticket
+
+DynamicChoice = get_choice_model()
+
+STRATEGIES = ["case", "subquery", "auto"]
+
+
+@pytest.fixture
+def tickets(register_status, register_ticket_genre):
+    Ticket.objects.create(title="B", status="open", genre="drama")
+    Ticket.objects.create(title="A", status="closed", genre=None)
+    Ticket.objects.create(title="C", status="unknown", genre="comedy")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("strategy", STRATEGIES)
+class TestAnnotateChoiceLabels(BaseTestCase):
+    def test_annotates_labels(self, tickets, strategy):
+        rows = annotate_choice_labels(Ticket.objects.order_by("title"), strategy=strategy)
+        assert [(row.status_label, row.genre_label) for row in rows] == [
+            ("CLOSED", None),
+            ("OPEN", "DRAMA"),
+            ("unknown", "COMEDY"),
+        ]
+
+    def test_order_and_filter_by_label(self, tickets, strategy):
+        queryset = annotate_choice_labels(Ticket.objects.all(), "status", strategy=strategy)
+        assert list(queryset.order_by("-status_label").values_list("title", flat=True)) == ["C", "B", "A"]
+        assert list(queryset.filter(status_label="OPEN").values_list("title", flat=True)) == ["B"]
+
+    def test_labels_resolved_in_single_query(self, tickets, strategy, django_assert_num_queries):
+        queryset = annotate_choice_labels(Ticket.objects.all(), "status", strategy=strategy)
+        with django_assert_num_queries(1):
+            assert len(list(queryset.values_list("status_label", flat=True))) == 3
+
+    def test_group_filters_respected(self, tickets, strategy):
+        DynamicChoice.objects.create(group_name="ticket_genre", name="MUSICAL", value="musical", label="Musical")
+        Ticket.objects.create(title="D", status="open", genre="musical")
+        ticket = annotate_choice_labels(Ticket.objects.filter(title="D"), "genre", strategy=strategy).get()
+        assert ticket.genre_label == "musical", "Choices outside of the field filters should not be resolved"
+
+    def test_hidden_choices_not_resolved(self, tickets, strategy):
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(is_hidden=True)
+        ticket = annotate_choice_labels(Ticket.objects.filter(title="B"), "status", strategy=strategy).get()
+        assert ticket.status_label == "open"
+
+    def test_manager_method(self, tickets, strategy):
+        ticket = Ticket.objects.annotate_choice_labels("status", suffix="_name", strategy=strategy).get(title="B")
+        assert ticket.status_name == "OPEN"
+
+
+@pytest.mark.django_db
+class TestChoiceLabel(BaseTestCase):
+    def test_auto_strategy_by_group_size(self, register_status):
+        assert isinstance(choice_label("status", "ticket_status"), Case)
+        with patch("dbchoices.query.CASE_MAX_CHOICES", 2):
+            assert isinstance(choice_label("status", "ticket_status"), Coalesce)
+
+    def test_unknown_strategy(self, register_status):
+        with pytest.raises(ValueError, match="Unknown label strategy"):
+            choice_label("status", "ticket_status", strategy="join")
+
+    def test_non_choice_field(self):
+        with pytest.raises(FieldError, match="not a DynamicChoiceField"):
+            annotate_choice_labels(Ticket.objects.all(), "title")
@@ -2,13 +2,18 @@ from enum import Enum
 from unittest.mock import patch
 
 import pytest
+from asgiref.sync import async_to_sync
 from django.core.cache import cache
 from django.db import models
+from django.test import override_settings
 
+from dbchoices.cache import CacheEntry, LocalCache
+from dbchoices.conf import choice_settings
 from dbchoices.registry import ChoiceRegistry
-from dbchoices.utils import generate_cache_key, get_choice_model
+from dbchoices.utils import generate_cache_key, generate_generation_key, get_choice_model
 from tests.base import BaseTestCase
 from tests.choices import Status
+from tests.models import Ticket
 
 DynamicChoice = get_choice_model()
 
@@ -82,6 +87,160 @@ class TestChoiceRegistry(BaseTestCase):
             ChoiceRegistry.get_choices("ticket_status")
             assert mock_filter.call_count == 0, "Database should not be accessed again due to caching"
 
+    def test_get_choices_local_cache_skips_shared_cache(self, register_status):
+        with override_settings(DBCHOICES_LOCAL_CACHE_TIMEOUT=60):
+            choices = ChoiceRegistry.get_choices("ticket_status")
+
+            with (
+                patch("dbchoices.registry.cache.get") as mock_get,
+                patch("dbchoices.registry.cache.get_many") as mock_get_many,
+            ):
+                assert ChoiceRegistry.get_choices("ticket_status") == choices
+                assert mock_get.call_count == 0, "Repeat lookups should be served from the local cache"
+                assert mock_get_many.call_count == 0, "Repeat lookups should be served from the local cache"
+
+    def test_get_choices_local_cache_revalidates_generation(self, register_status):
+        choices = ChoiceRegistry.get_choices("ticket_status")
+        with (
+            patch("dbchoices.registry.cache.get_many", wraps=cache.get_many) as mock_get_many,
+            patch.object(DynamicChoice.objects, "filter") as mock_filter,
+        ):
+            assert ChoiceRegistry.get_choices("ticket_status") == choices
+            mock_get_many.assert_called_once_with([generate_generation_key("ticket_status")])
+            assert mock_filter.call_count == 0, "Database should not be accessed for a valid local entry"
+
+    def test_get_choices_returns_copies(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status").append(("extra", "Extra"))
+        ChoiceRegistry.get_many_choices(["ticket_status"])["ticket_status"].clear()
+        assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+        assert len(ChoiceRegistry.get_group("ticket_status")) == 4
+
+    def test_get_choices_skips_hidden_choices(self, register_status):
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(is_hidden=True)
+        assert "open" not in dict(ChoiceRegistry.get_choices("ticket_status"))
+        assert ChoiceRegistry.get_label("ticket_status", "open") is None
+
+    def test_get_choices_local_cache_serves_empty_groups(self):
+        assert ChoiceRegistry.get_choices("nothing") == []
+        with patch("dbchoices.registry.cache.get_many", wraps=cache.get_many) as mock_get_many:
+            assert ChoiceRegistry.get_choices("nothing") == []
+            mock_get_many.assert_called_once_with([generate_generation_key("nothing")])
+
+    def test_get_choices_local_cache_falls_through_to_shared_cache(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")  # Populate the shared cache
+        with (
+            patch.object(ChoiceRegistry, "_local_cache", LocalCache(max_size=8)),
+            patch.object(DynamicChoice.objects, "filter") as mock_filter,
+        ):
+            assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+            assert mock_filter.call_count == 0, "Local cache misses should be served from the shared cache"
+
+    def test_invalidate_cache_clears_local_cache(self, register_status):
+        with override_settings(DBCHOICES_LOCAL_CACHE_TIMEOUT=60):
+            ChoiceRegistry.get_choices("ticket_status")
+            DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+
+            ChoiceRegistry.invalidate_cache("ticket_status")
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+
+    def test_get_many_choices(self, register_status, register_ticket_genre):
+        choices = ChoiceRegistry.get_many_choices(["ticket_status", "ticket_genre", "nonexistent"])
+        assert list(choices) == ["ticket_status", "ticket_genre", "nonexistent"]
+        assert choices["ticket_status"] == ChoiceRegistry.get_choices("ticket_status")
+        assert choices["ticket_genre"] == ChoiceRegistry.get_choices("ticket_genre")
+        assert choices["nonexistent"] == []
+
+    def test_get_many_choices_single_query_and_round_trip(self, register_status, register_ticket_genre):
+        with (
+            patch.object(ChoiceRegistry, "_local_cache", LocalCache(max_size=0)),
+            patch("dbchoices.registry.cache.get_many", wraps=cache.get_many) as mock_get_many,
+            patch("dbchoices.registry.cache.set_many", wraps=cache.set_many) as mock_set_many,
+            patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter,
+        ):
+            ChoiceRegistry.get_many_choices(["ticket_status", "ticket_genre"])
+            assert mock_get_many.call_count == 1, "Cache should be accessed in a single round-trip"
+            assert mock_filter.call_count == 1, "All missing groups should be loaded in a single query"
+            assert mock_set_many.call_count == 1, "All loaded groups should be cached at once"
+
+            mock_filter.reset_mock()
+            ChoiceRegistry.get_many_choices(["ticket_status", "ticket_genre"])
+            assert mock_filter.call_count == 0, "Database should not be accessed again due to caching"
+
+    def test_get_many_choices_with_filters(self, register_status):
+        DynamicChoice.objects.create(group_name="ticket_status", name="CUSTOM", value="custom", label="Custom")
+        choices = ChoiceRegistry.get_many_choices(["ticket_status"], is_system_default=True)
+        assert "custom" not in dict(choices["ticket_status"])
+
+    def test_prefetch_fields(self, register_status, register_ticket_genre):
+        fields = [Ticket._meta.get_field("status"), Ticket._meta.get_field("genre")]
+        with patch.object(ChoiceRegistry, "get_many_groups", wraps=ChoiceRegistry.get_many_groups) as mock_get_many:
+            ChoiceRegistry.prefetch_fields(fields)
+
+        # Fields with different filters are fetched separately
+        assert mock_get_many.call_count == 2
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            ChoiceRegistry.get_choices("ticket_genre", is_system_default=True)
+            assert mock_filter.call_count == 0, "Prefetched groups should be served from the cache"
+
+    def test_get_choices_stores_cache_entry(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        entry = cache.get(generate_cache_key("ticket_status"))
+        assert isinstance(entry, CacheEntry)
+        assert entry.generation == ChoiceRegistry.get_generation("ticket_status")
+        assert len(choice_settings.PAYLOAD_SERIALIZER.loads(entry.payload)) == 4
+
+    def test_get_choices_ignores_entries_of_another_serializer(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        ChoiceRegistry._local_cache.clear()
+        with (
+            override_settings(DBCHOICES_PAYLOAD_SERIALIZER="dbchoices.payloads.PickleSerializer"),
+            patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter,
+        ):
+            assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+            assert mock_filter.call_count == 1, "Unreadable entries should be reloaded"
+
+    def test_get_choices_releases_lock(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        assert cache.get(f"{generate_cache_key('ticket_status')}:lock:{generation}") is None
+
+    def test_get_choices_serves_stale_entry_while_locked(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        ChoiceRegistry.invalidate_cache("ticket_status")
+
+        # Another process is already recomputing the new generation
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        cache.set(f"{generate_cache_key('ticket_status')}:lock:{generation}", True)
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+            assert mock_filter.call_count == 0, "Stale choices should be served instead of querying"
+
+        # Stale groups are never kept locally
+        cache.delete(f"{generate_cache_key('ticket_status')}:lock:{generation}")
+        with patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter:
+            ChoiceRegistry.get_choices("ticket_status")
+            assert mock_filter.call_count == 1
+
+    def test_get_choices_waits_for_lock_without_stale_entry(self, register_status):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        cache.set(f"{generate_cache_key('ticket_status')}:lock:{generation}", True)
+        with (
+            override_settings(DBCHOICES_CACHE_LOCK_WAIT=0.1),
+            patch("dbchoices.registry.time.sleep") as mock_sleep,
+        ):
+            assert len(ChoiceRegistry.get_choices("ticket_status")) == 4
+            assert mock_sleep.call_count > 0, "Should wait for the other process before querying"
+
+    def test_get_choices_early_refresh(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        with (
+            patch.object(ChoiceRegistry, "_local_cache", LocalCache(max_size=0)),
+            patch.object(CacheEntry, "should_refresh", return_value=True),
+            patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter,
+        ):
+            ChoiceRegistry.get_choices("ticket_status")
+            assert mock_filter.call_count == 1, "Entries due for an early refresh should be recomputed"
+
     def test_get_choices_empty_group(self):
         choices = ChoiceRegistry.get_choices("nonexistent")
         assert choices == []
@@ -96,6 +255,23 @@ class TestChoiceRegistry(BaseTestCase):
         label = ChoiceRegistry.get_label("ticket_status", "nonexistent")
         assert label is None
 
+    def test_get_label_with_non_string_value(self):
+        ChoiceRegistry.register_defaults("numbers", [("ONE", 1, "One")])
+        ChoiceRegistry.sync_defaults(["numbers"])
+        assert ChoiceRegistry.get_label("numbers", 1) == "One"
+
+    def test_get_value_finds_match(self, register_status):
+        assert ChoiceRegistry.get_value("ticket_status", "IN_PROGRESS") == "in_progress"
+        assert ChoiceRegistry.get_value("ticket_status", "nonexistent") is None
+
+    def test_get_group_reuses_compiled_group(self, register_status):
+        group1 = ChoiceRegistry.get_group("ticket_status")
+        group2 = ChoiceRegistry.get_group("ticket_status")
+        assert group1 is group2, "Compiled group should only be rebuilt when the group changes"
+
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        assert ChoiceRegistry.get_group("ticket_status") is not group1
+
     def test_get_enum_basic(self, register_status):
         StatusEnum = ChoiceRegistry.get_enum("ticket_status")
         assert issubclass(StatusEnum, models.TextChoices)
@@ -130,6 +306,38 @@ class TestChoiceRegistry(BaseTestCase):
         assert hasattr(StatusEnum, "SYSTEM")
         assert not hasattr(StatusEnum, "CUSTOM")
 
+    def test_get_enum_cache_is_bounded(self, register_status):
+        with patch.object(ChoiceRegistry, "_enum_cache", LocalCache(max_size=2)):
+            for i in range(5):
+                DynamicChoice.objects.create(
+                    group_name="ticket_status", name=f"TENANT_{i}", value=f"t{i}", label="T", is_system_default=True
+                )
+                ChoiceRegistry.get_enum("ticket_status", name=f"TENANT_{i}")
+            assert ChoiceRegistry.enum_cache_info().size == 2
+
+    def test_get_enum_cache_info(self, register_status):
+        before = ChoiceRegistry.enum_cache_info()
+        ChoiceRegistry.get_enum("ticket_status")
+        ChoiceRegistry.get_enum("ticket_status")
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        ChoiceRegistry.get_enum("ticket_status")
+
+        info = ChoiceRegistry.enum_cache_info()
+        assert info.hits - before.hits == 1
+        assert info.rebuilds - before.rebuilds == 2
+        assert info.max_size == ChoiceRegistry._enum_cache.max_size
+
+    def test_get_enum_rebuilt_after_invalidation_from_another_process(self, register_status):
+        enum1 = ChoiceRegistry.get_enum("ticket_status")
+        cache.delete(generate_generation_key("ticket_status"))
+        assert ChoiceRegistry.get_enum("ticket_status") is not enum1
+
+    def test_get_enum_uses_registered_member_names(self, register_status):
+        with patch("dbchoices.registry.generate_member_name") as mock_member_name:
+            StatusEnum = ChoiceRegistry.get_enum("ticket_status")
+            assert mock_member_name.call_count == 0, "Member names should be precomputed at registration"
+        assert StatusEnum.IN_PROGRESS.value == "in_progress"
+
     def test_get_enum_empty_group_raises_error(self):
         with pytest.raises(ValueError, match="No choices found for group"):
             ChoiceRegistry.get_enum("nonexistent")
@@ -186,15 +394,82 @@ class TestChoiceRegistry(BaseTestCase):
         assert DynamicChoice.objects.filter(group_name="ticket_status").count() == 1
         assert not DynamicChoice.objects.filter(group_name="ticket_status", name="NEW_DEFAULT").exists()
 
+    def test_sync_defaults_updates_changed_choices(self, register_status):
+        choice = DynamicChoice.objects.get(group_name="ticket_status", value="open")
+        ChoiceRegistry.register_defaults("ticket_status", [("OPEN", "open", "Open"), ("CLOSED", "closed", "Closed")])
+        ChoiceRegistry.sync_defaults(["ticket_status"])
+
+        assert DynamicChoice.objects.get(pk=choice.pk).label == "Open", "Existing rows should be updated in place"
+        assert ChoiceRegistry.get_choices("ticket_status") == [("open", "Open"), ("closed", "Closed")]
+
+    def test_sync_defaults_swaps_names(self):
+        ChoiceRegistry.register_defaults("swap", [("X", "x"), ("Y", "y"), ("Z", "z")])
+        ChoiceRegistry.sync_defaults(["swap"])
+        ChoiceRegistry.register_defaults("swap", [("Y", "x"), ("Z", "y"), ("X", "z")])
+        diffs = ChoiceRegistry.sync_defaults(["swap"])
+
+        assert len(diffs["swap"].renamed) == 3
+        assert dict(DynamicChoice.objects.filter(group_name="swap").values_list("value", "name")) == {
+            "x": "Y",
+            "y": "Z",
+            "z": "X",
+        }
+
+    def test_sync_defaults_returns_diff(self, register_status):
+        ChoiceRegistry.register_defaults(
+            "ticket_status", [("OPEN", "open", "Open"), ("CLOSED", "closed", "CLOSED"), ("NEW", "new", "NEW")]
+        )
+        diffs = ChoiceRegistry.sync_defaults(["ticket_status"])
+        assert diffs["ticket_status"].counts() == {"created": 1, "updated": 2, "deleted": 2}
+
+    def test_sync_defaults_unchanged_groups_are_not_invalidated(self, register_status):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        with patch.object(DynamicChoice.objects, "bulk_create") as mock_create:
+            diffs = ChoiceRegistry.sync_defaults(["ticket_status"])
+            assert mock_create.call_count == 0
+
+        assert not diffs["ticket_status"].has_changes
+        assert ChoiceRegistry.get_generation("ticket_status") == generation
+
+    def test_warm_cache(self, register_status):
+        DynamicChoice.objects.create(group_name="db_only", name="A", value="a", label="A")
+        group_names = ChoiceRegistry.warm_cache()
+        assert {"ticket_status", "db_only"} <= set(group_names)
+
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            ChoiceRegistry.get_choices("ticket_status")
+            ChoiceRegistry.get_choices("db_only")
+            ChoiceRegistry.get_enum("ticket_status")
+            assert mock_filter.call_count == 0, "Warmed groups should be served from the cache"
+
+    def test_warm_cache_specific_groups(self, register_status, register_ticket_genre):
+        with patch.object(ChoiceRegistry, "get_many_groups", wraps=ChoiceRegistry.get_many_groups) as mock_get_many:
+            assert ChoiceRegistry.warm_cache(["ticket_status"]) == ["ticket_status"]
+        assert mock_get_many.call_args_list[0].args[0] == ["ticket_status"]
+
+    def test_plan_defaults_does_not_write(self, register_status):
+        ChoiceRegistry.register_defaults("ticket_status", [("CUSTOM", "custom", "Custom")])
+        diffs = ChoiceRegistry.plan_defaults(["ticket_status"])
+        assert diffs["ticket_status"].counts() == {"created": 1, "updated": 0, "deleted": 4}
+        assert DynamicChoice.objects.filter(group_name="ticket_status").count() == 4
+
+    def test_invalidate_many(self, register_status, register_ticket_genre):
+        generations = [ChoiceRegistry.get_generation(group) for group in ("ticket_status", "ticket_genre")]
+        ChoiceRegistry.invalidate_many(["ticket_status", "ticket_genre"])
+        assert ChoiceRegistry.get_generation("ticket_status") != generations[0]
+        assert ChoiceRegistry.get_generation("ticket_genre") != generations[1]
+
     def test_invalidate_cache(self, register_status):
-        """Test invalidate_cache clears cache"""
+        """Test invalidate_cache replaces the group generation"""
         ChoiceRegistry.get_choices("ticket_status")
-
-        cache_key = generate_cache_key("ticket_status")
-        assert cache.get(cache_key) is not None, "Cache should be available before invalidation"
+        generation = ChoiceRegistry.get_generation("ticket_status")
 
         ChoiceRegistry.invalidate_cache("ticket_status")
-        assert cache.get(cache_key) is None, "Cache should be cleared after invalidation"
+        assert ChoiceRegistry.get_generation("ticket_status") != generation
+
+        with patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter:
+            ChoiceRegistry.get_choices("ticket_status")
+            assert mock_filter.call_count == 1, "Choices should be reloaded after invalidation"
 
     def test_invalidate_cache_with_filters(self, register_status):
         DynamicChoice.objects.create(
@@ -206,12 +481,113 @@ class TestChoiceRegistry(BaseTestCase):
         )
 
         ChoiceRegistry.get_choices("ticket_status", is_system_default=True)
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
 
-        cache_key = generate_cache_key("ticket_status", is_system_default=True)
-        assert cache.get(cache_key) is not None, "Cache should be available before invalidation"
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        assert ChoiceRegistry.get_label("ticket_status", "open", is_system_default=True) == "Open", (
+            "Filtered variants should be invalidated along with the group"
+        )
 
+    def test_invalidate_cache_clears_enum_cache(self, register_status):
+        enum1 = ChoiceRegistry.get_enum("ticket_status")
         ChoiceRegistry.invalidate_cache("ticket_status")
-        assert cache.get(cache_key) is not None, "Cache with filters should remain if cache invalidated without filters"
+        enum2 = ChoiceRegistry.get_enum("ticket_status")
+        assert enum1 is not enum2
+
+    def test_invalidate_cache_from_another_process(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+
+        # Another process only shares the cache, so the generation key is the only signal
+        cache.delete(generate_generation_key("ticket_status"))
+        assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+
+    def test_snapshot_pins_groups(self, register_status):
+        with ChoiceRegistry.snapshot():
+            group = ChoiceRegistry.get_group("ticket_status")
+            with patch.object(cache, "get_many", wraps=cache.get_many) as mock_get_many:
+                assert ChoiceRegistry.get_group("ticket_status") is group
+                assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
+
+            assert mock_get_many.call_count == 0, "Pinned groups should not hit the cache"
+
+            # Changes from elsewhere are not visible until the snapshot ends
+            DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+            cache.delete(generate_generation_key("ticket_status"))
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
 
-        ChoiceRegistry.invalidate_cache("ticket_status", is_system_default=True)
-        assert cache.get(cache_key) is None, "Cache with filters should be cleared after invalidation with filters"
+        assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+
+    def test_snapshot_sees_own_invalidations(self, register_status):
+        with ChoiceRegistry.snapshot():
+            enum1 = ChoiceRegistry.get_enum("ticket_status")
+            DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+            ChoiceRegistry.invalidate_cache("ticket_status")
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+            assert ChoiceRegistry.get_enum("ticket_status") is not enum1
+
+    def test_nested_snapshots_share_groups(self, register_status):
+        with ChoiceRegistry.snapshot():
+            group = ChoiceRegistry.get_group("ticket_status")
+            with ChoiceRegistry.snapshot():
+                assert ChoiceRegistry.get_group("ticket_status") is group
+            assert ChoiceRegistry.get_group("ticket_status") is group
+
+
+@pytest.mark.django_db
+class TestAsyncChoiceRegistry(BaseTestCase):
+    def test_aget_choices(self, register_status):
+        choices = async_to_sync(ChoiceRegistry.aget_choices)("ticket_status")
+        assert choices == [(i.value, i.name) for i in Status]
+
+    def test_async_shares_cache_with_sync(self, register_status):
+        async_to_sync(ChoiceRegistry.aget_choices)("ticket_status")
+        with patch.object(DynamicChoice.objects, "filter") as mock_filter:
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
+            assert mock_filter.call_count == 0, "Choices loaded asynchronously should be cached for sync lookups"
+
+    def test_aget_many_choices_single_query_and_round_trip(self, register_status, register_ticket_genre):
+        with (
+            patch.object(ChoiceRegistry, "_local_cache", LocalCache(max_size=0)),
+            patch("dbchoices.registry.cache.aget_many", wraps=cache.aget_many) as mock_get_many,
+            patch.object(DynamicChoice.objects, "filter", wraps=DynamicChoice.objects.filter) as mock_filter,
+        ):
+            choices = async_to_sync(ChoiceRegistry.aget_many_choices)(["ticket_status", "ticket_genre"])
+            assert mock_get_many.call_count == 1, "Cache should be accessed in a single round-trip"
+            assert mock_filter.call_count == 1, "All missing groups should be loaded in a single query"
+
+        assert choices == ChoiceRegistry.get_many_choices(["ticket_status", "ticket_genre"])
+
+    def test_aget_label_and_value(self, register_status):
+        assert async_to_sync(ChoiceRegistry.aget_label)("ticket_status", "open") == "OPEN"
+        assert async_to_sync(ChoiceRegistry.aget_value)("ticket_status", "OPEN") == "open"
+        assert async_to_sync(ChoiceRegistry.aget_label)("ticket_status", "na", default="na") == "na"
+
+    def test_aget_enum(self, register_status):
+        enum = async_to_sync(ChoiceRegistry.aget_enum)("ticket_status")
+        assert enum.OPEN.value == "open"
+        assert ChoiceRegistry.get_enum("ticket_status") is enum
+
+    def test_aget_generation(self, register_status):
+        assert async_to_sync(ChoiceRegistry.aget_generation)("ticket_status") == ChoiceRegistry.get_generation(
+            "ticket_status"
+        )
+
+    def test_ainvalidate_cache(self, register_status):
+        ChoiceRegistry.get_choices("ticket_status")
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+
+        async_to_sync(ChoiceRegistry.ainvalidate_cache)("ticket_status")
+        assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+
+    def test_ainvalidate_many_within_batch(self, register_status):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        with ChoiceRegistry.batch_invalidation():
+            async_to_sync(ChoiceRegistry.ainvalidate_many)(["ticket_status"])
+            assert ChoiceRegistry.get_generation("ticket_status") == generation, "Invalidation should be deferred"
+
+    def test_async_defaults(self, register_status):
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").delete()
+        diffs = async_to_sync(ChoiceRegistry.async_defaults)(group_names=["ticket_status"])
+        assert [choice.value for choice in diffs["ticket_status"].created] == ["open"]
+        assert async_to_sync(ChoiceRegistry.aget_label)("ticket_status", "open") == "OPEN"
@@ -0,0 +1,83 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.test import override_settings
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.signals import warm_choice_cache
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.mark.django_db
+class TestInvalidateChoiceCacheSignal(BaseTestCase):
+    def test_save_invalidates_group(self, register_status):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        DynamicChoice.objects.create(group_name="ticket_status", name="CUSTOM", value="custom", label="Custom")
+        assert ChoiceRegistry.get_generation("ticket_status") != generation
+
+    def test_delete_invalidates_group(self, register_status):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        DynamicChoice.objects.filter(group_name="ticket_status").first().delete()
+        assert ChoiceRegistry.get_generation("ticket_status") != generation
+
+    def test_batch_invalidation_coalesces_groups(
+        self, register_status, register_ticket_genre, django_capture_on_commit_callbacks
+    ):
+        with (
+            patch("dbchoices.registry.cache.delete_many", wraps=cache.delete_many) as mock_delete_many,
+            django_capture_on_commit_callbacks(execute=True),
+            ChoiceRegistry.batch_invalidation(),
+        ):
+            for i in range(5):
+                DynamicChoice.objects.create(group_name="ticket_status", name=f"S{i}", value=f"s{i}", label="S")
+                DynamicChoice.objects.create(group_name="ticket_genre", name=f"G{i}", value=f"g{i}", label="G")
+            assert mock_delete_many.call_count == 0, "Invalidation should be deferred until the block exits"
+
+        assert mock_delete_many.call_count == 1
+        assert set(mock_delete_many.call_args.args[0]) == {
+            "dbchoice:ticket_status:generation",
+            "dbchoice:ticket_genre:generation",
+        }
+
+    def test_batch_invalidation_nested(self, register_status, django_capture_on_commit_callbacks):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        with django_capture_on_commit_callbacks(execute=True), ChoiceRegistry.batch_invalidation():
+            with ChoiceRegistry.batch_invalidation():
+                ChoiceRegistry.invalidate_cache("ticket_status")
+            assert ChoiceRegistry.get_generation("ticket_status") == generation
+
+        assert ChoiceRegistry.get_generation("ticket_status") != generation
+
+    @override_settings(DBCHOICES_INVALIDATE_ON_COMMIT=True)
+    def test_invalidate_on_commit(self, register_status, django_capture_on_commit_callbacks):
+        generation = ChoiceRegistry.get_generation("ticket_status")
+        with (
+            patch("dbchoices.registry.cache.delete_many", wraps=cache.delete_many) as mock_delete_many,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            for i in range(5):
+                DynamicChoice.objects.create(group_name="ticket_status", name=f"S{i}", value=f"s{i}", label="S")
+            assert ChoiceRegistry.get_generation("ticket_status") == generation, "Should wait for the commit"
+
+        assert mock_delete_many.call_count == 1, "Invalidations should be coalesced into a single call"
+        assert ChoiceRegistry.get_generation("ticket_status") != generation
+
+
+class TestWarmChoiceCacheSignal:
+    def test_warms_cache_once(self):
+        request_started.connect(warm_choice_cache, dispatch_uid="dbchoices_warm_cache")
+        with patch.object(ChoiceRegistry, "warm_cache") as mock_warm_cache:
+            warm_choice_cache(sender=None)
+
+        assert mock_warm_cache.call_count == 1
+        assert not request_started.disconnect(dispatch_uid="dbchoices_warm_cache"), "Handler should disconnect itself"
+
+    def test_errors_are_not_raised(self):
+        request_started.connect(warm_choice_cache, dispatch_uid="dbchoices_warm_cache")
+        with patch.object(ChoiceRegistry, "warm_cache", side_effect=RuntimeError):
+            warm_choice_cache(sender=None)
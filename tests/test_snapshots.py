@@ -0,0 +1,110 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.db import DatabaseError
+
+from dbchoices.groups import ChoiceGroup
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.snapshots import read_snapshot, write_snapshot
+from dbchoices.utils import generate_generation_key, get_choice_model
+from tests.base import BaseTestCase
+
+DynamicChoice = get_choice_model()
+
+
+@pytest.fixture
+def snapshot_groups():
+    with patch.object(ChoiceRegistry, "_snapshot_groups", {}):
+        yield
+
+
+class TestSnapshotFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "choices.json"
+        write_snapshot(path, {"status": ChoiceGroup([("open", "Open"), ("closed", "Closed")], generation=42)})
+
+        groups = read_snapshot(path)
+        assert groups["status"].choices == (("open", "Open"), ("closed", "Closed"))
+        assert groups["status"].generation == 42
+        assert [file.name for file in tmp_path.iterdir()] == ["choices.json"], "Temporary files should be removed"
+
+    def test_rejects_other_versions(self, tmp_path):
+        path = tmp_path / "choices.json"
+        path.write_text(json.dumps({"format": "dbchoices-snapshot", "version": 0, "groups": {}}))
+        with pytest.raises(ValueError, match="is not a version 1 choice snapshot"):
+            read_snapshot(path)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("snapshot_groups")
+class TestRegistrySnapshot(BaseTestCase):
+    def test_export_and_load(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        assert "ticket_status" in ChoiceRegistry.export_snapshot(path)
+        assert "ticket_status" in ChoiceRegistry.load_snapshot(path)
+
+    def test_requires_path(self):
+        with pytest.raises(ValueError, match="No snapshot path given"):
+            ChoiceRegistry.load_snapshot()
+
+    def test_current_snapshot_served_without_payload(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        ChoiceRegistry.export_snapshot(path, ["ticket_status"])
+        ChoiceRegistry.load_snapshot(path)
+        ChoiceRegistry._local_cache.clear()
+
+        with (
+            patch("dbchoices.registry.cache.get_many", wraps=cache.get_many) as mock_get_many,
+            patch.object(DynamicChoice.objects, "filter") as mock_filter,
+        ):
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
+
+        assert mock_get_many.call_args_list[0].args[0] == [generate_generation_key("ticket_status")]
+        assert mock_filter.call_count == 0
+
+    def test_outdated_snapshot_not_preferred(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        ChoiceRegistry.export_snapshot(path, ["ticket_status"])
+        ChoiceRegistry.load_snapshot(path)
+
+        DynamicChoice.objects.filter(group_name="ticket_status", value="open").update(label="Open")
+        ChoiceRegistry.invalidate_cache("ticket_status")
+        assert ChoiceRegistry.get_label("ticket_status", "open") == "Open"
+
+    def test_fallback_when_cache_unavailable(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        ChoiceRegistry.export_snapshot(path, ["ticket_status"])
+        ChoiceRegistry.load_snapshot(path)
+        ChoiceRegistry.invalidate_cache("ticket_status")
+
+        with patch("dbchoices.registry.cache.get_many", side_effect=ConnectionError):
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
+
+    def test_fallback_when_database_unavailable(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        ChoiceRegistry.export_snapshot(path, ["ticket_status"])
+        ChoiceRegistry.load_snapshot(path)
+        ChoiceRegistry.invalidate_cache("ticket_status")
+
+        with patch.object(DynamicChoice, "get_many_choices", side_effect=DatabaseError):
+            assert ChoiceRegistry.get_label("ticket_status", "open") == "OPEN"
+
+    def test_errors_raised_without_snapshot(self, register_status):
+        with (
+            patch("dbchoices.registry.cache.get_many", side_effect=ConnectionError),
+            pytest.raises(ConnectionError),
+        ):
+            ChoiceRegistry.get_choices("ticket_status")
+
+    def test_filtered_groups_not_served_from_snapshot(self, register_status, tmp_path):
+        path = tmp_path / "choices.json"
+        ChoiceRegistry.export_snapshot(path, ["ticket_status"])
+        ChoiceRegistry.load_snapshot(path)
+
+        with (
+            patch("dbchoices.registry.cache.get_many", side_effect=ConnectionError),
+            pytest.raises(ConnectionError),
+        ):
+            ChoiceRegistry.get_choices("ticket_status", is_system_default=True)
@@ -0,0 +1,82 @@
+from dbchoices.sync import ChoiceDiff, compute_diff
+from dbchoices.utils import get_choice_model
+
+DynamicChoice = get_choice_model()
+
+
+def make_choice(pk, name, value, label=None, ordering=0, is_system_default=True):
+    return DynamicChoice(
+        pk=pk,
+        group_name="status",
+        name=name,
+        value=value,
+        label=label or name,
+        ordering=ordering,
+        is_system_default=is_system_default,
+    )
+
+
+class TestComputeDiff:
+    def test_creates_missing_choices(self):
+        diff = compute_diff("status", [("OPEN", "open", "Open")], [], DynamicChoice)
+        assert [(choice.name, choice.value, choice.label) for choice in diff.created] == [("OPEN", "open", "Open")]
+        assert diff.counts() == {"created": 1, "updated": 0, "deleted": 0}
+
+    def test_unchanged_choices(self):
+        existing = [make_choice(1, "OPEN", "open", "Open", ordering=0)]
+        diff = compute_diff("status", [("OPEN", "open", "Open")], existing, DynamicChoice)
+        assert not diff.has_changes
+
+    def test_updates_changed_choices(self):
+        existing = [make_choice(1, "OPEN", "open", "Open", ordering=1), make_choice(2, "CLOSED", "closed", ordering=0)]
+        defaults = [("OPEN", "open", "Opened"), ("CLOSED", "closed", "CLOSED")]
+        diff = compute_diff("status", defaults, existing, DynamicChoice)
+        assert [(choice.pk, choice.label, choice.ordering) for choice in diff.updated] == [
+            (1, "Opened", 0),
+            (2, "CLOSED", 1),
+        ]
+
+    def test_adopts_user_choice_with_default_value(self):
+        existing = [make_choice(1, "OPEN", "open", is_system_default=False)]
+        diff = compute_diff("status", [("OPEN", "open", "OPEN")], existing, DynamicChoice)
+        assert diff.updated == existing
+        assert existing[0].is_system_default
+
+    def test_deletes_abandoned_defaults(self):
+        existing = [make_choice(1, "OLD", "old"), make_choice(2, "CUSTOM", "custom", is_system_default=False)]
+        diff = compute_diff("status", [], existing, DynamicChoice, recreate_defaults=True)
+        assert [choice.pk for choice in diff.deleted] == [1]
+
+        diff = compute_diff("status", [], existing, DynamicChoice, recreate_defaults=False)
+        assert diff.deleted == []
+
+        diff = compute_diff("status", [], existing, DynamicChoice, recreate_all=True)
+        assert [choice.pk for choice in diff.deleted] == [1, 2]
+
+    def test_skips_names_held_by_kept_choices(self):
+        existing = [make_choice(1, "OPEN", "legacy_open", is_system_default=False)]
+        diff = compute_diff("status", [("OPEN", "open", "Open")], existing, DynamicChoice, recreate_defaults=True)
+        assert diff.created == []
+        assert diff.deleted == []
+
+    def test_skips_names_kept_by_matched_choices(self, caplog):
+        existing = [make_choice(1, "A", "a"), make_choice(2, "Y", "u", is_system_default=False)]
+        with caplog.at_level("WARNING"):
+            diff = compute_diff("status", [("Y", "a", "Y"), ("A", "c", "A")], existing, DynamicChoice)
+        # "Y" is held by a kept user choice, so the matched choice keeps "A", which "c" cannot claim
+        assert [(choice.pk, choice.name) for choice in diff.updated] == [(1, "A")]
+        assert diff.created == []
+        assert any("'A' in group 'status' conflicts" in record.message for record in caplog.records)
+
+    def test_marks_choices_renamed_to_taken_names(self):
+        existing = [
+            make_choice(1, "X", "x"),
+            make_choice(2, "Y", "y", ordering=1),
+            make_choice(3, "Z", "z", ordering=2),
+        ]
+        diff = compute_diff("status", [("Y", "x", "X"), ("X", "y", "Y"), ("W", "z", "Z")], existing, DynamicChoice)
+        # Renaming Z to W collides with no other choice
+        assert [choice.pk for choice in diff.renamed] == [1, 2]
+
+    def test_empty_diff(self):
+        assert not ChoiceDiff("status").has_changes
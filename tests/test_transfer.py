@@ -0,0 +1,112 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from dbchoices.registry import ChoiceRegistry
+from dbchoices.transfer import TRANSFER_FIELDS, chunked, infer_format, read_choices, write_choices
+from dbchoices.utils import get_choice_model
+from tests.base import BaseTestCase
+from tests.models import Tenant, TenantChoice
+
+DynamicChoice = get_choice_model()
+
+ROWS = [("status", "OPEN", "open", "Open", 0, True, False), ("status", "DONE", "done", "Done, at last", 1, False, True)]
+
+
+class TestTransferFile:
+    @pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+    def test_round_trip(self, file_format):
+        file = StringIO()
+        assert write_choices(file, TRANSFER_FIELDS, iter(ROWS), file_format=file_format) == 2
+
+        file.seek(0)
+        rows = list(read_choices(file, file_format=file_format))
+        assert [tuple(row[field] for field in TRANSFER_FIELDS) for row in rows] == ROWS
+
+    def test_csv_header_can_be_skipped(self):
+        file = StringIO()
+        write_choices(file, TRANSFER_FIELDS, ROWS[:1], file_format="csv")
+        write_choices(file, TRANSFER_FIELDS, ROWS[1:], file_format="csv", header=False)
+        file.seek(0)
+        assert len(list(read_choices(file, file_format="csv"))) == 2
+
+    def test_read_defaults_optional_fields(self):
+        rows = list(read_choices(StringIO('{"group_name":"status","name":"OPEN","value":"open"}\n\n')))
+        assert rows == [
+            {
+                "group_name": "status",
+                "name": "OPEN",
+                "value": "open",
+                "label": "open",
+                "ordering": 0,
+                "is_system_default": False,
+                "is_hidden": False,
+            }
+        ]
+
+    def test_read_rejects_incomplete_rows(self):
+        with pytest.raises(ValueError, match="Row 1 is missing"):
+            list(read_choices(StringIO('{"group_name":"status","value":"open"}\n')))
+
+    def test_rejects_unknown_formats(self):
+        with pytest.raises(ValueError, match="Unknown transfer format"):
+            write_choices(StringIO(), TRANSFER_FIELDS, ROWS, file_format="xml")
+
+    def test_infer_format(self):
+        assert infer_format("choices.CSV") == "csv"
+        assert infer_format("choices.ndjson") == "ndjson"
+
+    def test_chunked(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.django_db
+class TestImportExport(BaseTestCase):
+    @pytest.fixture
+    def catalog(self):
+        DynamicChoice.objects.bulk_create(
+            DynamicChoice(group_name="region", name=f"R{i}", value=f"r{i}", label=f"Region {i}", ordering=i)
+            for i in range(25)
+        )
+
+    @pytest.mark.parametrize("file_format", ["ndjson", "csv"])
+    def test_round_trip(self, catalog, file_format):
+        file = StringIO()
+        progress = []
+        assert (
+            ChoiceRegistry.export_choices(file, ["region"], file_format, chunk_size=10, progress=progress.append) == 25
+        )
+        assert progress == [10, 20, 25]
+
+        DynamicChoice.objects.filter(value="r3").update(label="Outdated")
+        DynamicChoice.objects.filter(value__in=["r20", "r21"]).delete()
+        file.seek(0)
+        counts = ChoiceRegistry.import_choices(file, file_format, chunk_size=10)
+
+        assert counts == {"created": 2, "updated": 23}
+        assert DynamicChoice.objects.filter(group_name="region").count() == 25
+        assert DynamicChoice.objects.get(value="r3").label == "Region 3"
+
+    def test_import_invalidates_imported_groups(self, catalog):
+        assert len(ChoiceRegistry.get_choices("region")) == 25
+        rows = '{"group_name":"region","name":"NEW","value":"new","label":"New","ordering":99}\n'
+        ChoiceRegistry.import_choices(StringIO(rows))
+        assert ChoiceRegistry.get_choices("region")[-1] == ("new", "New")
+
+    def test_import_is_atomic(self, catalog):
+        rows = '{"group_name":"region","name":"NEW","value":"new"}\n{"group_name":"region","value":"broken"}\n'
+        with pytest.raises(ValueError):
+            ChoiceRegistry.import_choices(StringIO(rows), chunk_size=1)
+        assert not DynamicChoice.objects.filter(value="new").exists()
+
+    def test_import_into_partitions(self):
+        acme = Tenant.objects.create(name="Acme")
+        TenantChoice.objects.create(group_name="status", name="OPEN", value="open", label="Open")
+        rows = f"group_name,name,value,label,tenant_id\nstatus,OPEN,open,To do,{acme.pk}\nstatus,OPEN,open,Opened,\n"
+        with patch("dbchoices.registry.ChoiceModel", TenantChoice):
+            counts = ChoiceRegistry.import_choices(StringIO(rows), "csv")
+
+        assert counts == {"created": 1, "updated": 1}
+        assert TenantChoice.objects.get(tenant__isnull=True).label == "Opened"
+        assert TenantChoice.objects.get(tenant=acme).label == "To do"
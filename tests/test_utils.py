@@ -1,6 +1,7 @@
+import pytest
 from django.test import override_settings
 
-from dbchoices.utils import generate_cache_key, get_choice_model
+from dbchoices.utils import generate_cache_key, generate_generation_key, generate_member_name, get_choice_model
 from tests.base import BaseTestCase
 from tests.models import CustomChoiceModel
 
@@ -49,3 +50,27 @@ class TestGenerateCacheKey(BaseTestCase):
         key1 = generate_cache_key("status", is_active=True)
         key2 = generate_cache_key("status", is_active=False)
         assert key1 != key2
+
+
+class TestGenerateGenerationKey:
+    def test_generate_generation_key(self):
+        assert generate_generation_key("status") == "dbchoice:status:generation"
+
+    def test_generate_generation_key_does_not_collide_with_cache_key(self):
+        assert generate_generation_key("status") != generate_cache_key("status")
+        assert generate_generation_key("status") != generate_cache_key("status", generation=True)
+
+
+class TestGenerateMemberName:
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("open", "OPEN"),
+            ("In Progress", "IN_PROGRESS"),
+            ("in-progress", "IN_PROGRESS"),
+            ("1st", "K_1ST"),
+            ("", "K_"),
+        ],
+    )
+    def test_generate_member_name(self, value, expected):
+        assert generate_member_name(value) == expected
@@ -0,0 +1,8 @@
+from django.urls import include, path
+
+from dbchoices.rest_framework.views import ChoiceSearchView
+
+urlpatterns = [
+    path("dbchoices/", include("dbchoices.urls")),
+    path("api/choices/<slug:group_name>/", ChoiceSearchView.as_view()),
+]